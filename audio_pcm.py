@@ -0,0 +1,165 @@
+"""Vectorized 16-bit PCM helpers shared by the web server and the TTS generator.
+
+Only NumPy is required, which both the server venv and the generator venv
+install.  Samples are handled as little-endian int16 arrays so WAV frame bytes
+round-trip without copies on either byte order.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+
+PCM16_DTYPE = np.dtype("<i2")
+PCM16_FULL_SCALE = 32767.0
+PCM16_CLIP_LEVEL = 32760
+
+
+def pcm16_from_bytes(raw: bytes) -> np.ndarray:
+    """View little-endian 16-bit frame bytes as an int16 array."""
+    usable = len(raw) - (len(raw) % PCM16_DTYPE.itemsize)
+    return np.frombuffer(raw, dtype=PCM16_DTYPE, count=usable // PCM16_DTYPE.itemsize)
+
+
+def pcm16_to_bytes(samples: np.ndarray) -> bytes:
+    return np.asarray(samples).astype(PCM16_DTYPE, copy=False).tobytes()
+
+
+def peak_ratio(samples: np.ndarray) -> float:
+    if samples.size == 0:
+        return 0.0
+    return float(np.abs(samples.astype(np.int32)).max()) / PCM16_FULL_SCALE
+
+
+def rms_ratio(samples: np.ndarray) -> float:
+    if samples.size == 0:
+        return 0.0
+    values = samples.astype(np.float64)
+    return float(np.sqrt(np.dot(values, values) / values.size)) / PCM16_FULL_SCALE
+
+
+def clip_ratio(samples: np.ndarray, level: int = PCM16_CLIP_LEVEL) -> float:
+    if samples.size == 0:
+        return 0.0
+    return float(np.count_nonzero(np.abs(samples.astype(np.int32)) >= level)) / samples.size
+
+
+def apply_gain(samples: np.ndarray, gain_ratio: float) -> np.ndarray:
+    """Scale samples, rounding half to even and saturating at the int16 limits."""
+    scaled = np.rint(samples.astype(np.float64) * float(gain_ratio))
+    return np.clip(scaled, -32768, 32767).astype(PCM16_DTYPE)
+
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+RESAMPLE_ZERO_CROSSINGS = 16
+RESAMPLE_KAISER_BETA = 8.0
+RESAMPLE_CHUNK_FRAMES = 1 << 15
+
+
+def decode_wav(data: bytes) -> tuple[np.ndarray, int] | None:
+    """Decode an uncompressed WAV into float32 frames shaped (frames, channels).
+
+    Handles integer PCM at 8/16/24/32 bits and 32/64-bit IEEE float, including
+    WAVE_FORMAT_EXTENSIBLE headers.  Returns None for anything else so callers
+    can fall back to a real decoder.
+    """
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    fmt: tuple[int, int, int, int] | None = None
+    payload: bytes | None = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        chunk_size = int.from_bytes(data[offset + 4:offset + 8], "little")
+        body = data[offset + 8:offset + 8 + chunk_size]
+        if chunk_id == b"fmt " and len(body) >= 16:
+            format_tag = int.from_bytes(body[0:2], "little")
+            channels = int.from_bytes(body[2:4], "little")
+            sample_rate = int.from_bytes(body[4:8], "little")
+            bits = int.from_bytes(body[14:16], "little")
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                format_tag = int.from_bytes(body[24:26], "little")
+            fmt = (format_tag, channels, sample_rate, bits)
+        elif chunk_id == b"data":
+            payload = body
+            break
+        offset += 8 + chunk_size + (chunk_size & 1)
+    if fmt is None or payload is None:
+        return None
+
+    format_tag, channels, sample_rate, bits = fmt
+    width = bits // 8
+    if channels <= 0 or sample_rate <= 0 or width <= 0 or bits % 8:
+        return None
+    usable = len(payload) - (len(payload) % (width * channels))
+    payload = payload[:usable]
+
+    if format_tag == WAVE_FORMAT_PCM and width == 1:
+        samples = (np.frombuffer(payload, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif format_tag == WAVE_FORMAT_PCM and width == 2:
+        samples = np.frombuffer(payload, dtype="<i2").astype(np.float32) / 32768.0
+    elif format_tag == WAVE_FORMAT_PCM and width == 3:
+        triplets = np.frombuffer(payload, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        packed = triplets[:, 0] | (triplets[:, 1] << 8) | (triplets[:, 2] << 16)
+        samples = (np.where(packed >= 1 << 23, packed - (1 << 24), packed)).astype(np.float32) / float(1 << 23)
+    elif format_tag == WAVE_FORMAT_PCM and width == 4:
+        samples = (np.frombuffer(payload, dtype="<i4").astype(np.float64) / float(1 << 31)).astype(np.float32)
+    elif format_tag == WAVE_FORMAT_IEEE_FLOAT and width in (4, 8):
+        samples = np.frombuffer(payload, dtype="<f4" if width == 4 else "<f8").astype(np.float32)
+    else:
+        return None
+    return samples.reshape(-1, channels), sample_rate
+
+
+def downmix(frames: np.ndarray) -> np.ndarray:
+    if frames.ndim == 1:
+        return frames.astype(np.float32, copy=False)
+    if frames.shape[1] == 1:
+        return frames[:, 0]
+    return frames.mean(axis=1, dtype=np.float32)
+
+
+def _polyphase_filter(up: int, down: int) -> np.ndarray:
+    """Kaiser-windowed sinc low-pass split into ``up`` phases."""
+    factor = max(up, down)
+    half_len = RESAMPLE_ZERO_CROSSINGS * factor
+    taps = np.arange(-half_len, half_len + 1, dtype=np.float64)
+    cutoff = 1.0 / factor
+    kernel = up * cutoff * np.sinc(cutoff * taps) * np.kaiser(taps.size, RESAMPLE_KAISER_BETA)
+    phase_len = -(-kernel.size // up)
+    padded = np.zeros(phase_len * up, dtype=np.float64)
+    padded[:kernel.size] = kernel
+    return padded.reshape(phase_len, up).T.copy()
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """Rational polyphase resampling of a mono float signal."""
+    samples = np.asarray(samples, dtype=np.float32)
+    if source_rate == target_rate or samples.size == 0:
+        return samples
+    divisor = math.gcd(int(source_rate), int(target_rate))
+    up, down = int(target_rate) // divisor, int(source_rate) // divisor
+    phases = _polyphase_filter(up, down)
+    phase_len = phases.shape[1]
+    center = RESAMPLE_ZERO_CROSSINGS * max(up, down)
+    padded = np.concatenate(
+        [np.zeros(phase_len, dtype=np.float64), samples.astype(np.float64), np.zeros(phase_len + 1, dtype=np.float64)]
+    )
+    output_len = -(-samples.size * up // down)
+    taps = np.arange(phase_len)
+    output = np.empty(output_len, dtype=np.float32)
+    for start in range(0, output_len, RESAMPLE_CHUNK_FRAMES):
+        positions = np.arange(start, min(start + RESAMPLE_CHUNK_FRAMES, output_len), dtype=np.int64) * down + center
+        newest = positions // up + phase_len
+        window = padded[newest[:, None] - taps[None, :]]
+        output[start:start + positions.size] = np.einsum("ij,ij->i", window, phases[positions % up])
+    return output
+
+
+def float_to_pcm16(samples: np.ndarray) -> np.ndarray:
+    scaled = np.rint(np.asarray(samples, dtype=np.float64) * 32768.0)
+    return np.clip(scaled, -32768, 32767).astype(PCM16_DTYPE)
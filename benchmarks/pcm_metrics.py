@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Compare the vectorized PCM helpers with the old pure-Python loops.
+
+Run from the repository root:
+
+    python benchmarks/pcm_metrics.py --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from array import array
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import audio_pcm  # noqa: E402
+
+
+SAMPLE_RATE = 16000
+
+
+def scalar_metrics(raw: bytes) -> tuple[float, float, float]:
+    samples = array("h")
+    samples.frombytes(raw)
+    peak = max(abs(value) for value in samples) / 32767.0
+    rms = math.sqrt(sum(value * value for value in samples) / len(samples)) / 32767.0
+    clipped = sum(1 for value in samples if abs(value) >= 32760) / len(samples)
+    return peak, rms, clipped
+
+
+def scalar_gain(raw: bytes, gain_ratio: float) -> bytes:
+    samples = array("h")
+    samples.frombytes(raw)
+    return array("h", (max(-32768, min(32767, int(round(sample * gain_ratio)))) for sample in samples)).tobytes()
+
+
+def vector_metrics(raw: bytes) -> tuple[float, float, float]:
+    samples = audio_pcm.pcm16_from_bytes(raw)
+    return audio_pcm.peak_ratio(samples), audio_pcm.rms_ratio(samples), audio_pcm.clip_ratio(samples)
+
+
+def vector_gain(raw: bytes, gain_ratio: float) -> bytes:
+    return audio_pcm.pcm16_to_bytes(audio_pcm.apply_gain(audio_pcm.pcm16_from_bytes(raw), gain_ratio))
+
+
+def best_of(repeat: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1.0, 2.0, 5.0])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'clip':>6}  {'metrics py':>11}  {'metrics np':>11}  {'speedup':>8}  {'gain py':>9}  {'gain np':>9}  {'speedup':>8}")
+    for seconds in args.seconds:
+        raw = rng.integers(-4000, 4000, size=int(SAMPLE_RATE * seconds)).astype("<i2").tobytes()
+        metrics_py = best_of(args.repeat, scalar_metrics, raw)
+        metrics_np = best_of(args.repeat, vector_metrics, raw)
+        gain_py = best_of(args.repeat, scalar_gain, raw, 6.5)
+        gain_np = best_of(args.repeat, vector_gain, raw, 6.5)
+        print(
+            f"{seconds:>5.1f}s  {metrics_py * 1000:>9.2f}ms  {metrics_np * 1000:>9.3f}ms  {metrics_py / metrics_np:>7.0f}x"
+            f"  {gain_py * 1000:>7.2f}ms  {gain_np * 1000:>7.3f}ms  {gain_py / gain_np:>7.0f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Compare wake-phrase scoring throughput per transcript with the shared batch matcher.
+
+"per-call" is the old shape: every transcript normalizes the phrase again
+and builds a fresh SequenceMatcher per word window, as reference QA and the
+server did before ``phrase_match``.  "batch" compiles the phrase once and
+scores the whole list with ``CompiledPhrase.score_batch``.
+
+The transcripts mimic a reference QA run: mostly the phrase or a near miss,
+with a share of unrelated or collapsed decodes, and heavy repetition.
+
+Run from the repository root:
+
+    python benchmarks/phrase_similarity.py --transcripts 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import phrase_match  # noqa: E402
+
+
+TRANSCRIPTS = (
+    "Hey, Tater.",
+    "Hey tater!",
+    "Hey, gator.",
+    "Hey, haters.",
+    "Hay tater.",
+    "Hey Tayter.",
+    "Tater.",
+    "Hater.",
+    "Hey hey Tate",
+    "Thanks for watching!",
+    "Ehhhhh...",
+    "Hey, Tater, turn on the lights.",
+    "What is the weather like today?",
+    "",
+)
+
+
+def legacy_scores(transcript: str, expected_phrase: str) -> tuple[float, bool]:
+    normalize = phrase_match.normalize_text
+    transcript_words = normalize(transcript).split()
+    phrase_words = normalize(expected_phrase).split()
+    if not transcript_words or not phrase_words:
+        return 0.0, False
+    phrase_token = "".join(phrase_words)
+    similarity = 0.0
+    minimum_words = max(1, len(phrase_words) - 1)
+    maximum_words = min(len(transcript_words), len(phrase_words) + 1)
+    for word_count in range(minimum_words, maximum_words + 1):
+        for start in range(0, len(transcript_words) - word_count + 1):
+            candidate = "".join(transcript_words[start : start + word_count])
+            similarity = max(similarity, SequenceMatcher(None, candidate, phrase_token).ratio())
+    transcript_token = "".join(transcript_words)
+    matches = (
+        len(transcript_words) <= len(phrase_words) + 1
+        and not any(transcript_words.count(word) > phrase_words.count(word) for word in set(phrase_words))
+        and (
+            transcript_token.count(phrase_token) == 1
+            or (len(transcript_words) >= len(phrase_words) and similarity >= phrase_match.MIN_PHRASE_SIMILARITY)
+        )
+    )
+    return similarity, matches
+
+
+def make_transcripts(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    transcripts = []
+    for _ in range(count):
+        text = rng.choice(TRANSCRIPTS)
+        if rng.random() < 0.2:
+            # Unique noise so not every window is a repeat.
+            text = f"{text} {rng.choice(('um', 'uh', 'so'))}{rng.randrange(1000)}"
+        transcripts.append(text)
+    return transcripts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--phrase", default="hey tater")
+    parser.add_argument("--transcripts", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    transcripts = make_transcripts(args.transcripts, args.seed)
+    print(f"{len(transcripts)} transcripts against {args.phrase!r}")
+
+    started = time.perf_counter()
+    legacy = [legacy_scores(text, args.phrase) for text in transcripts]
+    per_call = time.perf_counter() - started
+
+    phrase_match._compile_phrase_cached.cache_clear()
+    started = time.perf_counter()
+    batch = phrase_match.compile_phrase(args.phrase).score_batch(transcripts)
+    batched = time.perf_counter() - started
+
+    for label, seconds in (("per-call", per_call), ("batch", batched)):
+        print(f"{label:>8}: {seconds * 1000:8.1f} ms  {len(transcripts) / seconds:10.0f} transcripts/s")
+    print(f"batch matcher: {per_call / batched:.1f}x faster")
+    decisions = sum(old[1] != new.matches for old, new in zip(legacy, batch))
+    scores = sum(abs(new.similarity - old[0]) > 1e-9 for old, new in zip(legacy, batch))
+    print(f"{decisions} accept/reject decision(s) and {scores} similarity score(s) differ from per-call scoring")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
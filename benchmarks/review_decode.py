@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Compare auto-review wall time per capture with per-stage decoding and one shared buffer.
+
+Each clip goes through the real ``_auto_review_captures`` path, one capture
+per call the way a lone upload is reviewed: transcript cache hash, VAD gate,
+STT and the close-match check.  "shared" is that path as it is.  "disk"
+withholds the shared float32 buffer, so every stage reads and decodes the
+file on its own (faster-whisper through PyAV), as reviews did before the
+buffer was shared.  The transcript cache is cleared before each mode so
+every clip is transcribed.
+
+This needs the STT models (and Silero VAD when the gate is on), so run it
+where the trainer image's dependencies are installed, from the repository
+root (models download on first use):
+
+    python benchmarks/review_decode.py --engine faster_whisper --clips 32
+    python benchmarks/review_decode.py --engine parakeet_onnx --clips-dir /data/captured_audio
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def make_wav(seconds: float, seed: int) -> bytes:
+    rng = np.random.default_rng(seed)
+    rate = 16000
+    timeline = np.arange(int(seconds * rate)) / rate
+    pitch = 110 + 40 * rng.random()
+    voiced = 0.2 * np.sin(2 * np.pi * pitch * timeline) * (0.5 + 0.5 * np.sin(2 * np.pi * 3 * timeline))
+    voiced += 0.01 * rng.standard_normal(timeline.size)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.rint(np.clip(voiced, -1, 1) * 32767).astype("<i2").tobytes())
+    return buf.getvalue()
+
+
+def clip_sources(args: argparse.Namespace) -> list[bytes]:
+    if args.clips_dir:
+        paths = sorted(Path(args.clips_dir).glob("*.wav"))[: args.clips]
+        if not paths:
+            raise SystemExit(f"No WAV clips found in {args.clips_dir}")
+        return [path.read_bytes() for path in paths]
+    return [make_wav(args.seconds, index) for index in range(args.clips)]
+
+
+def reset_inbox(trainer, clips: list[bytes], wake_word: str) -> list[str]:
+    """Put fresh pending captures in the inbox and forget cached transcripts."""
+    for directory in (trainer.CAPTURED_DIR, trainer.NEGATIVE_DIR, trainer.PERSONAL_DIR):
+        shutil.rmtree(directory, ignore_errors=True)
+        directory.mkdir(parents=True)
+    with trainer.AUDIO_INDEX_LOCK:
+        connection = trainer._audio_index_connection()
+        connection.execute("DELETE FROM transcript_cache")
+        connection.commit()
+    names = []
+    for index, wav_bytes in enumerate(clips):
+        name = f"clip_{index:03d}.wav"
+        audio_path = trainer.CAPTURED_DIR / name
+        audio_path.write_bytes(wav_bytes)
+        trainer._write_sidecar_json(
+            audio_path,
+            {
+                "original_name": name,
+                "wake_word": wake_word,
+                "event_type": "wake_detected",
+                "review_status": "pending",
+            },
+        )
+        names.append(name)
+    return names
+
+
+def per_stage_decoding(trainer):
+    """Withhold the shared buffer so each stage decodes the file itself."""
+    decode = trainer._wav_bytes_float32
+
+    def unshared(_wav_bytes):
+        raise RuntimeError("shared buffer disabled")
+
+    return patch.multiple(
+        trainer,
+        _wav_bytes_float32=unshared,
+        _normalized_wav_float32=lambda audio_path: decode(audio_path.read_bytes()),
+    )
+
+
+def run(trainer, names: list[str]) -> list[float]:
+    timings = []
+    for name in names:
+        started = time.perf_counter()
+        trainer._auto_review_captures([name])
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engine", choices=("faster_whisper", "parakeet_onnx"), default="faster_whisper")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--wake-phrase", default="hey tater")
+    parser.add_argument("--clips", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=1.5)
+    parser.add_argument("--clips-dir", default="")
+    parser.add_argument("--device", choices=("cpu", "cuda"), default="cpu")
+    parser.add_argument("--no-vad", action="store_true", help="Skip the Silero VAD gate.")
+    parser.add_argument(
+        "--model-dir",
+        default=os.environ.get("AUTO_TRAIN_MODEL_DIR", str(Path.home() / ".cache" / "mww_stt_bench")),
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="mww_review_decode_") as tmpdir:
+        os.environ["DATA_DIR"] = tmpdir
+        os.environ["AUTO_TRAIN_MODEL_DIR"] = args.model_dir
+        import trainer_server as trainer
+
+        if args.device == "cpu":
+            trainer._resolve_faster_whisper_runtime = lambda *_args: ("cpu", "int8")
+            trainer._parakeet_onnx_providers = lambda: ["CPUExecutionProvider"]
+        trainer.AUTO_TRAIN_CONFIG.update(
+            trainer._normalize_auto_train_config(
+                {
+                    "enabled": True,
+                    "wake_phrase": args.wake_phrase,
+                    "language": args.language,
+                    "stt_engine": args.engine,
+                    "vad_gate_enabled": not args.no_vad,
+                }
+            )
+        )
+        clips = clip_sources(args)
+        wake_word = args.wake_phrase.replace(" ", "_")
+        engine = trainer._normalize_stt_engine(args.engine)
+        vad = "without" if args.no_vad else "with"
+        print(f"{len(clips)} clips, {engine} on {args.device}, {vad} the VAD gate, one capture per review")
+        # Load the models before timing either mode; this raises if STT cannot run.
+        warmup = reset_inbox(trainer, clips[:1], wake_word)
+        trainer._transcribe_capture(trainer.CAPTURED_DIR / warmup[0], engine=engine, language=args.language)
+        run(trainer, warmup)
+
+        results = {}
+        for label in ("disk", "shared"):
+            names = reset_inbox(trainer, clips, wake_word)
+            if label == "disk":
+                with per_stage_decoding(trainer):
+                    timings = run(trainer, names)
+            else:
+                timings = run(trainer, names)
+            results[label] = statistics.median(timings)
+            print(f"{label:>6}: median {results[label]:8.3f} ms/clip  p95 {np.percentile(timings, 95):8.3f} ms")
+        print(f"shared buffer: {results['disk'] / results['shared']:.2f}x faster per clip")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Compare auto-review STT throughput for single-clip and batched transcription.
+
+Batch size 1 is the per-clip path the review worker used before batching;
+larger sizes go through ``_transcribe_captures`` the way the worker drains
+its queue.  Runs on CPU unless ``--device cuda`` is given.  Batched
+faster-whisper clips that transcribe() would re-decode at a higher temperature
+are re-run on their own, so noisy real clips (``--clips-dir``) show that cost
+where the synthetic tones may not.
+
+Run from the repository root (models download on first use):
+
+    python benchmarks/stt_batch.py --engine faster_whisper --clips 64
+    python benchmarks/stt_batch.py --engine parakeet_onnx --clips-dir /data/captured_audio
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def make_wav(seconds: float, seed: int) -> bytes:
+    rng = np.random.default_rng(seed)
+    rate = 16000
+    timeline = np.arange(int(seconds * rate)) / rate
+    pitch = 110 + 40 * rng.random()
+    voiced = 0.2 * np.sin(2 * np.pi * pitch * timeline) * (0.5 + 0.5 * np.sin(2 * np.pi * 3 * timeline))
+    voiced += 0.01 * rng.standard_normal(timeline.size)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.rint(np.clip(voiced, -1, 1) * 32767).astype("<i2").tobytes())
+    return buf.getvalue()
+
+
+def clip_paths(args: argparse.Namespace, workdir: Path) -> list[Path]:
+    if args.clips_dir:
+        paths = sorted(Path(args.clips_dir).glob("*.wav"))[: args.clips]
+        if not paths:
+            raise SystemExit(f"No WAV clips found in {args.clips_dir}")
+        return paths
+    paths = []
+    for index in range(args.clips):
+        path = workdir / f"clip_{index:03d}.wav"
+        path.write_bytes(make_wav(args.seconds, index))
+        paths.append(path)
+    return paths
+
+
+def run(trainer, engine: str, language: str, paths: list[Path], batch_size: int) -> float:
+    started = time.perf_counter()
+    for start in range(0, len(paths), batch_size):
+        batch = paths[start : start + batch_size]
+        if batch_size == 1:
+            trainer._transcribe_capture(batch[0], engine=engine, language=language)
+        else:
+            trainer._transcribe_captures(batch, engine=engine, language=language)
+    return len(paths) / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engine", choices=("faster_whisper", "parakeet_onnx"), default="faster_whisper")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--device", choices=("cpu", "cuda"), default="cpu")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--clips", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--clips-dir", default="")
+    parser.add_argument(
+        "--model-dir",
+        default=os.environ.get("AUTO_TRAIN_MODEL_DIR", str(Path.home() / ".cache" / "mww_stt_bench")),
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="mww_stt_bench_") as tmpdir:
+        os.environ["DATA_DIR"] = tmpdir
+        os.environ["AUTO_TRAIN_MODEL_DIR"] = args.model_dir
+        import trainer_server as trainer
+
+        if args.device == "cpu":
+            trainer._resolve_faster_whisper_runtime = lambda *_args: ("cpu", "int8")
+            trainer._parakeet_onnx_providers = lambda: ["CPUExecutionProvider"]
+
+        paths = clip_paths(args, Path(tmpdir))
+        engine = trainer._normalize_stt_engine(args.engine)
+        model = trainer._managed_stt_model(engine, args.language)
+        print(f"engine: {engine} ({model}) on {args.device}; {len(paths)} clips")
+        trainer._transcribe_capture(paths[0], engine=engine, language=args.language)
+
+        baseline = 0.0
+        for batch_size in args.batch_sizes:
+            rate = run(trainer, engine, args.language, paths, batch_size)
+            baseline = baseline or rate
+            print(f"batch {batch_size:>3}: {rate:>7.2f} clips/s  ({rate / baseline:>4.1f}x batch {args.batch_sizes[0]})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
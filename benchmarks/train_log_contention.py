@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Measure STATE_LOCK contention while training output is being logged.
+
+A producer thread logs subprocess-style lines as fast as it can while reader
+threads take STATE_LOCK the way API handlers do.  ``legacy`` reproduces the
+old path (list under STATE_LOCK plus a flush per line); ``ring`` uses the
+training log writer and its ring buffer.
+
+Run from the repository root:
+
+    python benchmarks/train_log_contention.py --lines 200000 --readers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def legacy_producer(trainer, log_path: Path, lines: int) -> None:
+    buf: list[str] = []
+    with open(log_path, "a", encoding="utf-8") as lf:
+        for index in range(lines):
+            line = f"epoch 1 step {index} loss 0.{index % 997:03d}\n"
+            lf.write(line)
+            lf.flush()
+            with trainer.STATE_LOCK:
+                buf.append(line.rstrip("\n"))
+                if len(buf) > 250:
+                    del buf[: (len(buf) - 250)]
+
+
+def ring_producer(trainer, log_path: Path, lines: int) -> None:
+    with trainer._open_train_log_writer(log_path) as write_log:
+        for index in range(lines):
+            write_log(f"epoch 1 step {index} loss 0.{index % 997:03d}\n")
+
+
+def reader(trainer, stop: threading.Event, waits: list[float], contended: list[int]) -> None:
+    lock = trainer.STATE_LOCK
+    while not stop.is_set():
+        started = time.perf_counter()
+        if not lock.acquire(blocking=False):
+            contended[0] += 1
+            lock.acquire()
+        try:
+            waits.append(time.perf_counter() - started)
+            dict(trainer.STATE["training"])
+        finally:
+            lock.release()
+        time.sleep(0.0005)
+
+
+def run(trainer, mode: str, args: argparse.Namespace, tmpdir: Path) -> None:
+    producer = legacy_producer if mode == "legacy" else ring_producer
+    log_path = tmpdir / f"{mode}.log"
+    waits: list[list[float]] = [[] for _ in range(args.readers)]
+    contended = [[0] for _ in range(args.readers)]
+    stop = threading.Event()
+    readers = [
+        threading.Thread(target=reader, args=(trainer, stop, bucket, counter))
+        for bucket, counter in zip(waits, contended)
+    ]
+    for thread in readers:
+        thread.start()
+    started = time.perf_counter()
+    producer(trainer, log_path, args.lines)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    samples = np.array([wait for bucket in waits for wait in bucket]) * 1e6
+    blocked = sum(counter[0] for counter in contended)
+    print(
+        f"{mode:>6}: {args.lines / elapsed:>9.0f} lines/s  "
+        f"producer STATE_LOCK takes {args.lines if mode == 'legacy' else 0:>7}  "
+        f"handler STATE_LOCK contended {blocked}/{samples.size} ({100 * blocked / max(1, samples.size):.1f}%)  "
+        f"wait p99 {np.percentile(samples, 99):7.1f}us  max {samples.max():8.1f}us"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=200000)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="mww_log_bench_") as tmpdir:
+        os.environ["DATA_DIR"] = tmpdir
+        import trainer_server as trainer
+
+        for mode in ("legacy", "ring"):
+            run(trainer, mode, args, Path(tmpdir))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
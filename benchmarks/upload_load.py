@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Simulate several satellites uploading captures while the UI polls training status.
+
+Run from the repository root:
+
+    python benchmarks/upload_load.py --satellites 10 --clips 10
+    python benchmarks/upload_load.py --satellites 10 --clips 10 --inline
+
+``--inline`` runs upload work directly on the event loop, which is how the
+handlers behaved before they used the upload executor.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def make_wav(seconds: float, rate: int = 48000, channels: int = 2) -> bytes:
+    timeline = np.arange(int(seconds * rate)) / rate
+    tone = np.rint(3000 * np.sin(2 * np.pi * 440 * timeline)).astype("<i2")
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.repeat(tone[:, None], channels, axis=1).tobytes())
+    return buf.getvalue()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    return float(np.percentile(values, pct)) * 1000 if values else 0.0
+
+
+async def satellite(client, index: int, clips: int, payload: bytes, latencies: list[float]) -> None:
+    headers = {
+        "x-audio-format": "wav",
+        "x-source-device": f"satellite-{index:02d}",
+        "x-event-type": "wake_detected",
+        "x-max-probability": "0.93",
+    }
+    for _ in range(clips):
+        started = time.perf_counter()
+        response = await client.post("/api/upload_captured_audio_raw", content=payload, headers=headers)
+        latencies.append(time.perf_counter() - started)
+        response.raise_for_status()
+
+
+async def poller(client, stop: asyncio.Event, latencies: list[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/api/train_status")
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.02)
+
+
+async def run(args: argparse.Namespace) -> None:
+    import httpx
+
+    import trainer_server as trainer
+
+    if args.inline:
+        async def run_inline(func, *func_args, **kwargs):
+            return func(*func_args, **kwargs)
+
+        trainer._run_upload_work = run_inline
+
+    payload = make_wav(args.seconds)
+    upload_latencies: list[float] = []
+    poll_latencies: list[float] = []
+    stop = asyncio.Event()
+    transport = httpx.ASGITransport(app=trainer.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://trainer") as client:
+        started = time.perf_counter()
+        poll_task = asyncio.create_task(poller(client, stop, poll_latencies))
+        await asyncio.gather(
+            *(satellite(client, index, args.clips, payload, upload_latencies) for index in range(args.satellites))
+        )
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await poll_task
+
+    mode = "inline" if args.inline else f"executor ({trainer.UPLOAD_MAX_WORKERS} workers)"
+    print(f"mode: {mode}; {args.satellites} satellites x {args.clips} clips of {args.seconds:.1f}s 48 kHz stereo")
+    print(f"uploads: {len(upload_latencies)} in {elapsed:.2f}s")
+    print(f"upload latency      p50 {percentile(upload_latencies, 50):8.1f}ms  p99 {percentile(upload_latencies, 99):8.1f}ms")
+    print(
+        f"train_status latency p50 {percentile(poll_latencies, 50):8.1f}ms  p99 {percentile(poll_latencies, 99):8.1f}ms"
+        f"  ({len(poll_latencies)} polls)"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--satellites", type=int, default=10)
+    parser.add_argument("--clips", type=int, default=10)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--inline", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="mww_upload_load_") as data_dir:
+        os.environ["DATA_DIR"] = data_dir
+        asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Time WAV upload normalization in process against an ffmpeg spawn.
+
+Run from the repository root:
+
+    python benchmarks/wav_resample.py --rate 48000 --channels 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import audio_pcm  # noqa: E402
+
+
+def make_wav(seconds: float, rate: int, channels: int) -> bytes:
+    timeline = np.arange(int(seconds * rate)) / rate
+    tone = 0.3 * np.sin(2 * np.pi * 440 * timeline)
+    frames = np.repeat(tone[:, None], channels, axis=1)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(audio_pcm.float_to_pcm16(frames.reshape(-1)).tobytes())
+    return buf.getvalue()
+
+
+def in_process(data: bytes) -> bytes:
+    frames, rate = audio_pcm.decode_wav(data)
+    mono = audio_pcm.resample(audio_pcm.downmix(frames), rate, 16000)
+    return audio_pcm.pcm16_to_bytes(audio_pcm.float_to_pcm16(mono))
+
+
+def with_ffmpeg(ffmpeg: str, data: bytes) -> bytes:
+    with tempfile.TemporaryDirectory(prefix="mww_bench_") as tmpdir:
+        src = Path(tmpdir) / "source.wav"
+        dst = Path(tmpdir) / "normalized.wav"
+        src.write_bytes(data)
+        subprocess.run(
+            [ffmpeg, "-y", "-i", str(src), "-vn", "-ac", "1", "-ar", "16000", "-c:a", "pcm_s16le", str(dst)],
+            capture_output=True,
+            check=True,
+        )
+        return dst.read_bytes()
+
+
+def best_of(repeat: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--rate", type=int, default=48000)
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1.0, 3.0, 5.0])
+    args = parser.parse_args()
+
+    ffmpeg = shutil.which("ffmpeg")
+    print(f"source: {args.rate} Hz, {args.channels} channel(s); ffmpeg: {ffmpeg or 'not installed'}")
+    for seconds in args.seconds:
+        data = make_wav(seconds, args.rate, args.channels)
+        native = best_of(args.repeat, in_process, data)
+        line = f"{seconds:>5.1f}s  in-process {native * 1000:>7.2f}ms"
+        if ffmpeg:
+            spawned = best_of(args.repeat, with_ffmpeg, ffmpeg, data)
+            line += f"  ffmpeg {spawned * 1000:>7.2f}ms  speedup {spawned / native:>5.1f}x"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -20,7 +20,6 @@ import signal
 import subprocess
 import sys
 import wave
-from array import array
 from collections import Counter
 from itertools import product
 from pathlib import Path
@@ -30,6 +29,7 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from audio_pcm import clip_ratio, pcm16_from_bytes, peak_ratio, rms_ratio  # noqa: E402
 from tts_config import (  # noqa: E402
     DEFAULT_TTS_MODE,
     ENGINE_MOSS,
@@ -253,16 +253,11 @@ def read_pcm_metrics(path: Path) -> tuple[float, float, float]:
         return (0.0, 0.0, 1.0)
     if rate <= 0 or width != 2 or channels <= 0 or not raw:
         return (0.0, 0.0, 1.0)
-    samples = array("h")
-    samples.frombytes(raw)
-    if sys.byteorder != "little":
-        samples.byteswap()
-    if not samples:
+    samples = pcm16_from_bytes(raw)
+    if not samples.size:
         return (0.0, 0.0, 1.0)
-    peak = max(abs(value) for value in samples) / 32767.0
-    rms = math.sqrt(sum(value * value for value in samples) / len(samples)) / 32767.0
-    clipped = sum(1 for value in samples if abs(value) >= 32760) / len(samples)
-    return (frames / rate, rms, clipped if peak > 0 else 1.0)
+    clipped = clip_ratio(samples)
+    return (frames / rate, rms_ratio(samples), clipped if peak_ratio(samples) > 0 else 1.0)
 
 
 def valid_reference(path: Path) -> bool:
@@ -6,14 +6,18 @@ from __future__ import annotations
 import argparse
 import json
 import re
-import unicodedata
+import sys
 import wave
-from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Any
 
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from phrase_match import compile_phrase, normalize_text  # noqa: E402
+
 
-MIN_PHRASE_SIMILARITY = 0.68
 MIN_SPEECH_RATIO = 0.20
 
 ACOUSTIC_LIMITS = {
@@ -47,49 +51,12 @@ ACOUSTIC_LIMITS = {
 }
 
 
-def normalize_text(value: Any) -> str:
-    text = unicodedata.normalize("NFKC", str(value or "")).casefold().replace("_", " ")
-    text = re.sub(r"[^\w]+", " ", text, flags=re.UNICODE)
-    return re.sub(r"\s+", " ", text).strip()
-
-
 def phrase_similarity(transcript: Any, expected_phrase: Any) -> float:
-    transcript_words = normalize_text(transcript).split()
-    phrase_words = normalize_text(expected_phrase).split()
-    if not transcript_words or not phrase_words:
-        return 0.0
-    phrase_token = "".join(phrase_words)
-    best_score = 0.0
-    minimum_words = max(1, len(phrase_words) - 1)
-    maximum_words = min(len(transcript_words), len(phrase_words) + 1)
-    for word_count in range(minimum_words, maximum_words + 1):
-        for start in range(0, len(transcript_words) - word_count + 1):
-            candidate = "".join(transcript_words[start : start + word_count])
-            best_score = max(best_score, SequenceMatcher(None, candidate, phrase_token).ratio())
-    return best_score
+    return compile_phrase(expected_phrase).score(transcript).similarity
 
 
 def transcript_matches_phrase(transcript: Any, expected_phrase: Any) -> bool:
-    transcript_words = normalize_text(transcript).split()
-    phrase_words = normalize_text(expected_phrase).split()
-    if not transcript_words or not phrase_words:
-        return False
-    transcript_token = "".join(transcript_words)
-    phrase_token = "".join(phrase_words)
-    complete_phrase = transcript_token.count(phrase_token) == 1
-    has_full_word_shape = len(transcript_words) >= len(phrase_words)
-    has_single_utterance_shape = len(transcript_words) <= len(phrase_words) + 1
-    repeats_expected_word = any(
-        transcript_words.count(word) > phrase_words.count(word)
-        for word in set(phrase_words)
-    )
-    return has_single_utterance_shape and not repeats_expected_word and (
-        complete_phrase
-        or (
-            has_full_word_shape
-            and phrase_similarity(transcript, expected_phrase) >= MIN_PHRASE_SIMILARITY
-        )
-    )
+    return compile_phrase(expected_phrase).score(transcript).matches
 
 
 def semantic_rejection_reason(
@@ -291,6 +258,7 @@ def main() -> int:
         )
 
     results = []
+    semantic_rows = []
     for entry in entries:
         path = Path(entry["path"])
         try:
@@ -337,13 +305,10 @@ def main() -> int:
                 " ",
                 " ".join(str(segment.text or "").strip() for segment in segments),
             ).strip()
-            similarity = phrase_similarity(transcript, args.phrase)
-            accepted = transcript_matches_phrase(transcript, args.phrase)
-            reason = (
-                "accepted"
-                if accepted
-                else semantic_rejection_reason(transcript, args.phrase, detected_speech_ratio)
-            )
+            # Scored together with the rest of the batch once STT is done.
+            accepted = False
+            reason = "phrase_mismatch"
+            semantic_rows.append((len(results), detected_speech_ratio))
         else:
             accepted = True if args.profile else detected_speech_ratio >= MIN_SPEECH_RATIO
             reason = "accepted" if accepted else "no_speech_detected"
@@ -361,6 +326,19 @@ def main() -> int:
             }
         )
 
+    phrase = compile_phrase(args.phrase)
+    scores = phrase.score_batch(results[row]["transcript"] for row, _ratio in semantic_rows)
+    for (row, detected_speech_ratio), score in zip(semantic_rows, scores):
+        result = results[row]
+        result["accepted"] = score.matches
+        result["similarity"] = round(score.similarity, 4)
+        result["sounds_alike"] = score.sounds_alike
+        result["reason"] = (
+            "accepted"
+            if score.matches
+            else semantic_rejection_reason(result["transcript"], args.phrase, detected_speech_ratio)
+        )
+
     args.output_jsonl.parent.mkdir(parents=True, exist_ok=True)
     with args.output_jsonl.open("w", encoding="utf-8") as stream:
         for result in results:
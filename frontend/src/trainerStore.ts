@@ -22,6 +22,9 @@ const emptySamples = (): SamplesPayload => ({ personal: [], negative: [], person
 const emptyCaptured = (): CapturedPayload => ({ items: [], captured_count: 0, personal_count: 0, negative_count: 0 });
 const emptyManagedData = (): ManagedDataPayload => ({ items: [], total_size_bytes: 0, total_file_count: 0 });
 
+const pageSize = 50;
+const trainingLogLimit = 400;
+
 const defaultAutoForm = (): AutoTrainForm => ({
   enabled: false,
   wake_phrase: "",
@@ -56,6 +59,9 @@ export const trainer = reactive({
   selectedFiles: [] as File[],
   sampleBucket: "personal" as SampleBucket,
   samplePage: { personal: 0, negative: 0 },
+  sampleCursors: { personal: [""], negative: [""] } as Record<SampleBucket, string[]>,
+  capturedPage: 0,
+  capturedCursors: [""] as string[],
   uploadProgress: 0,
   uploadLabel: "No upload in progress",
   uploadDetail: "Choose files and upload when you are ready.",
@@ -68,6 +74,9 @@ export const trainer = reactive({
 
 let autoTimer = 0;
 let trainingTimer = 0;
+let trainingStream: EventSource | null = null;
+let managedDataTimer = 0;
+const trainingLog = { offset: null as number | null, logId: "" };
 
 export const personalCount = computed(() => Number(trainer.samples.personal_count ?? trainer.session.takes_received ?? 0));
 export const negativeCount = computed(() => Number(trainer.samples.negative_count ?? trainer.captured.negative_count ?? 0));
@@ -89,6 +98,8 @@ export const hasConsole = computed(() => Boolean(
   trainer.training.running || trainer.training.exit_code !== null || trainer.training.log_lines?.length,
 ));
 export const selectedSamples = computed(() => trainer.samples[trainer.sampleBucket] || []);
+export const samplePages = computed(() => pageCount(trainer.samples.matched_counts?.[trainer.sampleBucket] ?? selectedSamples.value.length));
+export const capturedPages = computed(() => pageCount(trainer.captured.matched_count ?? trainer.captured.items.length));
 export const autoLinked = computed(() => Boolean(trainer.auto.trainer_link?.linked));
 export const sttEngines = computed<JsonRecord[]>(() => {
   const rows = trainer.auto.stt_engines;
@@ -97,6 +108,14 @@ export const sttEngines = computed<JsonRecord[]>(() => {
     : [{ id: "faster_whisper", label: "Faster Whisper" }, { id: "parakeet_onnx", label: "Parakeet ONNX" }];
 });
 
+function pageCount(total: unknown): number {
+  return Math.max(1, Math.ceil((Number(total) || 0) / pageSize));
+}
+
+function pageUrl(path: string, params: Record<string, string>): string {
+  return `${path}?${new URLSearchParams({ ...params, limit: String(pageSize) })}`;
+}
+
 function titleCase(value: unknown): string {
   return String(value || "").replaceAll("_", " ").replace(/\b\w/g, (letter) => letter.toUpperCase());
 }
@@ -162,10 +181,7 @@ export async function stopSession(): Promise<void> {
     return;
   }
   setBusy("session", true);
-  if (trainingTimer) {
-    window.clearInterval(trainingTimer);
-    trainingTimer = 0;
-  }
+  stopTrainingUpdates();
   try {
     const payload = await postJson<SessionPayload>("/api/stop_session");
     applySession(payload);
@@ -195,25 +211,59 @@ export function ensureSupportedTtsMode(): void {
   if (trainer.ttsMode === "piper" && !piper) trainer.ttsMode = "modern";
 }
 
+function fetchSamplesPage(bucket: SampleBucket): Promise<SamplesPayload> {
+  const cursor = trainer.sampleCursors[bucket][trainer.samplePage[bucket]] || "";
+  return getJson<SamplesPayload>(pageUrl("/api/samples", { bucket, cursor }));
+}
+
 export async function refreshSamples(quiet = false): Promise<SamplesPayload> {
   if (!quiet) setBusy("samples", true);
   try {
-    const payload = await getJson<SamplesPayload>("/api/samples");
-    trainer.samples = { ...emptySamples(), ...payload };
-    for (const bucket of ["personal", "negative"] as const) {
-      const lastPage = Math.max(0, Math.ceil((trainer.samples[bucket]?.length || 0) / 50) - 1);
-      trainer.samplePage[bucket] = Math.min(trainer.samplePage[bucket], lastPage);
+    const bucket = trainer.sampleBucket;
+    let payload = await fetchSamplesPage(bucket);
+    const lastPage = pageCount(payload.matched_counts?.[bucket]) - 1;
+    if (trainer.samplePage[bucket] > lastPage) {
+      // Deletions emptied the current page; step back to the last page we still hold a cursor for.
+      trainer.samplePage[bucket] = lastPage;
+      trainer.sampleCursors[bucket].length = lastPage + 1;
+      payload = await fetchSamplesPage(bucket);
     }
+    trainer.samples = { ...emptySamples(), ...payload };
     return payload;
   } finally {
     if (!quiet) setBusy("samples", false);
   }
 }
 
+export async function turnSamplePage(step: -1 | 1): Promise<void> {
+  const bucket = trainer.sampleBucket;
+  const page = trainer.samplePage[bucket] + step;
+  const nextCursor = trainer.samples.next_cursors?.[bucket];
+  if (page < 0 || (step > 0 && !nextCursor)) return;
+  if (step > 0 && nextCursor) trainer.sampleCursors[bucket][page] = nextCursor;
+  trainer.samplePage[bucket] = page;
+  try {
+    await refreshSamples();
+  } catch (error) {
+    reportError(error, "Samples could not be loaded.");
+  }
+}
+
+function fetchCapturedPage(): Promise<CapturedPayload> {
+  const cursor = trainer.capturedCursors[trainer.capturedPage] || "";
+  return getJson<CapturedPayload>(pageUrl("/api/captured_audio", { cursor }));
+}
+
 export async function refreshCaptured(quiet = false): Promise<CapturedPayload> {
   if (!quiet) setBusy("captured", true);
   try {
-    const payload = await getJson<CapturedPayload>("/api/captured_audio");
+    let payload = await fetchCapturedPage();
+    const lastPage = pageCount(payload.matched_count) - 1;
+    if (trainer.capturedPage > lastPage) {
+      trainer.capturedPage = lastPage;
+      trainer.capturedCursors.length = lastPage + 1;
+      payload = await fetchCapturedPage();
+    }
     trainer.captured = { ...emptyCaptured(), ...payload };
     return payload;
   } finally {
@@ -221,6 +271,19 @@ export async function refreshCaptured(quiet = false): Promise<CapturedPayload> {
   }
 }
 
+export async function turnCapturedPage(step: -1 | 1): Promise<void> {
+  const page = trainer.capturedPage + step;
+  const nextCursor = trainer.captured.next_cursor;
+  if (page < 0 || (step > 0 && !nextCursor)) return;
+  if (step > 0 && nextCursor) trainer.capturedCursors[page] = nextCursor;
+  trainer.capturedPage = page;
+  try {
+    await refreshCaptured();
+  } catch (error) {
+    reportError(error, "Captured audio could not be loaded.");
+  }
+}
+
 export function selectFiles(event: Event): void {
   const input = event.target as HTMLInputElement;
   trainer.selectedFiles = Array.from(input.files || []);
@@ -418,14 +481,20 @@ export async function refreshWakeWords(quiet = false): Promise<void> {
   }
 }
 
-export async function refreshManagedData(): Promise<ManagedDataPayload> {
-  setBusy("data", true);
+export async function refreshManagedData(force = false, quiet = false): Promise<ManagedDataPayload> {
+  window.clearTimeout(managedDataTimer);
+  managedDataTimer = 0;
+  if (!quiet) setBusy("data", true);
   try {
-    const payload = await getJson<ManagedDataPayload>("/api/data");
+    const payload = await getJson<ManagedDataPayload>(force ? "/api/data?refresh=true" : "/api/data");
     trainer.managedData = { ...emptyManagedData(), ...payload };
+    if (payload.refreshing && trainer.activeView === "data") {
+      // Sizes come from a background scan; check back until it settles.
+      managedDataTimer = window.setTimeout(() => void refreshManagedData(false, true).catch(() => undefined), 2000);
+    }
     return payload;
   } finally {
-    setBusy("data", false);
+    if (!quiet) setBusy("data", false);
   }
 }
 
@@ -482,18 +551,47 @@ export async function startTraining(): Promise<void> {
   }
 }
 
-export function beginTrainingPoll(): void {
-  if (trainingTimer) return;
+function trainingLogUrl(path: string): string {
+  const offset = trainingLog.offset === null ? "" : String(trainingLog.offset);
+  return `${path}?offset=${offset}&log_id=${encodeURIComponent(trainingLog.logId)}`;
+}
+
+function applyTrainingLog(payload: JsonRecord, lines: string[]): void {
+  const logId = String(payload.log_id || "");
+  const reset = Boolean(payload.log_reset) || logId !== trainingLog.logId;
+  const kept = reset ? [] : trainer.training.log_lines || [];
+  const { lines: _lines, new_log_lines: _newLines, log_text: _text, ...status } = payload;
+  trainer.training = {
+    ...emptyTraining(),
+    ...trainer.training,
+    ...status,
+    log_lines: [...kept, ...lines].slice(-trainingLogLimit),
+  } as TrainingState;
+  trainingLog.offset = Number(payload.log_offset ?? 0);
+  trainingLog.logId = logId;
+}
+
+function stopTrainingUpdates(): void {
+  trainingStream?.close();
+  trainingStream = null;
+  window.clearInterval(trainingTimer);
+  trainingTimer = 0;
+}
+
+async function finishTraining(): Promise<void> {
+  if (!trainingStream && !trainingTimer) return;
+  stopTrainingUpdates();
+  await Promise.all([refreshSamples(true), refreshWakeWords(true)]);
+  notify(trainer.training.exit_code === 0 ? "Training finished successfully." : `Training ended with exit ${trainer.training.exit_code}.`, trainer.training.exit_code === 0 ? "success" : "error");
+}
+
+function pollTrainingLog(): void {
   const poll = async () => {
     try {
-      const payload = await getJson<JsonRecord>("/api/train_status");
-      trainer.training = { ...emptyTraining(), ...(payload.training || {}) };
-      if (!trainer.training.running) {
-        window.clearInterval(trainingTimer);
-        trainingTimer = 0;
-        await Promise.all([refreshSamples(true), refreshWakeWords(true)]);
-        notify(trainer.training.exit_code === 0 ? "Training finished successfully." : `Training ended with exit ${trainer.training.exit_code}.`, trainer.training.exit_code === 0 ? "success" : "error");
-      }
+      const payload = await getJson<JsonRecord>(trainingLogUrl("/api/train_status"));
+      const training = (payload.training || {}) as JsonRecord;
+      applyTrainingLog(training, (training.new_log_lines as string[]) || []);
+      if (!trainer.training.running) await finishTraining();
     } catch {
       // A temporary request failure should not stop the live poll.
     }
@@ -502,6 +600,30 @@ export function beginTrainingPoll(): void {
   trainingTimer = window.setInterval(() => void poll(), 1500);
 }
 
+export function beginTrainingPoll(): void {
+  if (trainingTimer || trainingStream) return;
+  if (typeof EventSource === "undefined") {
+    pollTrainingLog();
+    return;
+  }
+  // New log lines are pushed as they are written; byte offsets let the poll fallback resume where the stream stopped.
+  const stream = new EventSource(trainingLogUrl("/api/train_log/stream"));
+  trainingStream = stream;
+  const onChunk = (event: MessageEvent) => {
+    const payload = JSON.parse(event.data) as JsonRecord;
+    applyTrainingLog(payload, (payload.lines as string[]) || []);
+    if (!trainer.training.running) void finishTraining();
+  };
+  stream.addEventListener("log", onChunk as EventListener);
+  stream.addEventListener("status", onChunk as EventListener);
+  stream.onerror = () => {
+    if (trainingStream !== stream) return;
+    stream.close();
+    trainingStream = null;
+    pollTrainingLog();
+  };
+}
+
 export async function initializeTrainer(): Promise<void> {
   setBusy("bootstrap", true);
   try {
@@ -514,8 +636,9 @@ export async function initializeTrainer(): Promise<void> {
     ]);
     ensureSupportedTtsMode();
     try {
-      const payload = await getJson<JsonRecord>("/api/train_status");
-      trainer.training = { ...emptyTraining(), ...(payload.training || {}) };
+      const payload = await getJson<JsonRecord>(trainingLogUrl("/api/train_status"));
+      const training = (payload.training || {}) as JsonRecord;
+      applyTrainingLog(training, (training.new_log_lines as string[]) || []);
       if (trainer.training.running) {
         trainer.consoleOpen = true;
         beginTrainingPoll();
@@ -534,9 +657,10 @@ export async function initializeTrainer(): Promise<void> {
 
 export function disposeTrainer(): void {
   window.clearInterval(autoTimer);
-  window.clearInterval(trainingTimer);
+  window.clearTimeout(managedDataTimer);
   autoTimer = 0;
-  trainingTimer = 0;
+  managedDataTimer = 0;
+  stopTrainingUpdates();
 }
 
 export function formatTimestamp(value: unknown): string {
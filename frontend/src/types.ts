@@ -14,6 +14,8 @@ export interface TrainingState extends JsonRecord {
   running: boolean;
   exit_code: number | null;
   log_lines: string[];
+  log_offset?: number;
+  log_id?: string;
 }
 
 export interface SessionPayload extends JsonRecord {
@@ -43,6 +45,8 @@ export interface SamplesPayload extends JsonRecord {
   negative: AudioItem[];
   personal_count: number;
   negative_count: number;
+  matched_counts?: Partial<Record<SampleBucket, number>>;
+  next_cursors?: Partial<Record<SampleBucket, string>>;
 }
 
 export interface CapturedPayload extends JsonRecord {
@@ -50,6 +54,8 @@ export interface CapturedPayload extends JsonRecord {
   captured_count: number;
   personal_count: number;
   negative_count: number;
+  matched_count?: number;
+  next_cursor?: string;
 }
 
 export interface AutoTrainForm extends JsonRecord {
@@ -97,12 +103,17 @@ export interface ManagedDataItem extends JsonRecord {
   file_count: number;
   exists: boolean;
   rebuild_note?: string;
+  usage_pending?: boolean;
+  updated_seconds_ago?: number | null;
 }
 
 export interface ManagedDataPayload extends JsonRecord {
   items: ManagedDataItem[];
   total_size_bytes: number;
   total_file_count: number;
+  usage_pending?: boolean;
+  refreshing?: boolean;
+  updated_seconds_ago?: number | null;
 }
 
 export interface ToastState {
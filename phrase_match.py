@@ -0,0 +1,254 @@
+"""Wake-phrase transcript matching shared by the web server and reference QA.
+
+Only the standard library is required, so the TTS generator venvs can import
+it too.  A phrase is compiled once into its normalized words, joined token,
+phonetic key and any allowed spelling variants; transcripts are then scored
+against it one at a time or as a batch that shares per-window work.  Scores
+and decisions are the sequence-similarity rules reference QA has always used;
+the phonetic key only flags rejected transcripts that sound alike.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Any, Iterable, NamedTuple
+
+
+MIN_PHRASE_SIMILARITY = 0.68
+COMPILED_PHRASE_CACHE_SIZE = 64
+
+_PHONETIC_CLASSES = {
+    letter: code
+    for letters, code in (
+        ("bp", "b"),
+        ("fv", "f"),
+        ("cgkq", "k"),
+        ("sxz", "s"),
+        ("j", "j"),
+        ("dt", "t"),
+        ("l", "l"),
+        ("mn", "n"),
+        ("r", "r"),
+    )
+    for letter in letters
+}
+_PHONETIC_VOWELS = frozenset("aeiouy")
+_PHONETIC_SILENT = frozenset("hw")
+
+
+def normalize_text(value: Any) -> str:
+    text = unicodedata.normalize("NFKC", str(value or "")).casefold().replace("_", " ")
+    text = re.sub(r"[^\w]+", " ", text, flags=re.UNICODE)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def phonetic_key(token: str) -> str:
+    """Soundex-style key without truncation: the consonant classes in order.
+
+    Vowels are dropped except as the first letter, and a class repeats only
+    when a vowel separates it.  The classes are finer than Soundex so "jarvis"
+    and "service" stay apart.  Accents are stripped first; characters outside
+    the Latin consonant classes keep themselves, so other scripts still only
+    match exactly.
+    """
+    letters = "".join(
+        char for char in unicodedata.normalize("NFKD", token) if not unicodedata.combining(char)
+    )
+    if not letters:
+        return ""
+    previous = _PHONETIC_CLASSES.get(letters[0], letters[0])
+    key = [previous]
+    for char in letters[1:]:
+        if char in _PHONETIC_SILENT:
+            continue
+        if char in _PHONETIC_VOWELS:
+            previous = ""
+            continue
+        code = _PHONETIC_CLASSES.get(char, char)
+        if code != previous:
+            key.append(code)
+        previous = code
+    return "".join(key)
+
+
+class PhraseScore(NamedTuple):
+    similarity: float
+    contains: bool
+    matches: bool
+    # Only set for rejected transcripts: a window shares the phrase's coarse
+    # phonetic key.  Diagnostic only; it never changes similarity or matches.
+    sounds_alike: bool = False
+
+
+class _Target:
+    __slots__ = ("token", "phonetic", "matcher")
+
+    def __init__(self, token: str) -> None:
+        self.token = token
+        self.phonetic = phonetic_key(token)
+        # SequenceMatcher caches its analysis of the second sequence, so each
+        # target keeps one and only swaps the transcript window in.
+        self.matcher = SequenceMatcher(None)
+        self.matcher.set_seq2(token)
+
+
+class CompiledPhrase:
+    """A normalized wake phrase ready to score transcripts against.
+
+    ``variants`` are alternative spellings accepted as the phrase itself, for
+    names STT reliably writes another way.  Use ``compile_phrase`` to share
+    compiled phrases between callers.
+    """
+
+    def __init__(
+        self,
+        phrase: Any,
+        variants: Iterable[Any] = (),
+        min_similarity: float = MIN_PHRASE_SIMILARITY,
+    ) -> None:
+        self.words = tuple(normalize_text(phrase).split())
+        self.token = "".join(self.words)
+        self.min_similarity = float(min_similarity)
+        variant_words = []
+        for variant in (self.words, *(tuple(normalize_text(value).split()) for value in variants)):
+            if variant and variant not in variant_words:
+                variant_words.append(variant)
+        self.variants = tuple(" ".join(words) for words in variant_words)
+        self._padded_variants = tuple(f" {variant} " for variant in self.variants)
+        self._targets = tuple(_Target("".join(words)) for words in variant_words)
+        self._word_counts = {word: self.words.count(word) for word in set(self.words)}
+        self.phonetic_key = self._targets[0].phonetic if self._targets else ""
+
+    def __repr__(self) -> str:
+        return f"CompiledPhrase({' '.join(self.words)!r}, variants={self.variants[1:]!r})"
+
+    def contains(self, transcript: Any) -> bool:
+        return self._contains_normalized(normalize_text(transcript))
+
+    def similarity(self, transcript: Any) -> float:
+        return self._similarity_words(normalize_text(transcript).split(), {})
+
+    def matches(self, transcript: Any) -> bool:
+        return self.score(transcript).matches
+
+    def score(self, transcript: Any) -> PhraseScore:
+        return self._score_normalized(normalize_text(transcript), {})
+
+    def score_batch(self, transcripts: Iterable[Any]) -> list[PhraseScore]:
+        """Score many transcripts, reusing window scores they have in common."""
+        window_scores: dict[str, float] = {}
+        normalized_scores: dict[str, PhraseScore] = {}
+        scores = []
+        for transcript in transcripts:
+            normalized = normalize_text(transcript)
+            score = normalized_scores.get(normalized)
+            if score is None:
+                score = self._score_normalized(normalized, window_scores)
+                normalized_scores[normalized] = score
+            scores.append(score)
+        return scores
+
+    def similarities(self, transcripts: Iterable[Any]) -> list[float]:
+        return [score.similarity for score in self.score_batch(transcripts)]
+
+    def _contains_normalized(self, normalized: str) -> bool:
+        if not normalized or not self.words:
+            return False
+        padded = f" {normalized} "
+        return any(variant in padded for variant in self._padded_variants)
+
+    def _score_normalized(self, normalized: str, window_scores: dict[str, float]) -> PhraseScore:
+        transcript_words = normalized.split()
+        contains = self._contains_normalized(normalized)
+        similarity = 1.0 if contains else self._similarity_words(transcript_words, window_scores)
+        matches = self._matches_words(transcript_words, contains, similarity)
+        sounds_alike = not matches and self._sounds_alike(transcript_words)
+        return PhraseScore(similarity, contains, matches, sounds_alike)
+
+    def _sounds_alike(self, transcript_words: list[str]) -> bool:
+        keys = {target.phonetic for target in self._targets if target.phonetic}
+        if not keys:
+            return False
+        minimum_words = max(1, len(self.words) - 1)
+        maximum_words = min(len(transcript_words), len(self.words) + 1)
+        return any(
+            phonetic_key("".join(transcript_words[start : start + word_count])) in keys
+            for word_count in range(minimum_words, maximum_words + 1)
+            for start in range(0, len(transcript_words) - word_count + 1)
+        )
+
+    def _similarity_words(self, transcript_words: list[str], window_scores: dict[str, float]) -> float:
+        if not transcript_words or not self.words:
+            return 0.0
+        best_score = 0.0
+        minimum_words = max(1, len(self.words) - 1)
+        maximum_words = min(len(transcript_words), len(self.words) + 1)
+        for word_count in range(minimum_words, maximum_words + 1):
+            for start in range(0, len(transcript_words) - word_count + 1):
+                candidate = "".join(transcript_words[start : start + word_count])
+                score = window_scores.get(candidate)
+                if score is None:
+                    score = self._window_score(candidate, best_score)
+                    if score is None:
+                        continue
+                    window_scores[candidate] = score
+                best_score = max(best_score, score)
+                if best_score >= 1.0:
+                    return best_score
+        return best_score
+
+    def _window_score(self, candidate: str, floor: float) -> float | None:
+        """Best score of one window, or None when it cannot beat ``floor``.
+
+        The quick ratios are upper bounds on ``ratio()``, so windows they rule
+        out are skipped without changing the result; skipped windows are not
+        cached because their exact score was never computed.
+        """
+        best_score = 0.0
+        pruned = False
+        for target in self._targets:
+            if candidate == target.token:
+                return 1.0
+            matcher = target.matcher
+            matcher.set_seq1(candidate)
+            ceiling = max(floor, best_score)
+            if matcher.real_quick_ratio() <= ceiling or matcher.quick_ratio() <= ceiling:
+                pruned = True
+                continue
+            best_score = max(best_score, matcher.ratio())
+        if pruned and best_score <= floor:
+            return None
+        return best_score
+
+    def _matches_words(self, transcript_words: list[str], contains: bool, similarity: float) -> bool:
+        """Reference QA acceptance: one utterance of the phrase and nothing repeated."""
+        if not transcript_words or not self.words:
+            return False
+        if len(transcript_words) > len(self.words) + 1:
+            return False
+        if any(transcript_words.count(word) > count for word, count in self._word_counts.items()):
+            return False
+        transcript_token = "".join(transcript_words)
+        if contains or any(transcript_token.count(target.token) == 1 for target in self._targets):
+            return True
+        return len(transcript_words) >= len(self.words) and similarity >= self.min_similarity
+
+
+@functools.lru_cache(maxsize=COMPILED_PHRASE_CACHE_SIZE)
+def _compile_phrase_cached(phrase: str, variants: tuple[str, ...], min_similarity: float) -> CompiledPhrase:
+    return CompiledPhrase(phrase, variants, min_similarity)
+
+
+def compile_phrase(
+    phrase: Any,
+    variants: Iterable[Any] = (),
+    min_similarity: float = MIN_PHRASE_SIMILARITY,
+) -> CompiledPhrase:
+    return _compile_phrase_cached(
+        normalize_text(phrase),
+        tuple(normalize_text(value) for value in variants),
+        float(min_similarity),
+    )
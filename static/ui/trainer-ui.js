@@ -3296,7 +3296,7 @@ var vs = () => ({
 	items: [],
 	total_size_bytes: 0,
 	total_file_count: 0
-}), Ss = () => ({
+}), nf = 50, Ss = () => ({
 	enabled: !1,
 	wake_phrase: "",
 	language: "en",
@@ -3335,6 +3335,12 @@ var vs = () => ({
 		personal: 0,
 		negative: 0
 	},
+	sampleCursors: {
+		personal: [""],
+		negative: [""]
+	},
+	capturedPage: 0,
+	capturedCursors: [""],
 	uploadProgress: 0,
 	uploadLabel: "No upload in progress",
 	uploadDetail: "Choose files and upload when you are ready.",
@@ -3347,7 +3353,10 @@ var vs = () => ({
 		tone: "success",
 		serial: 0
 	}
-}), Cs = 0, ws = 0, Ts = Y(() => Number(X.samples.personal_count ?? X.session.takes_received ?? 0)), Es = Y(() => Number(X.samples.negative_count ?? X.captured.negative_count ?? 0)), Ds = Y(() => X.languages.find((e) => e.code === X.language) || X.languages[0]), Os = Y(() => {
+}), Cs = 0, ws = 0, Nf = 0, kf = null, Of = {
+	offset: null,
+	logId: ""
+}, Ts = Y(() => Number(X.samples.personal_count ?? X.session.takes_received ?? 0)), Es = Y(() => Number(X.samples.negative_count ?? X.captured.negative_count ?? 0)), Ds = Y(() => X.languages.find((e) => e.code === X.language) || X.languages[0]), Os = Y(() => {
 	let e = Ds.value?.engines?.length ? Ds.value.engines : ["omnivoice"], t = X.ttsMode === "piper" ? e.filter((e) => e === "piper") : X.ttsMode === "hybrid" ? e : e.filter((e) => e !== "piper"), n = {
 		omnivoice: "OmniVoice",
 		qwen3: "Qwen3",
@@ -3355,7 +3364,7 @@ var vs = () => ({
 		piper: "Piper"
 	}, r = X.ttsMode === "piper" ? "Legacy" : Ns(Ds.value?.quality || "experimental");
 	return `${t.map((e) => n[e] || e).join(" + ") || "Unavailable"} · ${r}`;
-}), ks = Y(() => !!(X.training.running || X.training.exit_code !== null || X.training.log_lines?.length)), As = Y(() => X.samples[X.sampleBucket] || []), js = Y(() => !!X.auto.trainer_link?.linked), Ms = Y(() => {
+}), ks = Y(() => !!(X.training.running || X.training.exit_code !== null || X.training.log_lines?.length)), As = Y(() => X.samples[X.sampleBucket] || []), rf = Y(() => sf(X.samples.matched_counts?.[X.sampleBucket] ?? As.value.length)), af = Y(() => sf(X.captured.matched_count ?? X.captured.items.length)), js = Y(() => !!X.auto.trainer_link?.linked), Ms = Y(() => {
 	let e = X.auto.stt_engines;
 	return Array.isArray(e) && e.length ? e : [{
 		id: "faster_whisper",
@@ -3365,6 +3374,15 @@ var vs = () => ({
 		label: "Parakeet ONNX"
 	}];
 });
+function sf(e) {
+	return Math.max(1, Math.ceil((Number(e) || 0) / nf));
+}
+function cf(e, t) {
+	return `${e}?${new URLSearchParams({
+		...t,
+		limit: String(nf)
+	})}`;
+}
 function Ns(e) {
 	return String(e || "").replaceAll("_", " ").replace(/\b\w/g, (e) => e.toUpperCase());
 }
@@ -3413,7 +3431,7 @@ async function Ls() {
 async function Rs() {
 	let e = !!X.training.running;
 	if (!(e && !window.confirm("Training is running. Stop training cleanly and end this session?"))) {
-		Q("session", !0), ws &&= (window.clearInterval(ws), 0);
+		Q("session", !0), Mf();
 		try {
 			Fs(await gs("/api/stop_session")), $(e ? "Training stopped cleanly and the session ended." : "Session ended. You can edit the wake phrase now.");
 		} catch (t) {
@@ -3432,28 +3450,45 @@ function Bs() {
 	let e = Ds.value?.engines || [], t = e.some((e) => e !== "piper"), n = e.includes("piper");
 	X.ttsMode === "modern" && !t && (X.ttsMode = "piper"), X.ttsMode === "hybrid" && !(t && n) && (X.ttsMode = t ? "modern" : "piper"), X.ttsMode === "piper" && !n && (X.ttsMode = "modern");
 }
+function lf(e) {
+	let t = X.sampleCursors[e][X.samplePage[e]] || "";
+	return hs(cf("/api/samples", {
+		bucket: e,
+		cursor: t
+	}));
+}
 async function Vs(e = !1) {
 	e || Q("samples", !0);
 	try {
-		let e = await hs("/api/samples");
-		X.samples = {
+		let e = X.sampleBucket, t = await lf(e), n = sf(t.matched_counts?.[e]) - 1;
+		return X.samplePage[e] > n && (X.samplePage[e] = n, X.sampleCursors[e].length = n + 1, t = await lf(e)), X.samples = {
 			...ys(),
-			...e
-		};
-		for (let e of ["personal", "negative"]) {
-			let t = Math.max(0, Math.ceil((X.samples[e]?.length || 0) / 50) - 1);
-			X.samplePage[e] = Math.min(X.samplePage[e], t);
-		}
-		return e;
+			...t
+		}, t;
 	} finally {
 		e || Q("samples", !1);
 	}
 }
+async function uf(e) {
+	let t = X.sampleBucket, n = X.samplePage[t] + e, r = X.samples.next_cursors?.[t];
+	if (!(n < 0 || e > 0 && !r)) {
+		e > 0 && r && (X.sampleCursors[t][n] = r), X.samplePage[t] = n;
+		try {
+			await Vs();
+		} catch (e) {
+			Ps(e, "Samples could not be loaded.");
+		}
+	}
+}
+function df() {
+	let e = X.capturedCursors[X.capturedPage] || "";
+	return hs(cf("/api/captured_audio", { cursor: e }));
+}
 async function Hs(e = !1) {
 	e || Q("captured", !0);
 	try {
-		let e = await hs("/api/captured_audio");
-		return X.captured = {
+		let e = await df(), t = sf(e.matched_count) - 1;
+		return X.capturedPage > t && (X.capturedPage = t, X.capturedCursors.length = t + 1, e = await df()), X.captured = {
 			...bs(),
 			...e
 		}, e;
@@ -3461,6 +3496,17 @@ async function Hs(e = !1) {
 		e || Q("captured", !1);
 	}
 }
+async function ff(e) {
+	let t = X.capturedPage + e, n = X.captured.next_cursor;
+	if (!(t < 0 || e > 0 && !n)) {
+		e > 0 && n && (X.capturedCursors[t] = n), X.capturedPage = t;
+		try {
+			await Hs();
+		} catch (e) {
+			Ps(e, "Captured audio could not be loaded.");
+		}
+	}
+}
 function Us(e) {
 	let t = e.target;
 	X.selectedFiles = Array.from(t.files || []);
@@ -3620,16 +3666,16 @@ async function nc(e = !1) {
 		e || Q("firmware", !1);
 	}
 }
-async function rc() {
-	Q("data", !0);
+async function rc(e = !1, t = !1) {
+	window.clearTimeout(Nf), Nf = 0, t || Q("data", !0);
 	try {
-		let e = await hs("/api/data");
+		let n = await hs(e ? "/api/data?refresh=true" : "/api/data");
 		return X.managedData = {
 			...xs(),
-			...e
-		}, e;
+			...n
+		}, n.refreshing && X.activeView === "data" && (Nf = window.setTimeout(() => void rc(!1, !0).catch(() => void 0), 2e3)), n;
 	} finally {
-		Q("data", !1);
+		t || Q("data", !1);
 	}
 }
 async function ic(e) {
@@ -3684,19 +3730,50 @@ async function oc() {
 		}
 	}
 }
-function sc() {
-	if (ws) return;
+function gf(e) {
+	let t = Of.offset === null ? "" : String(Of.offset);
+	return `${e}?offset=${t}&log_id=${encodeURIComponent(Of.logId)}`;
+}
+function vf(e, t) {
+	let n = String(e.log_id || ""), r = e.log_reset || n !== Of.logId ? [] : X.training.log_lines || [], { lines: i, new_log_lines: a, log_text: o, ...s } = e;
+	X.training = {
+		...vs(),
+		...X.training,
+		...s,
+		log_lines: [...r, ...t].slice(-400)
+	}, Of.offset = Number(e.log_offset ?? 0), Of.logId = n;
+}
+function Mf() {
+	kf?.close(), kf = null, window.clearInterval(ws), ws = 0;
+}
+async function Af() {
+	!kf && !ws || (Mf(), await Promise.all([Vs(!0), nc(!0)]), $(X.training.exit_code === 0 ? "Training finished successfully." : `Training ended with exit ${X.training.exit_code}.`, X.training.exit_code === 0 ? "success" : "error"));
+}
+function jf() {
 	let e = async () => {
 		try {
-			let e = await hs("/api/train_status");
-			X.training = {
-				...vs(),
-				...e.training || {}
-			}, X.training.running || (window.clearInterval(ws), ws = 0, await Promise.all([Vs(!0), nc(!0)]), $(X.training.exit_code === 0 ? "Training finished successfully." : `Training ended with exit ${X.training.exit_code}.`, X.training.exit_code === 0 ? "success" : "error"));
+			let e = (await hs(gf("/api/train_status"))).training || {};
+			vf(e, e.new_log_lines || []), X.training.running || await Af();
 		} catch {}
 	};
 	e(), ws = window.setInterval(() => void e(), 1500);
 }
+function sc() {
+	if (ws || kf) return;
+	if (typeof EventSource > "u") {
+		jf();
+		return;
+	}
+	let e = new EventSource(gf("/api/train_log/stream"));
+	kf = e;
+	let t = (e) => {
+		let t = JSON.parse(e.data);
+		vf(t, t.lines || []), X.training.running || Af();
+	};
+	e.addEventListener("log", t), e.addEventListener("status", t), e.onerror = () => {
+		kf === e && (e.close(), kf = null, jf());
+	};
+}
 async function cc() {
 	Q("bootstrap", !0);
 	try {
@@ -3708,11 +3785,8 @@ async function cc() {
 			nc(!0)
 		]), Bs();
 		try {
-			let e = await hs("/api/train_status");
-			X.training = {
-				...vs(),
-				...e.training || {}
-			}, X.training.running && (X.consoleOpen = !0, sc());
+			let e = (await hs(gf("/api/train_status"))).training || {};
+			vf(e, e.new_log_lines || []), X.training.running && (X.consoleOpen = !0, sc());
 		} catch {}
 		Cs = window.setInterval(() => {
 			X.activeView === "auto" && !Z("auto") && Zs(!1).catch(() => void 0);
@@ -3722,7 +3796,7 @@ async function cc() {
 	}
 }
 function lc() {
-	window.clearInterval(Cs), window.clearInterval(ws), Cs = 0, ws = 0;
+	window.clearInterval(Cs), window.clearTimeout(Nf), Cs = 0, Nf = 0, Mf();
 }
 function uc(e) {
 	if (!e) return "";
@@ -3974,7 +4048,10 @@ var hc = {
 }, Yl = {
 	key: 2,
 	class: "transcript"
-}, Xl = ["src"], Zl = ["disabled", "onClick"], Ql = ["disabled", "onClick"], $l = ["disabled", "onClick"], eu = { class: "hero samples-hero" }, tu = { class: "pill hero-pill" }, nu = { class: "panel" }, ru = { class: "panel-head sample-head" }, iu = { class: "segment-control" }, au = { class: "row toolbar" }, ou = ["disabled"], su = ["disabled"], cu = ["disabled"], lu = {
+}, Xl = ["src"], Zl = ["disabled", "onClick"], Ql = ["disabled", "onClick"], $l = ["disabled", "onClick"], hf = {
+	key: 2,
+	class: "pagination"
+}, mf = ["disabled"], pf = ["disabled"], eu = { class: "hero samples-hero" }, tu = { class: "pill hero-pill" }, nu = { class: "panel" }, ru = { class: "panel-head sample-head" }, iu = { class: "segment-control" }, au = { class: "row toolbar" }, ou = ["disabled"], su = ["disabled"], cu = ["disabled"], lu = {
 	key: 0,
 	class: "empty-state"
 }, uu = {
@@ -4035,7 +4112,7 @@ var hc = {
 }, gd = {
 	key: 1,
 	class: "stack"
-}, _d = { class: "field" }, vd = { class: "field" }, yd = ["disabled"], bd = "/static/images/tater-wake-word-trainer.png", xd = 50, Sd = /* @__PURE__ */ fr({
+}, _d = { class: "field" }, vd = { class: "field" }, yd = ["disabled"], bd = "/static/images/tater-wake-word-trainer.png", Sd = /* @__PURE__ */ fr({
 	__name: "TrainerApp",
 	setup(e) {
 		let t = /* @__PURE__ */ F(null), n = /* @__PURE__ */ F(null), r = /* @__PURE__ */ F(!0), i = /* @__PURE__ */ F(""), a = /* @__PURE__ */ F(""), o = /* @__PURE__ */ F(!1), s = [
@@ -4069,10 +4146,7 @@ var hc = {
 				label: "Data",
 				short: "Data"
 			}
-		], c = Y(() => {
-			let e = X.samplePage[X.sampleBucket];
-			return As.value.slice(e * xd, (e + 1) * xd);
-		}), l = Y(() => Math.max(1, Math.ceil(As.value.length / xd))), u = Y(() => X.auto.state || {}), d = Y(() => X.auto.runtime || {}), f = Y(() => {
+		], u = Y(() => X.auto.state || {}), d = Y(() => X.auto.runtime || {}), f = Y(() => {
 			let e = u.value, t = [];
 			return e.last_review_result && t.push(`Last review: ${String(e.last_review_result).replaceAll("_", " ")}`), e.last_review_file && t.push(String(e.last_review_file)), e.last_review_transcript && t.push(`STT: “${e.last_review_transcript}”`), e.last_review_error && t.push(`Error: ${e.last_review_error}`), e.last_stt_engine && t.push(`STT engine: ${String(e.last_stt_engine).replaceAll("_", " ")}`), e.last_notify_at && t.push(e.last_notify_error ? `Publish failed: ${e.last_notify_error}` : `Wake word published ${uc(e.last_notify_at)}`), t.join(" · ") || "No automatic review has run yet.";
 		}), p = Y(() => X.training.running ? {
@@ -4109,6 +4183,9 @@ var hc = {
 				name: e,
 				items: t
 			}));
+		}), Rf = Y(() => {
+			let e = X.managedData.updated_seconds_ago;
+			return X.managedData.refreshing ? " · scanning…" : typeof e == "number" ? ` · updated ${e < 60 ? `${e} s` : `${Math.round(e / 60)} min`} ago` : "";
 		});
 		Nn(() => X.language, Bs), Nn(() => X.toast.serial, () => window.setTimeout(() => {
 			X.toast.message = "";
@@ -4138,7 +4215,7 @@ var hc = {
 			X.activeView = e, (e === "auto" ? Zs(!1) : e === "captured" ? Hs() : e === "samples" ? Vs() : e === "firmware" ? nc() : e === "data" ? rc() : Promise.resolve()).catch((e) => $(e instanceof Error ? e.message : "Refresh failed.", "error"));
 		}
 		function x(e) {
-			X.sampleBucket = e;
+			X.sampleBucket = e, Vs().catch((e) => $(e instanceof Error ? e.message : "Samples could not be loaded.", "error"));
 		}
 		function S(e, t) {
 			X.trimBucket = t, X.trimItem = e;
@@ -4491,7 +4568,19 @@ var hc = {
 							onClick: (t) => I(Ks)(e, "discard")
 						}, "Discard", 8, $l)
 					])])
-				]))), 128))])) : (U(), W("div", Gl, "No captured audio yet. Clips sent by satellites will appear here."))])
+				]))), 128))])) : (U(), W("div", Gl, "No captured audio yet. Clips sent by satellites will appear here.")), I(af) > 1 ? (U(), W("div", hf, [
+					G("button", {
+						type: "button",
+						disabled: I(Z)("captured") || I(X).capturedPage === 0,
+						onClick: d[120] ||= (e) => I(ff)(-1)
+					}, "Previous", 8, mf),
+					G("span", null, "Page " + k(I(X).capturedPage + 1) + " of " + k(I(af)), 1),
+					G("button", {
+						type: "button",
+						disabled: I(Z)("captured") || !I(X).captured.next_cursor,
+						onClick: d[121] ||= (e) => I(ff)(1)
+					}, "Next", 8, pf)
+				])) : q("", !0)])
 			], 64)) : I(X).activeView === "samples" ? (U(), W(V, { key: 3 }, [
 				G("section", eu, [d[89] ||= G("div", null, [
 					G("span", { class: "eyebrow" }, "Sample library"),
@@ -4531,7 +4620,7 @@ var hc = {
 							onClick: d[31] ||= (e) => I(Ys)("negative")
 						}, "Clear negatives", 8, cu)
 					]),
-					I(As).length ? (U(), W("div", uu, [(U(!0), W(V, null, Lr(c.value, (e) => (U(), W("article", {
+					I(As).length ? (U(), W("div", uu, [(U(!0), W(V, null, Lr(I(As), (e) => (U(), W("article", {
 						key: e.saved_as,
 						class: "audio-card"
 					}, [
@@ -4561,17 +4650,17 @@ var hc = {
 							}, "Remove", 8, vu)
 						])])
 					]))), 128))])) : (U(), W("div", lu, "No " + k(I(X).sampleBucket) + " samples saved yet.", 1)),
-					l.value > 1 ? (U(), W("div", yu, [
+					I(rf) > 1 ? (U(), W("div", yu, [
 						G("button", {
 							type: "button",
-							disabled: I(X).samplePage[I(X).sampleBucket] === 0,
-							onClick: d[32] ||= (e) => I(X).samplePage[I(X).sampleBucket]--
+							disabled: I(Z)("samples") || I(X).samplePage[I(X).sampleBucket] === 0,
+							onClick: d[32] ||= (e) => I(uf)(-1)
 						}, "Previous", 8, bu),
-						G("span", null, "Page " + k(I(X).samplePage[I(X).sampleBucket] + 1) + " of " + k(l.value), 1),
+						G("span", null, "Page " + k(I(X).samplePage[I(X).sampleBucket] + 1) + " of " + k(I(rf)), 1),
 						G("button", {
 							type: "button",
-							disabled: I(X).samplePage[I(X).sampleBucket] >= l.value - 1,
-							onClick: d[33] ||= (e) => I(X).samplePage[I(X).sampleBucket]++
+							disabled: I(Z)("samples") || !I(X).samples.next_cursors?.[I(X).sampleBucket],
+							onClick: d[33] ||= (e) => I(uf)(1)
 						}, "Next", 8, xu)
 					])) : q("", !0)
 				]),
@@ -4606,7 +4695,7 @@ var hc = {
 					G("span", { class: "eyebrow" }, "Local storage"),
 					G("h2", null, "Data Management"),
 					G("p", null, "See exactly what the trainer has downloaded, generated, recorded, and produced.")
-				], -1), G("span", Ou, k(I(dc)(I(X).managedData.total_size_bytes)) + " total", 1)]),
+				], -1), G("span", Ou, k(I(dc)(I(X).managedData.total_size_bytes)) + " total" + k(Rf.value), 1)]),
 				G("section", ku, [
 					G("header", Au, [
 						d[99] ||= G("div", { class: "number" }, "i", -1),
@@ -4614,7 +4703,7 @@ var hc = {
 						G("button", {
 							type: "button",
 							disabled: I(Z)("data") || I(Z)("data-delete"),
-							onClick: d[36] ||= (e) => I(rc)()
+							onClick: d[36] ||= (e) => I(rc)(!0)
 						}, k(I(Z)("data") ? "Scanning…" : "Refresh sizes"), 9, ju)
 					]),
 					G("div", Mu, [
@@ -4636,7 +4725,7 @@ var hc = {
 						G("small", null, k(e.description), 1),
 						e.rebuild_note ? (U(), W("span", Bu, k(e.rebuild_note), 1)) : q("", !0)
 					]),
-					G("div", Vu, [G("strong", null, k(I(dc)(e.size_bytes)), 1), G("span", null, k(Number(e.file_count || 0).toLocaleString()) + " file" + k(e.file_count === 1 ? "" : "s"), 1)]),
+					G("div", Vu, [G("strong", null, k(e.usage_pending ? "Calculating…" : I(dc)(e.size_bytes)), 1), G("span", null, k(Number(e.file_count || 0).toLocaleString()) + " file" + k(e.file_count === 1 ? "" : "s"), 1)]),
 					G("button", {
 						type: "button",
 						class: "button danger ghost",
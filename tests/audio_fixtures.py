@@ -0,0 +1,59 @@
+"""Shared fixtures for the tests that store captures in a temporary data tree."""
+
+import io
+import tempfile
+import wave
+from pathlib import Path
+
+import trainer_server as trainer
+
+
+def tone_wav_bytes(duration_s: float = 0.25, amplitude: int = 4000) -> bytes:
+    output = io.BytesIO()
+    frames = int(16000 * duration_s)
+    with wave.open(output, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        pattern = amplitude.to_bytes(2, "little", signed=True) + (-amplitude).to_bytes(2, "little", signed=True)
+        wav_file.writeframes(pattern * (frames // 2))
+    return output.getvalue()
+
+
+class FakeRequest:
+    def __init__(self, headers: dict | None = None, body: bytes = b""):
+        self.headers = headers or {}
+        self._body = body
+
+    async def body(self) -> bytes:
+        return self._body
+
+
+class AudioDataDirsMixin:
+    """Point the sample folders and the audio index at a temporary directory."""
+
+    def setUp(self):
+        super().setUp()
+        self.tempdir = tempfile.TemporaryDirectory()
+        root = Path(self.tempdir.name)
+        self.original_paths = {
+            "CAPTURED_DIR": trainer.CAPTURED_DIR,
+            "NEGATIVE_DIR": trainer.NEGATIVE_DIR,
+            "PERSONAL_DIR": trainer.PERSONAL_DIR,
+            "TRIM_HISTORY_DIR": trainer.TRIM_HISTORY_DIR,
+            "AUDIO_INDEX_FILE": trainer.AUDIO_INDEX_FILE,
+        }
+        trainer.CAPTURED_DIR = root / "captured_audio"
+        trainer.NEGATIVE_DIR = root / "negative_samples"
+        trainer.PERSONAL_DIR = root / "personal_samples"
+        trainer.TRIM_HISTORY_DIR = root / "trim_history"
+        trainer.AUDIO_INDEX_FILE = root / ".cache" / "audio_index.sqlite3"
+        for directory in (trainer.CAPTURED_DIR, trainer.NEGATIVE_DIR, trainer.PERSONAL_DIR):
+            directory.mkdir(parents=True)
+
+    def tearDown(self):
+        trainer._close_audio_index()
+        for name, value in self.original_paths.items():
+            setattr(trainer, name, value)
+        self.tempdir.cleanup()
+        super().tearDown()
@@ -0,0 +1,289 @@
+import io
+import os
+import unittest
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import trainer_server as trainer
+from audio_fixtures import AudioDataDirsMixin, FakeRequest, tone_wav_bytes
+
+
+class AudioIndexTests(AudioDataDirsMixin, unittest.TestCase):
+    def save_capture(self, original_name: str = "wake.wav", event_type: str = "wake_detected") -> str:
+        result = trainer._save_captured_sample(tone_wav_bytes(), original_name)
+        audio_path = trainer.CAPTURED_DIR / result["saved_as"]
+        trainer._write_sidecar_json(
+            audio_path,
+            {
+                "saved_as": result["saved_as"],
+                "original_name": original_name,
+                "event_type": event_type,
+                "postprocess": result["postprocess"],
+                "final_format": result["final_format"],
+                "review_status": "pending",
+            },
+        )
+        return result["saved_as"]
+
+    def test_listing_is_served_from_the_index_without_reading_sidecars(self):
+        first = self.save_capture("first.wav")
+        second = self.save_capture("second.wav", event_type="close_miss")
+        os.utime(trainer.CAPTURED_DIR / first, ns=(1_000_000_000, 1_000_000_000))
+        trainer._index_audio_path(trainer.CAPTURED_DIR / first)
+
+        with patch.object(trainer, "_load_sidecar_json", side_effect=AssertionError("sidecar read")):
+            items = trainer._list_captured_items()
+
+        self.assertEqual([item["saved_as"] for item in items], [second, first])
+        self.assertEqual(items[0]["event_type"], "close_miss")
+        self.assertEqual(items[0]["final_format"]["sample_rate"], 16000)
+        self.assertEqual(trainer._list_captured_sample_names(), sorted([first, second]))
+
+    def test_moves_and_removals_keep_the_index_current(self):
+        name = self.save_capture()
+        discarded = self.save_capture("discard.wav")
+
+        trainer._move_captured_audio(name, trainer.NEGATIVE_DIR, target_prefix="negative", review_status="approved_negative")
+        trainer._remove_audio_with_sidecar(trainer.CAPTURED_DIR / discarded)
+
+        self.assertEqual(trainer._list_captured_items(), [])
+        negatives = trainer._list_sample_items(trainer.NEGATIVE_DIR, "negative")
+        self.assertEqual([item["saved_as"] for item in negatives], ["negative_0001_wake.wav"])
+        self.assertEqual(negatives[0]["review_status"], "approved_negative")
+
+    def test_reconcile_picks_up_files_changed_outside_the_server(self):
+        kept = self.save_capture("kept.wav")
+        removed = self.save_capture("removed.wav")
+        trainer._list_captured_items()
+
+        (trainer.CAPTURED_DIR / removed).unlink()
+        (trainer.CAPTURED_DIR / "manual.wav").write_bytes(tone_wav_bytes())
+
+        counts = trainer._reconcile_audio_index(trainer.CAPTURED_DIR)
+
+        self.assertEqual(counts, {"added": 1, "updated": 0, "removed": 1})
+        self.assertEqual(trainer._list_captured_sample_names(), sorted([kept, "manual.wav"]))
+        self.assertEqual(trainer._reconcile_audio_index(trainer.CAPTURED_DIR), {"added": 0, "updated": 0, "removed": 0})
+
+    def test_untrimmed_samples_are_listed_before_trimmed_samples(self):
+        trimmed = trainer._save_personal_sample(tone_wav_bytes(), "one.wav")["saved_as"]
+        untrimmed = trainer._save_personal_sample(tone_wav_bytes(), "two.wav")["saved_as"]
+        os.utime(trainer.PERSONAL_DIR / untrimmed, ns=(1_000_000_000, 1_000_000_000))
+        trainer._write_sidecar_json(trainer.PERSONAL_DIR / trimmed, {"trimmed": True})
+        trainer._index_audio_path(trainer.PERSONAL_DIR / untrimmed)
+
+        items = trainer._list_sample_items(trainer.PERSONAL_DIR, "personal")
+
+        self.assertEqual([item["saved_as"] for item in items], [untrimmed, trimmed])
+        self.assertTrue(items[1]["trimmed"])
+
+    def test_listing_falls_back_to_a_directory_scan_when_the_index_is_unavailable(self):
+        name = self.save_capture()
+        with patch.object(trainer, "_audio_index_connection", side_effect=trainer.sqlite3.OperationalError("locked")):
+            items = trainer._list_captured_items()
+        self.assertEqual([item["saved_as"] for item in items], [name])
+
+    def test_captured_audio_pages_with_cursors_and_filters(self):
+        names = []
+        for index in range(5):
+            name = self.save_capture(f"clip{index}.wav", event_type="close_miss" if index % 2 else "wake_detected")
+            os.utime(trainer.CAPTURED_DIR / name, ns=((index + 1) * 1_000_000_000,) * 2)
+            trainer._index_audio_path(trainer.CAPTURED_DIR / name)
+            names.append(name)
+
+        first = trainer.captured_audio(limit="2")
+        second = trainer.captured_audio(limit="2", cursor=first["next_cursor"])
+        last = trainer.captured_audio(limit="2", cursor=second["next_cursor"])
+
+        self.assertEqual([item["saved_as"] for item in first["items"]], [names[4], names[3]])
+        self.assertEqual([item["saved_as"] for item in second["items"]], [names[2], names[1]])
+        self.assertEqual([item["saved_as"] for item in last["items"]], [names[0]])
+        self.assertEqual(last["next_cursor"], "")
+        self.assertEqual(first["captured_count"], 5)
+
+        close_misses = trainer.captured_audio(event_type="close_miss")
+        self.assertEqual([item["saved_as"] for item in close_misses["items"]], [names[3], names[1]])
+        self.assertEqual(close_misses["matched_count"], 2)
+
+        counts = trainer.captured_audio(event_type="wake_detected", count_only="1")
+        self.assertNotIn("items", counts)
+        self.assertEqual((counts["captured_count"], counts["matched_count"]), (5, 3))
+
+    def test_date_range_filters_use_the_received_timestamp(self):
+        early = self.save_capture("early.wav")
+        late = self.save_capture("late.wav")
+        for name, received_at in ((early, "2026-01-01T08:00:00+00:00"), (late, "2026-02-01T08:00:00Z")):
+            path = trainer.CAPTURED_DIR / name
+            trainer._write_sidecar_json(path, {**trainer._load_sidecar_json(path), "received_at": received_at})
+
+        payload = trainer.captured_audio(since="2026-01-15", until="2026-03-01")
+        self.assertEqual([item["saved_as"] for item in payload["items"]], [late])
+
+        invalid = trainer.captured_audio(since="last tuesday")
+        self.assertEqual(invalid.status_code, 400)
+
+    def test_samples_page_a_single_bucket_and_reject_unscoped_cursors(self):
+        for index in range(3):
+            trainer._save_personal_sample(tone_wav_bytes(), f"take{index}.wav")
+
+        page = trainer.samples(bucket="personal", limit="2")
+        self.assertEqual(len(page["personal"]), 2)
+        self.assertEqual(page["personal_count"], 3)
+        self.assertTrue(page["next_cursors"]["personal"])
+        self.assertNotIn("negative", page["next_cursors"])
+
+        rest = trainer.samples(bucket="personal", limit="2", cursor=page["next_cursors"]["personal"])
+        seen = [item["saved_as"] for item in page["personal"] + rest["personal"]]
+        self.assertEqual(sorted(seen), trainer._list_personal_samples())
+
+        self.assertEqual(trainer.samples(limit="2", cursor=page["next_cursors"]["personal"]).status_code, 400)
+        self.assertEqual(trainer.samples(bucket="personal", cursor="not-a-cursor").status_code, 400)
+        self.assertEqual(trainer.samples(bucket="captured").status_code, 404)
+
+    def test_sample_names_come_from_a_persisted_counter(self):
+        (trainer.NEGATIVE_DIR / "negative_0007_old.wav").write_bytes(tone_wav_bytes())
+
+        first = trainer._next_negative_sample_name("clip.wav")
+        trainer._close_audio_index()
+        second = trainer._next_negative_sample_name("clip.wav")
+
+        self.assertEqual((first, second), ("negative_0008_clip.wav", "negative_0009_clip.wav"))
+        with patch.object(trainer, "_list_audio_samples", side_effect=AssertionError("directory listing")):
+            self.assertEqual(trainer._next_negative_sample_name("wakeword.wav"), "negative_0010.wav")
+
+        (trainer.NEGATIVE_DIR / "negative_0042_restored.wav").write_bytes(tone_wav_bytes())
+        trainer._reconcile_audio_index(trainer.NEGATIVE_DIR)
+        self.assertEqual(trainer._next_negative_sample_name("clip.wav"), "negative_0043_clip.wav")
+
+        trainer._reset_audio_dir(trainer.NEGATIVE_DIR)
+        self.assertEqual(trainer._next_negative_sample_name("clip.wav"), "negative_0001_clip.wav")
+
+    def test_concurrent_saves_never_share_a_name(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: trainer._save_captured_sample(tone_wav_bytes(), "wake.wav"), range(24)))
+
+        names = [result["saved_as"] for result in results]
+        self.assertEqual(len(set(names)), 24)
+        self.assertEqual(sorted(names), [f"captured_{index:04d}_wake.wav" for index in range(1, 25)])
+        self.assertEqual(trainer._audio_bucket_count(trainer.CAPTURED_DIR), 24)
+
+    def test_bucket_counts_are_cached_and_follow_writes(self):
+        kept = self.save_capture()
+        discarded = self.save_capture()
+        self.assertEqual(trainer._audio_bucket_count(trainer.CAPTURED_DIR), 2)
+        self.assertEqual(trainer._audio_bucket_count(trainer.NEGATIVE_DIR), 0)
+        self.assertEqual(trainer._audio_bucket_count(trainer.PERSONAL_DIR), 0)
+
+        with patch.object(trainer, "_indexed_audio_count", side_effect=AssertionError("count query")):
+            trainer._remove_audio_with_sidecar(trainer.CAPTURED_DIR / discarded)
+            self.assertEqual(trainer._audio_bucket_count(trainer.CAPTURED_DIR), 1)
+            self.save_capture()
+            self.assertEqual(trainer._audio_bucket_count(trainer.CAPTURED_DIR), 2)
+            result = trainer._move_captured_audio(
+                kept, trainer.NEGATIVE_DIR, target_prefix="negative", review_status="approved_negative"
+            )
+        self.assertEqual((result["captured_remaining"], result["negative_count"]), (1, 1))
+
+        (trainer.CAPTURED_DIR / "manual.wav").write_bytes(tone_wav_bytes())
+        os.utime(trainer.CAPTURED_DIR, ns=(1_000_000_000, 1_000_000_000))
+        self.assertEqual(trainer._audio_bucket_count(trainer.CAPTURED_DIR), 2)
+
+    def save_legacy_capture(self, name: str = "captured_legacy.wav") -> Path:
+        audio_path = trainer.CAPTURED_DIR / name
+        audio_path.write_bytes(tone_wav_bytes(amplitude=300))
+        trainer._write_sidecar_json(audio_path, {"saved_as": name, "event_type": "wake_detected"})
+        return audio_path
+
+    def test_listing_never_rewrites_legacy_captures(self):
+        audio_path = self.save_legacy_capture()
+        original = audio_path.read_bytes()
+
+        with patch.object(trainer, "_ensure_captured_playback_ready", side_effect=AssertionError("rewrite")):
+            listed = trainer.captured_audio()
+            item = trainer._captured_item_from_path(audio_path)
+
+        self.assertEqual([entry["saved_as"] for entry in listed["items"]], [audio_path.name])
+        self.assertEqual(item["saved_as"], audio_path.name)
+        self.assertEqual(audio_path.read_bytes(), original)
+
+    def test_legacy_captures_are_boosted_in_memory_when_served(self):
+        audio_path = self.save_legacy_capture()
+        original = audio_path.read_bytes()
+
+        response = trainer.audio_file("captured", audio_path.name, FakeRequest({}))
+
+        self.assertEqual(response.media_type, "audio/wav")
+        self.assertNotEqual(response.body, original)
+        self.assertGreater(trainer._inspect_wav_bytes(response.body)["duration_s"], 0)
+        self.assertEqual(audio_path.read_bytes(), original)
+
+        current = self.save_capture()
+        self.assertIsInstance(trainer.audio_file("captured", current, FakeRequest({})), trainer.FileResponse)
+
+    def test_audio_responses_carry_validators_and_answer_conditional_requests(self):
+        name = self.save_capture()
+        legacy = self.save_legacy_capture()
+
+        for file_name in (name, legacy.name):
+            with self.subTest(file_name=file_name):
+                first = trainer.audio_file("captured", file_name, FakeRequest({}))
+                etag = first.headers["etag"]
+                self.assertEqual(first.headers["cache-control"], "no-cache")
+
+                cached = trainer.audio_file("captured", file_name, FakeRequest({"if-none-match": f'"stale", {etag}'}))
+                self.assertEqual(cached.status_code, 304)
+                changed = trainer.audio_file("captured", file_name, FakeRequest({"if-none-match": '"stale"'}))
+                self.assertEqual(changed.status_code, 200)
+
+        response = trainer.audio_file("captured", name, FakeRequest({}))
+        self.assertEqual(response.headers["accept-ranges"], "bytes")
+        since = trainer.audio_file("captured", name, FakeRequest({"if-modified-since": response.headers["last-modified"]}))
+        self.assertEqual(since.status_code, 304)
+        older = trainer.audio_file("captured", name, FakeRequest({"if-modified-since": "Mon, 01 Jan 2001 00:00:00 GMT"}))
+        self.assertEqual(older.status_code, 200)
+
+    def test_migration_applies_capture_gain_once(self):
+        audio_path = self.save_legacy_capture()
+        self.save_capture()
+        original = audio_path.read_bytes()
+
+        self.assertEqual(trainer._migrate_legacy_capture_gain(), {"migrated": 1, "failed": 0})
+        migrated = audio_path.read_bytes()
+        self.assertNotEqual(migrated, original)
+        self.assertTrue(trainer._capture_gain_is_current(trainer._load_sidecar_json(audio_path)))
+
+        self.assertEqual(trainer._migrate_legacy_capture_gain(), {"migrated": 0, "failed": 0})
+        self.assertEqual(audio_path.read_bytes(), migrated)
+
+    def test_pcm_uploads_at_other_rates_are_resampled_without_ffmpeg(self):
+        output = io.BytesIO()
+        with wave.open(output, "wb") as wav_file:
+            wav_file.setnchannels(2)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(48000)
+            wav_file.writeframes(b"\x10\x00\xf0\xff" * 24000)
+        raw_pcm = b"\x20\x00\xe0\xff" * 11025
+
+        with patch.object(trainer, "_find_ffmpeg", side_effect=AssertionError("ffmpeg spawned")):
+            stereo = trainer._save_captured_sample(output.getvalue(), "stereo.wav")
+            raw = trainer._save_captured_sample(
+                trainer._pcm_s16le_to_wav_bytes(raw_pcm, sample_rate=22050),
+                "captured.raw.wav",
+            )
+
+        for result, duration in ((stereo, 0.5), (raw, 1.0)):
+            self.assertTrue(result["converted"])
+            self.assertEqual(result["final_format"]["sample_rate"], 16000)
+            self.assertEqual(result["final_format"]["channels"], 1)
+            self.assertAlmostEqual(result["final_format"]["duration_s"], duration, places=2)
+
+    def test_compressed_uploads_still_require_ffmpeg(self):
+        with patch.object(trainer, "_find_ffmpeg", return_value=None):
+            with self.assertRaisesRegex(RuntimeError, "ffmpeg is required"):
+                trainer._save_captured_sample(b"ID3\x04\x00not really an mp3", "clip.mp3")
+
+
+if __name__ == "__main__":
+    unittest.main()
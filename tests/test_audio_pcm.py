@@ -0,0 +1,103 @@
+import math
+import sys
+import unittest
+from array import array
+
+import numpy as np
+
+import audio_pcm
+
+
+class AudioPcmTests(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        values = rng.integers(-32768, 32768, size=4001).tolist() + [32767, -32768, 32760, -32761, 0]
+        self.reference = array("h", values)
+        if sys.byteorder != "little":
+            self.reference.byteswap()
+        self.raw = self.reference.tobytes()
+        if sys.byteorder != "little":
+            self.reference.byteswap()
+
+    def test_metrics_match_the_pure_python_definitions(self):
+        samples = audio_pcm.pcm16_from_bytes(self.raw)
+        reference = self.reference
+
+        self.assertEqual(samples.tolist(), reference.tolist())
+        self.assertAlmostEqual(audio_pcm.peak_ratio(samples), max(abs(value) for value in reference) / 32767.0)
+        self.assertAlmostEqual(
+            audio_pcm.rms_ratio(samples),
+            math.sqrt(sum(value * value for value in reference) / len(reference)) / 32767.0,
+        )
+        self.assertAlmostEqual(
+            audio_pcm.clip_ratio(samples),
+            sum(1 for value in reference if abs(value) >= 32760) / len(reference),
+        )
+
+    def test_gain_rounds_and_saturates_like_the_scalar_loop(self):
+        samples = audio_pcm.pcm16_from_bytes(self.raw)
+        for gain in (0.5, 1.37, 220.0):
+            expected = [max(-32768, min(32767, int(round(value * gain)))) for value in self.reference]
+            self.assertEqual(audio_pcm.apply_gain(samples, gain).tolist(), expected)
+
+    def test_bytes_round_trip_and_empty_input(self):
+        samples = audio_pcm.pcm16_from_bytes(self.raw)
+        self.assertEqual(audio_pcm.pcm16_to_bytes(samples), self.raw)
+        self.assertEqual(audio_pcm.pcm16_from_bytes(self.raw + b"\x01").size, samples.size)
+
+        empty = audio_pcm.pcm16_from_bytes(b"")
+        self.assertEqual((audio_pcm.peak_ratio(empty), audio_pcm.rms_ratio(empty), audio_pcm.clip_ratio(empty)), (0.0, 0.0, 0.0))
+
+    def test_wav_decoding_covers_wide_float_and_extensible_formats(self):
+        tone = np.sin(2 * np.pi * 440 * np.arange(800) / 8000).astype(np.float32) * 0.5
+
+        def riff(format_tag, bits, payload, channels=1, extensible=False):
+            block = channels * bits // 8
+            fmt = (
+                (0xFFFE if extensible else format_tag).to_bytes(2, "little")
+                + channels.to_bytes(2, "little")
+                + (8000).to_bytes(4, "little")
+                + (8000 * block).to_bytes(4, "little")
+                + block.to_bytes(2, "little")
+                + bits.to_bytes(2, "little")
+            )
+            if extensible:
+                fmt += (22).to_bytes(2, "little") + bits.to_bytes(2, "little") + (0).to_bytes(4, "little")
+                fmt += format_tag.to_bytes(2, "little") + bytes(14)
+            chunks = b"fmt " + len(fmt).to_bytes(4, "little") + fmt + b"data" + len(payload).to_bytes(4, "little") + payload
+            return b"RIFF" + (4 + len(chunks)).to_bytes(4, "little") + b"WAVE" + chunks
+
+        int24 = np.rint(tone * (1 << 23)).astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+        cases = {
+            "pcm24": riff(1, 24, int24),
+            "float32": riff(3, 32, tone.astype("<f4").tobytes()),
+            "extensible16": riff(1, 16, np.rint(tone * 32767).astype("<i2").tobytes(), extensible=True),
+        }
+        for name, data in cases.items():
+            with self.subTest(name):
+                frames, rate = audio_pcm.decode_wav(data)
+                self.assertEqual((frames.shape, rate), ((800, 1), 8000))
+                np.testing.assert_allclose(frames[:, 0], tone, atol=1e-4)
+
+        self.assertIsNone(audio_pcm.decode_wav(riff(2, 4, b"\x00" * 16)))
+        self.assertIsNone(audio_pcm.decode_wav(b"ID3\x04not a wav"))
+
+    def test_resampling_preserves_in_band_tones_and_rejects_aliases(self):
+        for source_rate in (8000, 22050, 44100, 48000):
+            with self.subTest(source_rate=source_rate):
+                source = np.arange(source_rate) / source_rate
+                result = audio_pcm.resample(0.5 * np.sin(2 * np.pi * 1000 * source), source_rate, 16000)
+                expected = 0.5 * np.sin(2 * np.pi * 1000 * np.arange(result.size) / 16000)
+                self.assertEqual(result.size, 16000)
+                np.testing.assert_allclose(result[200:-200], expected[200:-200], atol=1e-3)
+
+        alias = audio_pcm.resample(0.5 * np.sin(2 * np.pi * 10000 * np.arange(48000) / 48000), 48000, 16000)
+        self.assertLess(float(np.sqrt(np.mean(alias[200:-200] ** 2))), 1e-3)
+
+        stereo = np.stack([np.full(4, 0.5, dtype=np.float32), np.full(4, -0.25, dtype=np.float32)], axis=1)
+        np.testing.assert_allclose(audio_pcm.downmix(stereo), np.full(4, 0.125))
+        self.assertEqual(audio_pcm.float_to_pcm16(np.array([1.5, -1.0, 32767 / 32768])).tolist(), [32767, -32768, 32767])
+
+
+if __name__ == "__main__":
+    unittest.main()
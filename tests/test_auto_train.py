@@ -1,8 +1,11 @@
+import asyncio
+import hashlib
 import io
 import json
 import queue
 import sys
 import tempfile
+import threading
 import unittest
 import wave
 from pathlib import Path
@@ -44,6 +47,8 @@ class AutoTrainTests(unittest.TestCase):
             trainer.AUTO_TRAIN_CONFIG_FILE,
             trainer.AUTO_TRAIN_STATE_FILE,
             trainer.AUTO_TRAIN_MODEL_DIR,
+            trainer.AUDIO_INDEX_FILE,
+            trainer.TRAINED_WAKE_WORD_INDEX_FILE,
         )
         trainer.CAPTURED_DIR = root / "captured_audio"
         trainer.NEGATIVE_DIR = root / "negative_samples"
@@ -51,6 +56,9 @@ class AutoTrainTests(unittest.TestCase):
         trainer.AUTO_TRAIN_CONFIG_FILE = root / "auto_train_config.json"
         trainer.AUTO_TRAIN_STATE_FILE = root / "auto_train_state.json"
         trainer.AUTO_TRAIN_MODEL_DIR = root / "auto_train_models"
+        trainer.AUDIO_INDEX_FILE = root / ".cache" / "audio_index.sqlite3"
+        trainer.TRAINED_WAKE_WORD_INDEX_FILE = root / ".cache" / "trained_wake_words_index.json"
+        trainer.TRAINED_WAKE_WORD_INDEX.clear()
         for directory in (trainer.CAPTURED_DIR, trainer.NEGATIVE_DIR, trainer.PERSONAL_DIR):
             directory.mkdir(parents=True)
 
@@ -64,6 +72,7 @@ class AutoTrainTests(unittest.TestCase):
                     "wake_phrase": "hey tater",
                     "language": "en",
                     "tater_url": "http://127.0.0.1:8501",
+                    "vad_gate_enabled": False,
                 }
             )
         )
@@ -71,6 +80,7 @@ class AutoTrainTests(unittest.TestCase):
         trainer.AUTO_TRAIN_STATE.update(trainer.AUTO_TRAIN_DEFAULT_STATE)
 
     def tearDown(self):
+        trainer._flush_auto_train_state()
         (
             trainer.CAPTURED_DIR,
             trainer.NEGATIVE_DIR,
@@ -78,11 +88,21 @@ class AutoTrainTests(unittest.TestCase):
             trainer.AUTO_TRAIN_CONFIG_FILE,
             trainer.AUTO_TRAIN_STATE_FILE,
             trainer.AUTO_TRAIN_MODEL_DIR,
+            trainer.AUDIO_INDEX_FILE,
+            trainer.TRAINED_WAKE_WORD_INDEX_FILE,
         ) = self.original_paths
+        trainer.TRAINED_WAKE_WORD_INDEX.clear()
+        trainer._close_audio_index()
         trainer.AUTO_TRAIN_CONFIG.clear()
         trainer.AUTO_TRAIN_CONFIG.update(self.original_config)
         trainer.AUTO_TRAIN_STATE.clear()
         trainer.AUTO_TRAIN_STATE.update(self.original_state)
+        trainer.FASTER_WHISPER_MODEL_CACHE.clear()
+        trainer.PARAKEET_ONNX_MODEL_CACHE.clear()
+        with trainer.STT_RESIDENCY_LOCK:
+            trainer.STT_MODEL_RESIDENCY.clear()
+            trainer.STT_MODEL_FOOTPRINTS.clear()
+            trainer.STT_MODEL_EVENTS.clear()
         self.clear_review_queue()
         self.tempdir.cleanup()
 
@@ -321,6 +341,210 @@ class AutoTrainTests(unittest.TestCase):
         self.assertEqual(sample_item["auto_review_stt_model"], "small.en")
         self.assertEqual(trainer.AUTO_TRAIN_STATE["pending_negative_count"], 1)
 
+    def test_review_commits_one_sidecar_write_and_debounces_state(self):
+        self.add_capture()
+        with (
+            patch.object(trainer, "AUTO_TRAIN_STATE_SAVE_DELAY_SECONDS", 60.0),
+            patch.object(trainer, "_transcribe_capture", return_value="turn on the kitchen lights"),
+            patch.object(trainer, "_write_sidecar_json", wraps=trainer._write_sidecar_json) as write_sidecar,
+        ):
+            trainer._auto_review_capture("wake.wav")
+
+        self.assertEqual(write_sidecar.call_count, 1)
+        self.assertFalse(trainer.AUTO_TRAIN_RUNTIME["review_running"])
+        self.assertEqual(trainer.AUTO_TRAIN_RUNTIME["review_file"], "")
+        self.assertEqual(write_sidecar.call_args.args[0].parent, trainer.NEGATIVE_DIR)
+        self.assertFalse(list(trainer.CAPTURED_DIR.iterdir()))
+        self.assertFalse(trainer.AUTO_TRAIN_STATE_FILE.exists())
+
+        trainer._flush_auto_train_state()
+        persisted = json.loads(trainer.AUTO_TRAIN_STATE_FILE.read_text(encoding="utf-8"))
+        self.assertEqual(persisted["pending_negative_count"], 1)
+        self.assertEqual(persisted["last_review_result"], "approved_negative")
+        self.assertIsNone(trainer.AUTO_TRAIN_STATE_SAVE_TIMER)
+
+    def test_review_skips_a_capture_that_changed_during_stt(self):
+        audio_path = self.add_capture()
+
+        def transcribe_while_trimmed(path, **_kwargs):
+            path.write_bytes(silent_wav_bytes(0.1))
+            trainer._write_sidecar_json(path, {**trainer._load_sidecar_json(path), "trimmed": True})
+            return "turn on the kitchen lights"
+
+        with patch.object(trainer, "_transcribe_capture", side_effect=transcribe_while_trimmed):
+            changed = trainer._auto_review_captures(["wake.wav"])
+
+        self.assertEqual(changed, ["wake.wav"])
+        metadata = trainer._load_sidecar_json(audio_path)
+        self.assertTrue(metadata["trimmed"])
+        self.assertNotIn("auto_review_status", metadata)
+        self.assertFalse(list(trainer.NEGATIVE_DIR.iterdir()))
+        self.assertEqual(trainer.AUTO_TRAIN_STATE["last_review_result"], "")
+
+        with patch.object(trainer, "_transcribe_capture", return_value="hey tater turn on the lights"):
+            self.assertEqual(trainer._auto_review_captures(["wake.wav"]), [])
+
+        metadata = trainer._load_sidecar_json(audio_path)
+        self.assertTrue(metadata["trimmed"])
+        self.assertEqual(metadata["auto_review_status"], "wake_phrase_detected")
+
+    def test_review_batch_shares_one_stt_call_and_sorts_each_capture(self):
+        for name in ("a.wav", "b.wav", "c.wav"):
+            self.add_capture(name)
+        self.add_capture("other.wav", wake_word="okay nabu")
+        transcripts = {
+            "a.wav": "turn on the kitchen lights",
+            "b.wav": "hey tater what time is it",
+            "c.wav": "",
+        }
+
+        def transcribe_batch(audio_paths, **_kwargs):
+            return [transcripts[path.name] for path in audio_paths]
+
+        with patch.object(trainer, "_transcribe_captures", side_effect=transcribe_batch) as transcribe:
+            trainer._auto_review_captures(["a.wav", "b.wav", "c.wav", "other.wav"])
+
+        transcribe.assert_called_once()
+        self.assertEqual([path.name for path in transcribe.call_args.args[0]], ["a.wav", "b.wav", "c.wav"])
+        self.assertEqual(len(list(trainer.NEGATIVE_DIR.glob("*.wav"))), 1)
+        statuses = {
+            name: trainer._load_sidecar_json(trainer.CAPTURED_DIR / name).get("auto_review_status")
+            for name in ("b.wav", "c.wav", "other.wav")
+        }
+        self.assertEqual(
+            statuses,
+            {"b.wav": "wake_phrase_detected", "c.wav": "no_speech", "other.wav": "different_wake_phrase"},
+        )
+        self.assertFalse(trainer.AUTO_TRAIN_RUNTIME["review_running"])
+        self.assertEqual(trainer.AUTO_TRAIN_RUNTIME["review_file"], "")
+
+    def test_vad_gate_skips_stt_for_captures_without_speech(self):
+        trainer.AUTO_TRAIN_CONFIG["vad_gate_enabled"] = True
+        self.add_capture("speech.wav")
+        noise_path = self.add_capture("noise.wav")
+        noise_path.write_bytes(silent_wav_bytes(0.5))
+
+        def detect(samples):
+            return [] if samples.shape[0] > 16000 * 0.25 else [{"start": 0.0, "end": 0.2}]
+
+        with (
+            patch.object(trainer, "_detect_speech_in_samples", side_effect=detect),
+            patch.object(trainer, "_transcribe_captures", return_value=["hey tater"]) as transcribe,
+        ):
+            trainer._auto_review_captures(["speech.wav", "noise.wav"])
+
+        self.assertEqual([path.name for path in transcribe.call_args.args[0]], ["speech.wav"])
+        noise = trainer._load_sidecar_json(noise_path)
+        speech = trainer._load_sidecar_json(trainer.CAPTURED_DIR / "speech.wav")
+        self.assertEqual(noise["auto_review_status"], "no_speech")
+        self.assertEqual((noise["auto_review_speech_ms"], noise["auto_review_speech_ratio"]), (0, 0.0))
+        self.assertEqual(speech["auto_review_status"], "wake_phrase_detected")
+        self.assertEqual(speech["auto_review_speech_ratio"], 0.8)
+        runtime = trainer._auto_train_status_payload()["runtime"]
+        self.assertEqual(runtime["vad_skipped_clips"], 1)
+        self.assertEqual(trainer.AUTO_TRAIN_STATE["review_stt_clips"], 1)
+        self.assertEqual(trainer.AUTO_TRAIN_STATE["review_vad_clips"], 2)
+        self.assertIn("stt_seconds_saved", runtime)
+
+    def test_vad_gate_sends_an_undecodable_capture_to_stt_and_gates_the_rest(self):
+        trainer.AUTO_TRAIN_CONFIG["vad_gate_enabled"] = True
+        self.add_capture("noise.wav").write_bytes(silent_wav_bytes(0.5))
+        self.add_capture("broken.wav").write_bytes(b"RIFF not a wav")
+        trainer.AUTO_TRAIN_RUNTIME["vad_gate_error"] = ""
+
+        with (
+            patch.object(trainer, "_detect_speech_in_samples", return_value=[]) as detect,
+            patch.object(trainer, "_transcribe_captures", return_value=["hey tater"]) as transcribe,
+        ):
+            trainer._auto_review_captures(["noise.wav", "broken.wav"])
+
+        detect.assert_called_once()
+        self.assertEqual([path.name for path in transcribe.call_args.args[0]], ["broken.wav"])
+        self.assertEqual(trainer._load_sidecar_json(trainer.CAPTURED_DIR / "noise.wav")["auto_review_status"], "no_speech")
+        broken = trainer._load_sidecar_json(trainer.CAPTURED_DIR / "broken.wav")
+        self.assertEqual(broken["auto_review_status"], "wake_phrase_detected")
+        self.assertNotIn("auto_review_speech_ms", broken)
+        self.assertEqual(trainer.AUTO_TRAIN_RUNTIME["vad_gate_error"], "")
+
+    def test_failed_review_batch_retries_each_capture_alone(self):
+        self.add_capture("good.wav")
+        self.add_capture("bad.wav")
+
+        def transcribe_one(audio_path, **_kwargs):
+            if audio_path.name == "bad.wav":
+                raise RuntimeError("corrupt clip")
+            return "hey tater"
+
+        with (
+            patch.object(trainer, "_transcribe_captures", side_effect=RuntimeError("batch failed")),
+            patch.object(trainer, "_transcribe_capture", side_effect=transcribe_one),
+        ):
+            trainer._auto_review_captures(["good.wav", "bad.wav"])
+
+        good = trainer._load_sidecar_json(trainer.CAPTURED_DIR / "good.wav")
+        bad = trainer._load_sidecar_json(trainer.CAPTURED_DIR / "bad.wav")
+        self.assertEqual(good["auto_review_status"], "wake_phrase_detected")
+        self.assertEqual((bad["auto_review_status"], bad["auto_review_error"]), ("error", "corrupt clip"))
+
+    def test_review_transcribes_without_holding_the_data_lock(self):
+        audio_path = self.add_capture()
+        lock_free_during_stt = []
+
+        def transcribe_and_probe(audio_paths, **_kwargs):
+            def probe():
+                acquired = trainer.DATA_MANAGEMENT_LOCK.acquire(timeout=1.0)
+                lock_free_during_stt.append(acquired)
+                if acquired:
+                    trainer.DATA_MANAGEMENT_LOCK.release()
+
+            thread = threading.Thread(target=probe)
+            thread.start()
+            thread.join()
+            audio_path.unlink()
+            return ["turn on the kitchen lights"]
+
+        with patch.object(trainer, "_transcribe_captures", side_effect=transcribe_and_probe):
+            trainer._auto_review_captures(["wake.wav"])
+
+        self.assertEqual(lock_free_during_stt, [True])
+        self.assertFalse(list(trainer.NEGATIVE_DIR.iterdir()))
+        self.assertEqual(trainer.AUTO_TRAIN_STATE["pending_negative_count"], 0)
+        self.assertEqual(trainer.AUTO_TRAIN_STATE["last_review_result"], "")
+
+    def test_review_workers_transcribe_in_parallel(self):
+        for name in ("a.wav", "b.wav"):
+            self.add_capture(name)
+        both_transcribing = threading.Barrier(2, timeout=5.0)
+
+        def transcribe_together(audio_paths, **_kwargs):
+            both_transcribing.wait()
+            return ["turn on the kitchen lights"] * len(audio_paths)
+
+        workers = [threading.Thread(target=trainer._auto_review_worker_loop) for _ in range(2)]
+        with (
+            patch.object(trainer, "AUTO_TRAIN_REVIEW_BATCH_SIZE", 1),
+            patch.object(trainer, "_transcribe_captures", side_effect=transcribe_together),
+        ):
+            for name in ("a.wav", "b.wav"):
+                trainer._queue_auto_review(name)
+            for worker in workers:
+                worker.start()
+            trainer.AUTO_TRAIN_REVIEW_QUEUE.join()
+            trainer.AUTO_TRAIN_STOP_EVENT.set()
+            for _worker in workers:
+                trainer.AUTO_TRAIN_REVIEW_QUEUE.put("")
+            for worker in workers:
+                worker.join(timeout=5.0)
+        trainer.AUTO_TRAIN_STOP_EVENT.clear()
+
+        self.assertFalse(any(worker.is_alive() for worker in workers))
+
+        self.assertFalse(both_transcribing.broken)
+        self.assertEqual(len(list(trainer.NEGATIVE_DIR.glob("*.wav"))), 2)
+        self.assertEqual(trainer.AUTO_TRAIN_STATE["pending_negative_count"], 2)
+        self.assertEqual(trainer.AUTO_TRAIN_RUNTIME["reviews_in_flight"], 0)
+        self.assertFalse(trainer.AUTO_TRAIN_QUEUED_FILES)
+
     def test_matching_phrase_stays_in_manual_review_inbox(self):
         audio_path = self.add_capture()
         with patch.object(trainer, "_transcribe_capture", return_value="hey tater turn on the lights"):
@@ -358,6 +582,7 @@ class AutoTrainTests(unittest.TestCase):
         guided.assert_called_once()
         guided_args, guided_kwargs = guided.call_args
         self.assertEqual(guided_args[0].resolve(), audio_path.resolve())
+        self.assertEqual(guided_kwargs.pop("samples").shape, (4000,))
         self.assertEqual(
             guided_kwargs,
             {
@@ -367,6 +592,87 @@ class AutoTrainTests(unittest.TestCase):
             },
         )
 
+    def test_close_transcript_is_confirmed_by_wake_phrase_scoring(self):
+        self.add_capture("close.wav")
+        self.add_capture("far.wav").write_bytes(silent_wav_bytes(0.3))
+        scores = {"close.wav": 0.82, "far.wav": 0.2}
+        trainer.AUTO_TRAIN_CONFIG["close_match_check"] = "score"
+        with (
+            patch.object(trainer, "_transcribe_captures", return_value=["Hey, haters.", "Hey, haters."]),
+            patch.object(
+                trainer,
+                "_score_wake_phrase_with_faster_whisper",
+                side_effect=lambda audio_path, **_kwargs: scores[audio_path.name],
+            ) as score,
+            patch.object(trainer, "_transcribe_capture_with_faster_whisper_guided") as guided,
+        ):
+            trainer._auto_review_captures(["close.wav", "far.wav"])
+
+        guided.assert_not_called()
+        self.assertEqual(score.call_count, 2)
+        self.assertEqual(score.call_args.kwargs["transcript"], "Hey, haters.")
+        self.assertEqual(score.call_args.kwargs["wake_phrase"], "hey tater")
+        close = trainer._load_sidecar_json(trainer.CAPTURED_DIR / "close.wav")
+        far = trainer._load_sidecar_json(trainer.CAPTURED_DIR / "far.wav")
+        self.assertEqual(
+            (close["auto_review_status"], close["auto_review_match_method"], close["auto_review_phrase_confidence"]),
+            ("wake_phrase_detected", "scored_close_match", 0.82),
+        )
+        self.assertEqual((far["auto_review_status"], far["auto_review_phrase_confidence"]), ("wake_phrase_ambiguous", 0.2))
+
+    def test_wake_phrase_score_compares_aligned_phrase_with_free_transcript(self):
+        import numpy as np
+
+        class FakeTokenizer:
+            sot_sequence = (50, 51)
+
+            def __init__(self, _hf_tokenizer, multilingual, *, task, language):
+                pass
+
+            def encode(self, text):
+                return {" hey tater": [1, 2], " Hey, haters.": [1, 3, 4]}[text]
+
+        probabilities = {(1, 2): [0.5, 0.2], (1, 3, 4): [0.5, 0.4, 0.8]}
+        encode = Mock(return_value="encoded")
+        align = Mock(
+            side_effect=lambda _encoded, _start, texts, _frames: [
+                SimpleNamespace(text_token_probs=probabilities[tuple(texts[0])])
+            ]
+        )
+        fake_model = SimpleNamespace(
+            feature_extractor=Mock(side_effect=lambda audio: np.zeros((80, audio.shape[0] // 160 + 1))),
+            hf_tokenizer=object(),
+            model=SimpleNamespace(is_multilingual=False, encode=encode, align=align),
+        )
+        fake_model.feature_extractor.n_samples = 16000 * 30
+        fake_model.feature_extractor.nb_max_frames = 3000
+        fake_model.feature_extractor.hop_length = 160
+        fake_modules = {
+            "ctranslate2": SimpleNamespace(StorageView=SimpleNamespace(from_array=lambda array: array)),
+            "faster_whisper": SimpleNamespace(),
+            "faster_whisper.tokenizer": SimpleNamespace(Tokenizer=FakeTokenizer),
+        }
+        with (
+            patch.dict(sys.modules, fake_modules),
+            patch.object(trainer, "_resolve_faster_whisper_runtime", return_value=("cpu", "int8")),
+            patch.object(trainer, "_load_faster_whisper_model", return_value=fake_model),
+        ):
+            confidence = trainer._score_wake_phrase_with_faster_whisper(
+                Path("wake.wav"),
+                model="small.en",
+                language="en",
+                wake_phrase="Hey_Tater",
+                transcript="Hey, haters.",
+                samples=np.zeros(8000, dtype=np.float32),
+            )
+
+        encode.assert_called_once()
+        self.assertEqual(encode.call_args.args[0].shape, (1, 80, 3000))
+        self.assertEqual(align.call_count, 2)
+        self.assertEqual(align.call_args.args[3], [50])
+        self.assertEqual(align.call_args.args[2], [[1, 3, 4]])
+        self.assertAlmostEqual(confidence, (0.5 * 0.2) ** (1 / 2) / (0.5 * 0.4 * 0.8) ** (1 / 3))
+
     def test_unconfirmed_close_transcript_stays_for_manual_review(self):
         audio_path = self.add_capture()
         with (
@@ -390,6 +696,55 @@ class AutoTrainTests(unittest.TestCase):
         self.assertEqual(trainer._queue_pending_auto_reviews(), 0)
         self.assertEqual(trainer._queue_pending_auto_reviews(force=True), 1)
 
+    def test_forced_rereview_reuses_cached_transcripts_for_unchanged_audio(self):
+        audio_path = self.add_capture()
+        with (
+            patch.object(trainer, "_transcribe_capture", return_value="Hate hater."),
+            patch.object(trainer, "_transcribe_capture_with_faster_whisper_guided", return_value="Hate hater."),
+        ):
+            trainer._auto_review_capture("wake.wav")
+
+        self.assertEqual(trainer._queue_pending_auto_reviews(force=True), 1)
+        with (
+            patch.object(trainer, "_transcribe_capture") as transcribe,
+            patch.object(trainer, "_transcribe_capture_with_faster_whisper_guided") as guided,
+        ):
+            trainer._auto_review_capture("wake.wav")
+
+        transcribe.assert_not_called()
+        guided.assert_not_called()
+        metadata = trainer._load_sidecar_json(audio_path)
+        self.assertEqual(metadata["auto_review_status"], "wake_phrase_ambiguous")
+        self.assertEqual(metadata["auto_review_guided_transcript"], "Hate hater.")
+        self.assertTrue(metadata["auto_review_cached_transcript"])
+        self.assertEqual(trainer.AUTO_TRAIN_STATE["review_transcript_cache_hits"], 1)
+
+        audio_path.write_bytes(silent_wav_bytes(0.5))
+        metadata.pop("auto_review_status")
+        trainer._write_sidecar_json(audio_path, metadata)
+        with patch.object(trainer, "_transcribe_capture", return_value="") as transcribe:
+            trainer._auto_review_capture("wake.wav")
+
+        transcribe.assert_called_once()
+        self.assertEqual(trainer._load_sidecar_json(audio_path)["auto_review_status"], "no_speech")
+
+    def test_wake_phrase_change_reevaluates_cached_transcripts_without_stt(self):
+        audio_path = self.add_capture(wake_word="")
+        with patch.object(trainer, "_transcribe_capture", return_value="hey tater lights"):
+            trainer._auto_review_capture("wake.wav")
+        self.assertEqual(trainer._load_sidecar_json(audio_path)["auto_review_status"], "wake_phrase_detected")
+
+        self.assertEqual(trainer.update_auto_train({"wake_phrase": "okay nabu"})["queued"], 1)
+        with patch.object(trainer, "_transcribe_captures") as transcribe:
+            trainer._auto_review_captures(trainer._take_auto_review_batch(8))
+
+        transcribe.assert_not_called()
+        self.assertFalse(audio_path.exists())
+        negative_path = next(trainer.NEGATIVE_DIR.glob("*.wav"))
+        negative = trainer._load_sidecar_json(negative_path)
+        self.assertEqual(negative["auto_review_wake_phrase"], "okay nabu")
+        self.assertEqual(negative["transcript"], "hey tater lights")
+
     def test_close_parakeet_transcript_stays_for_manual_review(self):
         audio_path = self.add_capture()
         trainer.AUTO_TRAIN_CONFIG["stt_engine"] = trainer.STT_ENGINE_PARAKEET_ONNX
@@ -406,6 +761,29 @@ class AutoTrainTests(unittest.TestCase):
         self.assertEqual(metadata["auto_review_status"], "wake_phrase_ambiguous")
         self.assertEqual(metadata["auto_review_stt_engine"], "parakeet_onnx")
 
+    def test_review_decodes_each_capture_once_for_vad_and_stt(self):
+        trainer.AUTO_TRAIN_CONFIG.update({"stt_engine": trainer.STT_ENGINE_PARAKEET_ONNX, "vad_gate_enabled": True})
+        for name in ("a.wav", "b.wav"):
+            self.add_capture(name)
+        parakeet = SimpleNamespace(recognize=Mock(return_value=["hey tater", "hey tater lights"]))
+        with (
+            patch.object(trainer, "_detect_speech_in_samples", return_value=[{"start": 0.0, "end": 0.25}]) as vad,
+            patch.object(trainer, "_load_parakeet_onnx_model", return_value=parakeet),
+            patch.object(trainer, "_parakeet_onnx_providers", return_value=["CPUExecutionProvider"]),
+            patch.object(trainer, "_wav_bytes_float32", wraps=trainer._wav_bytes_float32) as decode,
+            patch.object(trainer, "_normalized_wav_float32") as decode_from_disk,
+        ):
+            trainer._auto_review_captures(["a.wav", "b.wav"])
+
+        self.assertEqual(decode.call_count, 2)
+        decode_from_disk.assert_not_called()
+        waveforms = parakeet.recognize.call_args.args[0]
+        self.assertIs(waveforms[0], vad.call_args_list[0].args[0])
+        self.assertEqual(
+            trainer._load_sidecar_json(trainer.CAPTURED_DIR / "b.wav")["auto_review_status"],
+            "wake_phrase_detected",
+        )
+
     def test_matching_phrase_is_deleted_when_cleanup_is_enabled(self):
         audio_path = self.add_capture()
         trainer.AUTO_TRAIN_CONFIG["delete_confirmed_wakes"] = True
@@ -542,6 +920,112 @@ class AutoTrainTests(unittest.TestCase):
         start.assert_called_once_with()
         self.assertTrue(trainer.AUTO_TRAIN_STATE["next_run_at"])
 
+    def test_scheduler_sleeps_until_the_next_run_instead_of_polling(self):
+        trainer.AUTO_TRAIN_CONFIG["schedule_hours"] = 24
+        trainer.AUTO_TRAIN_STATE["next_run_at"] = (trainer._utc_now() + trainer.timedelta(hours=2)).isoformat()
+        delay = trainer._maybe_run_scheduled_auto_training()
+        self.assertGreater(delay, 7000)
+        self.assertLessEqual(delay, 7200)
+
+        trainer.AUTO_TRAIN_CONFIG["schedule_hours"] = 0
+        self.assertIsNone(trainer._maybe_run_scheduled_auto_training())
+
+    def take_review_batch(self, limit=8):
+        batch = trainer._take_auto_review_batch(limit)
+        for _file_name in batch:
+            trainer.AUTO_TRAIN_REVIEW_QUEUE.task_done()
+        return batch
+
+    def review_queue_rows(self):
+        with trainer.AUDIO_INDEX_LOCK:
+            return {
+                name: (state, attempts)
+                for name, state, attempts in trainer._audio_index_connection().execute(
+                    "SELECT name, state, attempts FROM review_queue"
+                )
+            }
+
+    def test_review_queue_survives_restart_in_priority_order(self):
+        trainer.AUTO_TRAIN_CONFIG["promote_close_misses"] = True
+        self.add_capture("a.wav")
+        self.add_capture("b.wav", event_type="close_miss")
+        self.add_capture("c.wav", event_type="false_trigger")
+        self.assertEqual(trainer._queue_pending_auto_reviews(), 3)
+
+        self.clear_review_queue()
+        trainer._close_audio_index()
+        with (
+            patch.object(trainer, "_queue_pending_auto_reviews") as scan,
+            patch.object(trainer, "_load_sidecar_json") as read_sidecar,
+        ):
+            self.assertEqual(trainer._restore_auto_review_queue(), 3)
+        scan.assert_not_called()
+        read_sidecar.assert_not_called()
+
+        batch = self.take_review_batch(2)
+        self.assertEqual(batch, ["c.wav", "a.wav"])
+        self.assertEqual(self.review_queue_rows()["c.wav"], ("in_flight", 1))
+        trainer._finish_auto_reviews(batch)
+        self.assertEqual(self.take_review_batch(), ["b.wav"])
+        self.assertEqual(
+            self.review_queue_rows(),
+            {"a.wav": ("done", 1), "b.wav": ("in_flight", 1), "c.wav": ("done", 1)},
+        )
+
+    def test_review_left_in_flight_by_a_dead_process_is_requeued_on_restart(self):
+        self.add_capture()
+        self.assertEqual(trainer._queue_pending_auto_reviews(), 1)
+        self.assertEqual(self.take_review_batch(), ["wake.wav"])
+        # Still held by this process, so neither a restore nor the lease check reclaims it.
+        self.assertEqual(trainer._restore_auto_review_queue(), 0)
+        delay = trainer._requeue_expired_auto_reviews()
+        self.assertIsNone(delay)
+        self.assertEqual(self.review_queue_rows(), {"wake.wav": ("in_flight", 1)})
+
+        # A new process starts with nothing in memory and does not wait out the lease.
+        self.clear_review_queue()
+        self.assertEqual(trainer._restore_auto_review_queue(), 1)
+        self.assertEqual(self.review_queue_rows(), {"wake.wav": ("queued", 1)})
+        self.assertEqual(self.take_review_batch(), ["wake.wav"])
+        self.assertEqual(self.review_queue_rows(), {"wake.wav": ("in_flight", 2)})
+
+    def test_review_lost_by_this_process_is_requeued_after_its_lease(self):
+        self.add_capture()
+        self.assertEqual(trainer._queue_pending_auto_reviews(), 1)
+        self.assertEqual(self.take_review_batch(), ["wake.wav"])
+        self.clear_review_queue()
+        delay = trainer._requeue_expired_auto_reviews()
+        self.assertGreater(delay, trainer.AUTO_TRAIN_REVIEW_LEASE_SECONDS - 60)
+        self.assertLessEqual(delay, trainer.AUTO_TRAIN_REVIEW_LEASE_SECONDS)
+
+        with trainer.AUDIO_INDEX_LOCK:
+            connection = trainer._audio_index_connection()
+            with connection:
+                connection.execute("UPDATE review_queue SET lease_expires_ns = 1")
+        self.assertIsNone(trainer._requeue_expired_auto_reviews())
+        self.assertEqual(self.take_review_batch(), ["wake.wav"])
+        self.assertEqual(self.review_queue_rows(), {"wake.wav": ("in_flight", 2)})
+
+    def test_review_worker_records_queue_to_start_latency(self):
+        self.add_capture()
+        trainer.AUTO_TRAIN_QUEUE_LATENCIES.clear()
+        worker = threading.Thread(target=trainer._auto_review_worker_loop)
+        with patch.object(trainer, "_transcribe_captures", return_value=["turn on the kitchen lights"]):
+            worker.start()
+            trainer._queue_auto_review("wake.wav")
+            trainer.AUTO_TRAIN_REVIEW_QUEUE.join()
+            trainer.AUTO_TRAIN_STOP_EVENT.set()
+            trainer.AUTO_TRAIN_REVIEW_QUEUE.put("")
+            worker.join(timeout=5.0)
+        trainer.AUTO_TRAIN_STOP_EVENT.clear()
+
+        self.assertFalse(worker.is_alive())
+        runtime = trainer._auto_train_status_payload()["runtime"]
+        self.assertEqual(runtime["review_queue_depth"], 0)
+        self.assertEqual(runtime["review_queue_latency_ms"]["samples"], 1)
+        self.assertLess(runtime["review_queue_latency_ms"]["max"], 1000)
+        trainer.AUTO_TRAIN_QUEUE_LATENCIES.clear()
+
     def test_tater_notification_sets_new_word_globally_with_token(self):
         trainer.AUTO_TRAIN_CONFIG.update(
             {
@@ -614,6 +1098,51 @@ class AutoTrainTests(unittest.TestCase):
             )
         )
 
+    def test_trained_word_index_serves_artifacts_until_a_watched_directory_changes(self):
+        root = Path(self.tempdir.name)
+        run_dir = root / "output" / "20260101_000000"
+        run_dir.mkdir(parents=True)
+        (run_dir / "hey_tater.tflite").write_bytes(b"model")
+        (run_dir / "hey_tater.json").write_text(
+            json.dumps({"wake_word": "hey tater", "model": "hey_tater.tflite"}), encoding="utf-8"
+        )
+        trained_dir = root / "trained_wake_words"
+        with patch.object(trainer, "DATA_DIR", root), patch.object(trainer, "TRAINED_WAKE_WORDS_DIR", trained_dir):
+            trainer._trained_wake_word_index(force=True)
+            self.assertTrue((trained_dir / "hey_tater.tflite").is_file())
+
+            with patch.object(trainer, "_sync_trained_wake_word_artifacts") as sync:
+                rows = trainer._list_trained_wake_words("http://trainer")
+                response = trainer.trained_wake_word_artifact("hey_tater.tflite", SimpleNamespace(headers={}))
+                sync.assert_not_called()
+            self.assertEqual([row["key"] for row in rows], ["hey_tater"])
+            self.assertEqual(Path(response.path).name, "hey_tater.tflite")
+            self.assertEqual(response.headers["etag"], f'"{hashlib.sha256(b"model").hexdigest()}"')
+            cached = trainer.trained_wake_word_artifact(
+                "hey_tater.tflite", SimpleNamespace(headers={"if-none-match": response.headers["etag"]})
+            )
+            self.assertEqual(cached.status_code, 304)
+            manifest = trainer.trained_wake_word_artifact("hey_tater.esphome.json", SimpleNamespace(headers={}))
+            self.assertEqual(manifest.headers["etag"], f'"{hashlib.sha256(manifest.body).hexdigest()}"')
+            cached = trainer.trained_wake_word_artifact(
+                "hey_tater.esphome.json", SimpleNamespace(headers={"if-none-match": manifest.headers["etag"]})
+            )
+            self.assertEqual(cached.status_code, 304)
+            self.assertEqual(trainer.trained_wake_word_artifact("missing.tflite", SimpleNamespace(headers={})).status_code, 404)
+
+            (trained_dir / "manual.tflite").write_bytes(b"model")
+            (trained_dir / "manual.json").write_text(json.dumps({"model": "manual.tflite"}), encoding="utf-8")
+            with patch.object(trainer.json, "loads", wraps=json.loads) as parse:
+                rows = trainer._list_trained_wake_words("http://trainer")
+            self.assertEqual([row["key"] for row in rows], ["hey_tater", "manual"])
+            self.assertEqual(parse.call_count, 1)
+
+            trainer.TRAINED_WAKE_WORD_INDEX.clear()
+            with patch.object(trainer, "_sync_trained_wake_word_artifacts") as sync:
+                rows = trainer._list_trained_wake_words("http://trainer")
+                sync.assert_not_called()
+            self.assertEqual(len(rows), 2)
+
     def test_esphome_manifest_route_removes_tater_extensions(self):
         with tempfile.TemporaryDirectory() as directory:
             trained_dir = Path(directory)
@@ -649,7 +1178,7 @@ class AutoTrainTests(unittest.TestCase):
                 patch.object(trainer, "_sync_trained_wake_word_artifacts"),
             ):
                 response = trainer.trained_wake_word_artifact(
-                    "hey_tater.esphome.json"
+                    "hey_tater.esphome.json", SimpleNamespace(headers={})
                 )
 
         payload = json.loads(response.body)
@@ -757,6 +1286,56 @@ class AutoTrainTests(unittest.TestCase):
                 ("cpu", "int8"),
             )
 
+    def test_stt_model_preload_reports_load_and_idle_unload(self):
+        whisper_model = Mock(return_value=object())
+        with (
+            patch.dict(sys.modules, {"faster_whisper": SimpleNamespace(WhisperModel=whisper_model)}),
+            patch.object(trainer, "_resolve_faster_whisper_runtime", return_value=("cpu", "int8")),
+            patch.object(trainer, "_process_rss_bytes", side_effect=[1000, 5000]),
+        ):
+            trainer._preload_stt_model()
+            trainer._load_faster_whisper_model(model_name="small.en", device="cpu", compute_type="int8")
+
+        whisper_model.assert_called_once()
+        models = trainer._auto_train_status_payload()["runtime"]["stt_models"]
+        self.assertEqual(models["resident"][trainer.STT_ENGINE_FASTER_WHISPER]["bytes"], 4000)
+        self.assertEqual(
+            [(event["event"], event["reason"]) for event in models["events"]],
+            [("load", "preload")],
+        )
+
+        with patch.object(trainer, "STT_MODEL_IDLE_UNLOAD_SECONDS", 60.0):
+            self.assertGreater(trainer._unload_idle_stt_models(), 59.0)
+            trainer.STT_MODEL_RESIDENCY[trainer.STT_ENGINE_FASTER_WHISPER]["last_used"] -= 61.0
+            self.assertIsNone(trainer._unload_idle_stt_models())
+
+        self.assertFalse(trainer.FASTER_WHISPER_MODEL_CACHE)
+        models = trainer._auto_train_status_payload()["runtime"]["stt_models"]
+        self.assertEqual(models["resident"], {})
+        self.assertEqual(models["events"][-1]["event"], "unload")
+        self.assertEqual(models["events"][-1]["reason"], "idle")
+
+    def test_stt_ram_budget_unloads_the_other_engine_first(self):
+        trainer.FASTER_WHISPER_MODEL_CACHE[("small.en", "cpu", "int8")] = object()
+        trainer.STT_MODEL_RESIDENCY[trainer.STT_ENGINE_FASTER_WHISPER] = {
+            "model": "small.en",
+            "device": "cpu",
+            "loaded_at": trainer._iso_now(),
+            "last_used": 0.0,
+            "bytes": 800,
+        }
+        trainer.STT_MODEL_FOOTPRINTS[trainer.STT_ENGINE_PARAKEET_ONNX] = 500
+
+        with patch.object(trainer, "STT_MODEL_RAM_BUDGET_BYTES", 2000):
+            trainer._make_room_for_stt_model(trainer.STT_ENGINE_PARAKEET_ONNX)
+        self.assertTrue(trainer.FASTER_WHISPER_MODEL_CACHE)
+
+        with patch.object(trainer, "STT_MODEL_RAM_BUDGET_BYTES", 1000):
+            trainer._make_room_for_stt_model(trainer.STT_ENGINE_PARAKEET_ONNX)
+        self.assertFalse(trainer.FASTER_WHISPER_MODEL_CACHE)
+        self.assertEqual(trainer.STT_MODEL_EVENTS[-1]["reason"], "ram_budget")
+        self.assertEqual(trainer.STT_MODEL_EVENTS[-1]["bytes"], 800)
+
     def test_faster_whisper_transcription_joins_segments_and_records_runtime(self):
         fake_model = SimpleNamespace()
         fake_model.transcribe = Mock(
@@ -785,6 +1364,175 @@ class AutoTrainTests(unittest.TestCase):
         self.assertEqual(trainer.AUTO_TRAIN_STATE["last_stt_device"], "cuda")
         self.assertEqual(trainer.AUTO_TRAIN_STATE["last_stt_compute_type"], "float16")
 
+    def test_faster_whisper_batch_decodes_each_clip_in_its_own_window(self):
+        import numpy as np
+
+        class FakeTokenizer:
+            eot = 99
+            sot_sequence = (50, 51)
+            no_timestamps = 52
+
+            def __init__(self, _hf_tokenizer, multilingual, *, task, language):
+                self.language = language
+
+            def decode(self, tokens):
+                return " ".join({1: "turn on", 2: " the lights", 3: "hey  tater"}[token] for token in tokens)
+
+        generate = Mock(
+            return_value=[
+                SimpleNamespace(sequences_ids=[[1, 2, 99]], scores=[-0.2], no_speech_prob=0.01),
+                SimpleNamespace(sequences_ids=[[3]], scores=[-0.4], no_speech_prob=0.02),
+            ]
+        )
+        fake_model = SimpleNamespace(
+            feature_extractor=Mock(side_effect=lambda audio: np.zeros((80, audio.shape[0] // 160 + 1))),
+            hf_tokenizer=object(),
+            model=SimpleNamespace(is_multilingual=False, generate=generate),
+        )
+        fake_model.feature_extractor.n_samples = 16000 * 30
+        fake_model.feature_extractor.nb_max_frames = 3000
+        audio_paths = [trainer.CAPTURED_DIR / "a.wav", trainer.CAPTURED_DIR / "b.wav"]
+        for audio_path in audio_paths:
+            audio_path.write_bytes(silent_wav_bytes())
+        fake_modules = {
+            "ctranslate2": SimpleNamespace(StorageView=SimpleNamespace(from_array=lambda array: array)),
+            "faster_whisper": SimpleNamespace(),
+            "faster_whisper.tokenizer": SimpleNamespace(Tokenizer=FakeTokenizer),
+        }
+        with (
+            patch.dict(sys.modules, fake_modules),
+            patch.object(trainer, "_resolve_faster_whisper_runtime", return_value=("cpu", "int8")),
+            patch.object(trainer, "_load_faster_whisper_model", return_value=fake_model),
+        ):
+            transcripts = trainer._transcribe_captures_with_faster_whisper(
+                audio_paths,
+                model="small.en",
+                language="en",
+            )
+
+        self.assertEqual(transcripts, ["turn on the lights", "hey tater"])
+        features, prompts = generate.call_args.args
+        self.assertEqual(features.shape, (2, 80, 3000))
+        self.assertEqual(prompts, [[50, 51, 52], [50, 51, 52]])
+        self.assertEqual(generate.call_args.kwargs["beam_size"], 1)
+        self.assertEqual(trainer.AUTO_TRAIN_STATE["last_stt_compute_type"], "int8")
+
+    def test_faster_whisper_batch_falls_back_like_transcribe(self):
+        import numpy as np
+
+        class FakeTokenizer:
+            eot = 99
+            sot_sequence = (50, 51)
+            no_timestamps = 52
+
+            def __init__(self, _hf_tokenizer, multilingual, *, task, language):
+                pass
+
+            def decode(self, tokens):
+                return {1: " hey tater", 2: " tater" * 40, 3: " hey later"}[tokens[0]]
+
+        # transcribe() is the single-clip path, with its temperature fallback.
+        fake_model = SimpleNamespace(
+            transcribe=Mock(
+                side_effect=lambda clip, **_kwargs: (iter([SimpleNamespace(text=" fallback")]), SimpleNamespace())
+            ),
+            feature_extractor=Mock(side_effect=lambda audio: np.zeros((80, audio.shape[0] // 160 + 1))),
+            hf_tokenizer=object(),
+            model=SimpleNamespace(
+                is_multilingual=False,
+                generate=Mock(
+                    return_value=[
+                        SimpleNamespace(sequences_ids=[[1, 99]], scores=[-0.2], no_speech_prob=0.01),
+                        SimpleNamespace(sequences_ids=[[2, 99]], scores=[-0.1], no_speech_prob=0.01),
+                        SimpleNamespace(sequences_ids=[[3, 99]], scores=[-2.4], no_speech_prob=0.2),
+                    ]
+                ),
+            ),
+        )
+        fake_model.feature_extractor.n_samples = 16000 * 30
+        fake_model.feature_extractor.nb_max_frames = 3000
+        audio_paths = [trainer.CAPTURED_DIR / name for name in ("ok.wav", "loop.wav", "unsure.wav")]
+        for audio_path in audio_paths:
+            audio_path.write_bytes(silent_wav_bytes())
+        fake_modules = {
+            "ctranslate2": SimpleNamespace(StorageView=SimpleNamespace(from_array=lambda array: array)),
+            "faster_whisper": SimpleNamespace(),
+            "faster_whisper.tokenizer": SimpleNamespace(Tokenizer=FakeTokenizer),
+        }
+        with (
+            patch.dict(sys.modules, fake_modules),
+            patch.object(trainer, "_resolve_faster_whisper_runtime", return_value=("cpu", "int8")),
+            patch.object(trainer, "_load_faster_whisper_model", return_value=fake_model),
+        ):
+            transcripts = trainer._transcribe_captures_with_faster_whisper(
+                audio_paths,
+                model="small.en",
+                language="en",
+            )
+
+        self.assertEqual(transcripts, ["hey tater", "fallback", "fallback"])
+        self.assertEqual(fake_model.transcribe.call_count, 2)
+        self.assertEqual(fake_model.transcribe.call_args.kwargs["beam_size"], 1)
+
+    def test_silent_capture_gets_the_same_decision_alone_and_batched(self):
+        import numpy as np
+
+        class FakeTokenizer:
+            eot = 99
+            sot_sequence = (50, 51)
+            no_timestamps = 52
+
+            def __init__(self, _hf_tokenizer, multilingual, *, task, language):
+                pass
+
+            def decode(self, tokens):
+                return "thank you" if tokens else ""
+
+        # transcribe() applies the no-speech filter itself; generate() reports
+        # the hallucinated caption along with the scores the filter needs.
+        fake_model = SimpleNamespace(
+            transcribe=Mock(return_value=(iter([]), SimpleNamespace())),
+            feature_extractor=Mock(side_effect=lambda audio: np.zeros((80, audio.shape[0] // 160 + 1))),
+            hf_tokenizer=object(),
+            model=SimpleNamespace(
+                is_multilingual=False,
+                generate=Mock(
+                    side_effect=lambda features, prompts, **_kwargs: [
+                        SimpleNamespace(sequences_ids=[[7]], scores=[-2.5], no_speech_prob=0.93)
+                        for _prompt in prompts
+                    ]
+                ),
+            ),
+        )
+        fake_model.feature_extractor.n_samples = 16000 * 30
+        fake_model.feature_extractor.nb_max_frames = 3000
+        fake_modules = {
+            "ctranslate2": SimpleNamespace(StorageView=SimpleNamespace(from_array=lambda array: array)),
+            "faster_whisper": SimpleNamespace(),
+            "faster_whisper.tokenizer": SimpleNamespace(Tokenizer=FakeTokenizer),
+        }
+        decisions = {}
+        with (
+            patch.dict(sys.modules, fake_modules),
+            patch.object(trainer, "_managed_stt_model", return_value="small.en"),
+            patch.object(trainer, "_resolve_faster_whisper_runtime", return_value=("cpu", "int8")),
+            patch.object(trainer, "_load_faster_whisper_model", return_value=fake_model),
+        ):
+            for batch_size in (1, 8):
+                names = [f"silent-{batch_size}-{index}.wav" for index in range(batch_size)]
+                for index, name in enumerate(names):
+                    # Distinct audio per clip so the transcript cache cannot answer for STT.
+                    self.add_capture(name).write_bytes(silent_wav_bytes(0.25 + 0.01 * (batch_size + index)))
+                trainer._auto_review_captures(names)
+                decisions[batch_size] = {
+                    trainer._load_sidecar_json(trainer.CAPTURED_DIR / name).get("auto_review_status")
+                    for name in names
+                }
+
+        fake_model.transcribe.assert_called_once()
+        fake_model.model.generate.assert_called_once()
+        self.assertEqual(decisions, {1: {"no_speech"}, 8: {"no_speech"}})
+
     def test_train_status_reads_and_increments_training_log_tail(self):
         log_path = Path(self.tempdir.name) / "training.log"
         log_path.write_text("first\nsecond\nthird\n", encoding="utf-8")
@@ -818,6 +1566,113 @@ class AutoTrainTests(unittest.TestCase):
                 trainer.STATE["training"].clear()
                 trainer.STATE["training"].update(original_training)
 
+    def test_train_status_offsets_give_each_client_its_own_cursor(self):
+        log_path = Path(self.tempdir.name) / "training.log"
+        log_path.write_text("first\nsecond\nthird\n", encoding="utf-8")
+        with trainer.STATE_LOCK:
+            original_training = dict(trainer.STATE["training"])
+            trainer.STATE["training"].update({"log_path": str(log_path), "log_id": "gen1"})
+
+        try:
+            with patch.object(trainer, "TRAIN_LOG_TAIL_LINES", 2):
+                first_tab = trainer.train_status(offset="")["training"]
+                second_tab = trainer.train_status(offset="")["training"]
+                self.assertEqual(first_tab["new_log_lines"], ["second", "third"])
+                self.assertEqual(second_tab["new_log_lines"], ["second", "third"])
+                self.assertTrue(first_tab["log_reset"])
+
+                with log_path.open("a", encoding="utf-8") as log_file:
+                    log_file.write("fourth\nfif")
+                for tab in (first_tab, second_tab):
+                    update = trainer.train_status(offset=str(tab["log_offset"]), log_id="gen1")["training"]
+                    self.assertEqual(update["log_text"], "fourth")
+                    self.assertFalse(update["log_reset"])
+                    self.assertNotIn("log_lines", update)
+
+                with log_path.open("a", encoding="utf-8") as log_file:
+                    log_file.write("th\n")
+                resumed = trainer.train_status(offset=str(update["log_offset"]), log_id="gen1")["training"]
+                self.assertEqual(resumed["new_log_lines"], ["fifth"])
+
+                stale = trainer.train_status(offset=str(resumed["log_offset"]), log_id="old")["training"]
+                self.assertTrue(stale["log_reset"])
+                self.assertEqual(stale["new_log_lines"], ["fourth", "fifth"])
+        finally:
+            with trainer.STATE_LOCK:
+                trainer.STATE["training"].clear()
+                trainer.STATE["training"].update(original_training)
+
+    def test_train_log_stream_pushes_new_lines_and_resumes_from_last_event_id(self):
+        log_path = Path(self.tempdir.name) / "training.log"
+        log_path.write_text("first\n", encoding="utf-8")
+        with trainer.STATE_LOCK:
+            original_training = dict(trainer.STATE["training"])
+            trainer.STATE["training"].update({"log_path": str(log_path), "log_id": "gen1"})
+
+        class DisconnectAfter:
+            def __init__(self, checks):
+                self.checks = checks
+
+            async def is_disconnected(self):
+                self.checks -= 1
+                return self.checks < 0
+
+        async def collect(request, **kwargs):
+            response = await trainer.train_log_stream(
+                request, offset=kwargs.get("offset"), log_id=kwargs.get("log_id"), last_event_id=kwargs.get("last_event_id")
+            )
+            events = []
+            async for event in response.body_iterator:
+                events.append(event)
+                if len(events) == 1:
+                    with log_path.open("a", encoding="utf-8") as log_file:
+                        log_file.write("second\n")
+                    trainer._append_train_log("second")
+            return events
+
+        try:
+            with patch.object(trainer, "TRAIN_LOG_STREAM_STATUS_SECONDS", 5.0):
+                events = asyncio.run(asyncio.wait_for(collect(DisconnectAfter(1)), timeout=2.0))
+            payloads = [json.loads(event.split("data: ", 1)[1]) for event in events]
+            self.assertEqual([payload["lines"] for payload in payloads], [["first"], ["second"]])
+            self.assertTrue(events[1].startswith("id: gen1:13\n"))
+
+            with log_path.open("a", encoding="utf-8") as log_file:
+                log_file.write("third\n")
+            resumed = asyncio.run(collect(DisconnectAfter(0), last_event_id="gen1:13"))
+            self.assertEqual(json.loads(resumed[0].split("data: ", 1)[1])["lines"], ["third"])
+        finally:
+            with trainer.STATE_LOCK:
+                trainer.STATE["training"].clear()
+                trainer.STATE["training"].update(original_training)
+
+    def test_train_log_writer_buffers_file_writes_and_wakes_streams_after_flush(self):
+        log_path = Path(self.tempdir.name) / "training.log"
+        original_ring = trainer._train_log_snapshot()
+        trainer._reset_train_log_ring()
+        try:
+            with patch.object(trainer, "TRAIN_LOG_FLUSH_SECONDS", 60.0), patch.object(
+                trainer, "_notify_train_log_subscribers"
+            ) as notify:
+                with trainer._open_train_log_writer(log_path) as write_log:
+                    for index in range(trainer.TRAIN_LOG_MEMORY_LINES + 5):
+                        write_log(f"step {index}\n")
+                    self.assertEqual(log_path.read_text(encoding="utf-8"), "")
+                    notify.assert_not_called()
+                self.assertEqual(notify.call_count, 1)
+
+            written = log_path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(written), trainer.TRAIN_LOG_MEMORY_LINES + 5)
+            ring = trainer._train_log_snapshot()
+            self.assertEqual(len(ring), trainer.TRAIN_LOG_MEMORY_LINES)
+            self.assertEqual(ring[0], "step 5")
+            self.assertEqual(ring[-1], written[-1])
+            self.assertEqual(trainer.get_session()["training"]["log_lines"], ring)
+        finally:
+            trainer._reset_train_log_ring()
+            for line in original_ring:
+                trainer._append_train_log(line, notify=False)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+import trainer_server as trainer
+from audio_fixtures import AudioDataDirsMixin, FakeRequest, tone_wav_bytes
+
+
+def batch_frame(metadata: dict, audio: bytes) -> bytes:
+    encoded = json.dumps(metadata).encode("utf-8")
+    return len(encoded).to_bytes(4, "big") + encoded + len(audio).to_bytes(4, "big") + audio
+
+
+class CaptureUploadTests(AudioDataDirsMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.config_patch = patch.dict(trainer.AUTO_TRAIN_CONFIG, {"enabled": False})
+        self.config_patch.start()
+
+    def tearDown(self):
+        self.config_patch.stop()
+        super().tearDown()
+
+    def upload_batch(self, body: bytes):
+        return asyncio.run(trainer.upload_captured_audio_batch(FakeRequest(body=body)))
+
+    def test_raw_upload_headers_become_sidecar_fields(self):
+        payload = asyncio.run(
+            trainer.upload_captured_audio_raw(
+                FakeRequest(body=b"\x20\x00\xe0\xff" * 4000),
+                x_audio_format="pcm_s16le",
+                x_sample_rate=None,
+                x_channels=None,
+                x_original_name=None,
+                x_source_device="office",
+                x_wake_word="hey tater",
+                x_event_type="wake_detected",
+                x_captured_at="2026-01-01T00:00:00Z",
+                x_blocked_by_vad="true",
+                x_max_probability="0.9",
+                x_average_probability="0.7",
+                x_probability_cutoff="200",
+                x_peak_probability_cutoff=None,
+                x_active_windows="4",
+                x_min_active_windows="2",
+                x_rise_score=None,
+                x_vad_max_probability=None,
+                x_vad_average_probability=None,
+                x_detection_profile=" balanced ",
+                x_probability_history="1,2,3",
+                x_notes=None,
+            )
+        )
+
+        self.assertTrue(payload["ok"])
+        self.assertEqual(payload["captured_count"], 1)
+        sidecar = trainer._load_sidecar_json(trainer.CAPTURED_DIR / payload["item"]["saved_as"])
+        self.assertEqual(sidecar["original_name"], "captured.raw.wav")
+        self.assertEqual((sidecar["source_device"], sidecar["event_type"]), ("office", "wake_detected"))
+        self.assertTrue(sidecar["blocked_by_vad"])
+        self.assertEqual((sidecar["active_window_count"], sidecar["min_active_windows"]), (4, 2))
+        self.assertEqual(sidecar["detection_profile"], "balanced")
+        self.assertEqual(sidecar["probability_history"], [1, 2, 3])
+        self.assertEqual(sidecar["review_status"], "pending")
+
+    def test_upload_work_runs_on_the_bounded_executor(self):
+        threads = []
+        original_store = trainer._store_captured_upload
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return original_store(*args, **kwargs)
+
+        body = batch_frame({"source_device": "hall"}, tone_wav_bytes())
+        with patch.object(trainer, "_store_captured_upload", side_effect=record_thread):
+            payload = self.upload_batch(body)
+
+        self.assertTrue(payload["ok"])
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("upload"))
+        self.assertNotEqual(threads[0], threading.main_thread().name)
+
+    def test_batch_saves_each_clip_with_its_metadata(self):
+        body = b"".join(
+            [
+                batch_frame(
+                    {"client_id": "a1", "source_device": "kitchen", "event_type": "close_miss", "max_probability": "0.61"},
+                    tone_wav_bytes(),
+                ),
+                batch_frame(
+                    {"client_id": "a2", "source_device": "kitchen", "audio_format": "pcm_s16le", "sample_rate": 22050},
+                    b"\x20\x00\xe0\xff" * 2205,
+                ),
+                batch_frame({"client_id": "a3", "audio_format": "opus"}, b"\x00" * 10),
+            ]
+        )
+
+        payload = self.upload_batch(body)
+
+        self.assertFalse(payload["ok"])
+        self.assertEqual(payload["captured_count"], 2)
+        self.assertEqual([ack["id"] for ack in payload["acks"]], ["a1", "a2", "a3"])
+        self.assertEqual([ack["ok"] for ack in payload["acks"]], [True, True, False])
+        self.assertIn("Unsupported", payload["acks"][2]["error"])
+
+        first = trainer._load_sidecar_json(trainer.CAPTURED_DIR / payload["acks"][0]["saved_as"])
+        self.assertEqual((first["source_device"], first["event_type"]), ("kitchen", "close_miss"))
+        self.assertEqual(first["max_probability"], 0.61)
+        self.assertNotIn("client_id", first)
+        second = trainer._load_sidecar_json(trainer.CAPTURED_DIR / payload["acks"][1]["saved_as"])
+        self.assertEqual(second["final_format"]["sample_rate"], 16000)
+        self.assertEqual(second["event_type"], "captured")
+
+    def test_retried_batches_acknowledge_clips_already_saved(self):
+        body = batch_frame({"client_id": "retry-1", "source_device": "den"}, tone_wav_bytes())
+
+        first = self.upload_batch(body)
+        second = self.upload_batch(body)
+
+        self.assertEqual(second["acks"][0]["saved_as"], first["acks"][0]["saved_as"])
+        self.assertTrue(second["acks"][0]["duplicate"])
+        self.assertEqual(second["captured_count"], 1)
+
+    def test_retried_clip_is_acknowledged_after_a_restart_and_review_move(self):
+        body = batch_frame({"client_id": "retry-2", "source_device": "den"}, tone_wav_bytes())
+        saved_as = self.upload_batch(body)["acks"][0]["saved_as"]
+        trainer._close_audio_index()
+        trainer._move_captured_audio(
+            saved_as, trainer.NEGATIVE_DIR, target_prefix="negative", review_status="approved_negative"
+        )
+        negative_name = trainer._list_audio_samples(trainer.NEGATIVE_DIR)[0]
+
+        retried = self.upload_batch(body)
+        other_device = self.upload_batch(batch_frame({"client_id": "retry-2", "source_device": "hall"}, tone_wav_bytes()))
+
+        self.assertEqual(
+            retried["acks"][0],
+            {"i": 0, "id": "retry-2", "ok": True, "saved_as": negative_name, "bucket": "negative", "duplicate": True},
+        )
+        self.assertNotIn("duplicate", other_device["acks"][0])
+        self.assertEqual(trainer._list_captured_sample_names(), [other_device["acks"][0]["saved_as"]])
+
+    def test_malformed_framing_rejects_the_whole_batch(self):
+        truncated = batch_frame({}, tone_wav_bytes())[:-10]
+        not_json = (3).to_bytes(4, "big") + b"{x}" + (0).to_bytes(4, "big")
+
+        for body in (truncated, not_json, b"\x00\x00"):
+            with self.subTest(body=body[:8]):
+                response = self.upload_batch(body)
+                self.assertEqual(response.status_code, 400)
+        self.assertEqual(trainer._list_captured_sample_names(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
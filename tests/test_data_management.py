@@ -1,6 +1,11 @@
+import asyncio
+import gzip
+import hashlib
+import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 import trainer_server as trainer
 
@@ -21,6 +26,7 @@ class DataManagementTests(unittest.TestCase):
             "PIPER_VOICES_DIR": trainer.PIPER_VOICES_DIR,
             "PIPER_CATALOG_CACHE_FILE": trainer.PIPER_CATALOG_CACHE_FILE,
             "OMNIVOICE_CATALOG_CACHE_FILE": trainer.OMNIVOICE_CATALOG_CACHE_FILE,
+            "AUDIO_INDEX_FILE": trainer.AUDIO_INDEX_FILE,
         }
         trainer.DATA_DIR = root
         trainer.PERSONAL_DIR = root / "personal_samples"
@@ -33,12 +39,19 @@ class DataManagementTests(unittest.TestCase):
         trainer.PIPER_VOICES_DIR = trainer.PIPER_ROOT / "voices"
         trainer.PIPER_CATALOG_CACHE_FILE = root / ".cache" / "piper_voices_catalog.json"
         trainer.OMNIVOICE_CATALOG_CACHE_FILE = root / ".cache" / "omnivoice_languages.json"
+        trainer.AUDIO_INDEX_FILE = root / ".cache" / "audio_index.sqlite3"
         self.original_training_running = trainer.STATE["training"]["running"]
         self.original_review_running = trainer.AUTO_TRAIN_RUNTIME["review_running"]
         trainer.STATE["training"]["running"] = False
         trainer.AUTO_TRAIN_RUNTIME["review_running"] = False
+        trainer.DATA_USAGE_CACHE.clear()
+        trainer.DATA_USAGE_FORCED.clear()
 
     def tearDown(self):
+        trainer.DATA_USAGE_CACHE.clear()
+        trainer.DATA_USAGE_FORCED.clear()
+        trainer.DATA_USAGE_WAKE_EVENT.clear()
+        trainer._close_audio_index()
         for name, value in self.original_paths.items():
             setattr(trainer, name, value)
         trainer.STATE["training"]["running"] = self.original_training_running
@@ -53,6 +66,7 @@ class DataManagementTests(unittest.TestCase):
         outside.write_bytes(b"b" * 8192)
         (generated / "outside-link").symlink_to(outside)
 
+        trainer._refresh_managed_usage()
         payload = trainer._managed_data_payload()
         item = next(row for row in payload["items"] if row["id"] == "generated_samples")
 
@@ -78,6 +92,92 @@ class DataManagementTests(unittest.TestCase):
             trainer._delete_managed_data_item("generated_samples")
         self.assertTrue((generated / "keep.wav").exists())
 
+    def test_usage_is_served_from_cache_and_rescanned_only_when_a_directory_changes(self):
+        generated = trainer.DATA_DIR / "work" / "wake_word_samples"
+        nested = generated / "speaker_0"
+        nested.mkdir(parents=True)
+        (nested / "one.wav").write_bytes(b"a" * 128)
+
+        cold = trainer._managed_data_payload()
+        self.assertTrue(cold["usage_pending"])
+        self.assertIsNone(cold["updated_seconds_ago"])
+        self.assertTrue(trainer.DATA_USAGE_WAKE_EVENT.is_set())
+
+        trainer._refresh_managed_usage()
+        warm = trainer._managed_data_payload()
+        item = next(row for row in warm["items"] if row["id"] == "generated_samples")
+        self.assertFalse(warm["usage_pending"])
+        self.assertEqual(item["file_count"], 1)
+        self.assertEqual(item["updated_seconds_ago"], 0)
+
+        with patch.object(trainer, "_managed_path_usage", wraps=trainer._managed_path_usage) as walk:
+            self.assertEqual(trainer._refresh_managed_usage(), 0)
+            walk.assert_not_called()
+            (nested / "two.wav").write_bytes(b"b" * 128)
+            self.assertEqual(trainer._refresh_managed_usage(), 1)
+            self.assertEqual(walk.call_args.args[0], generated)
+
+        item = next(row for row in trainer._managed_data_payload()["items"] if row["id"] == "generated_samples")
+        self.assertEqual(item["file_count"], 2)
+
+    def test_delete_updates_cached_usage_without_rescanning_other_items(self):
+        generated = trainer.DATA_DIR / "work" / "wake_word_samples"
+        generated.mkdir(parents=True)
+        (generated / "one.wav").write_bytes(b"a" * 4096)
+        trainer._refresh_managed_usage()
+        cached_size = trainer.DATA_USAGE_CACHE[str(generated)]["size_bytes"]
+
+        with patch.object(trainer, "_managed_path_usage", wraps=trainer._managed_path_usage) as walk:
+            deleted = trainer._delete_managed_data_item("generated_samples")
+
+        self.assertEqual([call.args[0] for call in walk.call_args_list], [generated])
+        self.assertEqual(deleted["released_bytes"], cached_size)
+        self.assertFalse(deleted["usage_pending"])
+        item = next(row for row in deleted["items"] if row["id"] == "generated_samples")
+        self.assertEqual((item["size_bytes"], item["file_count"]), (0, 0))
+
+    def test_json_responses_are_gzipped_but_audio_passes_through(self):
+        payload = trainer._managed_data_payload()
+
+        async def call(response, accept_encoding="gzip, deflate"):
+            messages = []
+
+            async def receive():
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message):
+                messages.append(message)
+
+            scope = {
+                "type": "http",
+                "method": "GET",
+                "path": "/",
+                "headers": [(b"accept-encoding", accept_encoding.encode("ascii"))],
+            }
+            await trainer._gzip_json_middleware(response)(scope, receive, send)
+            headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in messages[0]["headers"]}
+            return headers, b"".join(message.get("body", b"") for message in messages[1:])
+
+        headers, body = asyncio.run(call(trainer.JSONResponse(payload)))
+        self.assertEqual(headers["content-encoding"], "gzip")
+        self.assertEqual(int(headers["content-length"]), len(body))
+        self.assertEqual(json.loads(gzip.decompress(body)), payload)
+
+        headers, body = asyncio.run(call(trainer.JSONResponse(payload), accept_encoding="identity"))
+        self.assertNotIn("content-encoding", headers)
+        self.assertEqual(json.loads(body), payload)
+
+        etag = f'"{hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()}"'
+        headers, body = asyncio.run(call(trainer.JSONResponse(payload, headers={"ETag": etag})))
+        self.assertNotIn("content-encoding", headers)
+        self.assertEqual(headers["etag"], etag)
+        self.assertEqual(json.loads(body), payload)
+
+        audio = b"RIFF" + b"\x00" * 4096
+        headers, body = asyncio.run(call(trainer.Response(audio, media_type="audio/wav")))
+        self.assertNotIn("content-encoding", headers)
+        self.assertEqual(body, audio)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -404,6 +404,48 @@ class ModernTtsTests(unittest.TestCase):
         self.assertEqual(catalog["zu"]["quality"], "experimental")
         self.assertEqual(catalog["zu"]["engines"], ["omnivoice"])
 
+    @unittest.skipIf(trainer is None, "trainer server dependencies are not installed")
+    def test_language_catalog_is_memoized_until_its_inputs_change(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            voices_dir = Path(temp_dir) / "voices"
+            voices_dir.mkdir()
+            with (
+                patch.object(trainer, "_load_omnivoice_catalog", return_value={"en": {"name": "English"}}),
+                patch.object(trainer, "_load_piper_catalog", return_value={}),
+                patch.object(trainer, "PIPER_ROOT", Path(temp_dir) / "piper"),
+                patch.object(trainer, "PIPER_VOICES_DIR", voices_dir),
+                patch.object(trainer, "_build_available_languages", wraps=trainer._build_available_languages) as build,
+            ):
+                first = trainer._available_languages()
+                self.assertEqual(trainer._normalize_language("en-US"), "en")
+                self.assertIs(trainer._available_languages(), first)
+                self.assertEqual(build.call_count, 1)
+
+                (voices_dir / "zu_ZA-test-medium.onnx.json").write_text(
+                    json.dumps({"language": {"family": "zu", "name_english": "Zulu"}}),
+                    encoding="utf-8",
+                )
+                languages, by_code = trainer._language_catalog()
+                self.assertEqual(build.call_count, 2)
+                self.assertEqual(by_code["zu"]["engines"], ["piper"])
+                self.assertEqual([entry["code"] for entry in languages], list(by_code))
+
+                with (
+                    patch.object(
+                        trainer,
+                        "_catalog_voice_files",
+                        return_value=[("zu_ZA-new-medium.onnx", "https://example.invalid/zu.onnx")],
+                    ),
+                    patch.object(trainer, "_download_to_path"),
+                ):
+                    trainer._ensure_non_english_language_voices("zu", lambda line: None)
+                trainer._available_languages()
+                self.assertEqual(build.call_count, 3)
+
+                with patch.object(trainer, "LANGUAGE_CATALOG_TTL_SECONDS", 0):
+                    trainer._available_languages()
+                self.assertEqual(build.call_count, 4)
+
     @unittest.skipIf(trainer is None, "trainer server dependencies are not installed")
     def test_server_resolves_unavailable_tts_modes_safely(self) -> None:
         languages = [
@@ -690,6 +732,7 @@ class ModernTtsTests(unittest.TestCase):
             source = (REPO_ROOT / dockerfile).read_text(encoding="utf-8")
             self.assertIn("ffmpeg", source)
             self.assertIn("tts_config.py", source)
+            self.assertIn("audio_pcm.py", source)
 
         ui = (REPO_ROOT / "frontend" / "src" / "TrainerApp.vue").read_text(encoding="utf-8")
         store = (REPO_ROOT / "frontend" / "src" / "trainerStore.ts").read_text(encoding="utf-8")
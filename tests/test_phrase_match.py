@@ -0,0 +1,68 @@
+import json
+import unittest
+from pathlib import Path
+
+import phrase_match
+
+
+CORPUS_PATH = Path(__file__).resolve().parent / "data" / "wake_phrase_corpus.jsonl"
+
+
+class PhraseMatchTests(unittest.TestCase):
+    def test_regression_corpus_scores_are_stable(self):
+        rows = [json.loads(line) for line in CORPUS_PATH.read_text(encoding="utf-8").splitlines() if line.strip()]
+        self.assertGreater(len(rows), 40)
+        for row in rows:
+            with self.subTest(phrase=row["phrase"], transcript=row["transcript"]):
+                score = phrase_match.compile_phrase(row["phrase"]).score(row["transcript"])
+                self.assertAlmostEqual(score.similarity, row["similarity"], places=4)
+                self.assertEqual(score.contains, row["contains"])
+                self.assertEqual(score.matches, row["matches"])
+
+    def test_batch_scores_match_single_scores(self):
+        rows = [json.loads(line) for line in CORPUS_PATH.read_text(encoding="utf-8").splitlines() if line.strip()]
+        transcripts = [row["transcript"] for row in rows if row["phrase"] == "hey tater"]
+        transcripts += transcripts[:5]
+        phrase = phrase_match.compile_phrase("Hey, Tater")
+
+        self.assertEqual(phrase.score_batch(transcripts), [phrase.score(text) for text in transcripts])
+        self.assertEqual(phrase.similarities(transcripts), [phrase.similarity(text) for text in transcripts])
+
+    def test_compiled_phrases_are_shared_by_normalized_text(self):
+        self.assertIs(phrase_match.compile_phrase("Hey Tater"), phrase_match.compile_phrase(" hey_tater! "))
+        self.assertIsNot(
+            phrase_match.compile_phrase("hey tater"),
+            phrase_match.compile_phrase("hey tater", variants=("hey tayter",)),
+        )
+
+    def test_phonetic_key_groups_spellings_that_sound_alike(self):
+        self.assertEqual(phrase_match.phonetic_key("heytayter"), phrase_match.phonetic_key("heytater"))
+        self.assertEqual(phrase_match.phonetic_key("haytater"), phrase_match.phonetic_key("heytater"))
+        self.assertNotEqual(phrase_match.phonetic_key("heyservice"), phrase_match.phonetic_key("heyjarvis"))
+        self.assertNotEqual(phrase_match.phonetic_key("heyhater"), phrase_match.phonetic_key("heytater"))
+        self.assertEqual(phrase_match.phonetic_key(""), "")
+
+    def test_sounding_alike_never_overrides_a_rejection(self):
+        phrase = phrase_match.compile_phrase("hey tater")
+
+        for transcript in ("hi tutor", "heat it or"):
+            with self.subTest(transcript=transcript):
+                score = phrase.score(transcript)
+                self.assertTrue(score.sounds_alike)
+                self.assertFalse(score.matches)
+                self.assertLess(score.similarity, phrase_match.MIN_PHRASE_SIMILARITY)
+        self.assertFalse(phrase.score("Hey, Tater.").sounds_alike)
+        self.assertFalse(phrase.score("turn on the lights").sounds_alike)
+
+    def test_allowed_variants_count_as_the_phrase(self):
+        phrase = phrase_match.compile_phrase("hey nabu", variants=("hey nabooh", "Hey, Naboo"))
+
+        self.assertEqual(phrase.variants, ("hey nabu", "hey nabooh", "hey naboo"))
+        score = phrase.score("Hey Naboo.")
+        self.assertEqual(score, phrase_match.PhraseScore(1.0, True, True))
+        self.assertFalse(phrase.matches("Hey Naboo. Hey Naboo."))
+        self.assertFalse(phrase_match.compile_phrase("hey nabu").contains("Hey Naboo."))
+
+
+if __name__ == "__main__":
+    unittest.main()
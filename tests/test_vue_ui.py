@@ -61,6 +61,7 @@ class VueTrainerUiTests(unittest.TestCase):
             "/api/captured_audio",
             "/api/auto_train",
             "/api/train_status",
+            "/api/train_log/stream",
             "/api/trained_wake_words/catalog",
             "/api/data",
         ):
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 
 # trainer_server.py
+import asyncio
+import base64
+import bisect
 import contextlib
+import functools
 import gc
+import gzip
+import hashlib
 import io
 import os
 import queue
@@ -12,31 +18,35 @@ import signal
 import secrets
 import shlex
 import socket
+import sqlite3
 import stat as stat_module
 import shutil
 import subprocess
-import sys
 import tempfile
 import threading
 import time
-import unicodedata
 import wave
-from array import array
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from difflib import SequenceMatcher
+from email.utils import formatdate, parsedate_to_datetime
 from math import isfinite, log10
 from pathlib import Path
-from typing import Dict, Any, List, Callable, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Callable, Optional, Tuple
 from urllib.parse import quote
 from urllib.error import HTTPError
 from urllib.request import Request as URLRequest, urlopen
 
 from fastapi import FastAPI, UploadFile, File, Form, Header, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers, MutableHeaders
 
 ROOT_DIR = Path(__file__).resolve().parent
 
+import audio_pcm
+import phrase_match
 from tts_config import (
     COMMON_OMNIVOICE_LANGUAGES,
     DEFAULT_TTS_MODE,
@@ -103,8 +113,31 @@ OMNIVOICE_CATALOG_CACHE_FILE = Path(
         str(DATA_DIR / ".cache" / "omnivoice_languages.json"),
     )
 ).resolve()
+LANGUAGE_CATALOG_TTL_SECONDS = int(os.environ.get("LANGUAGE_CATALOG_TTL_SECONDS", "300"))
+AUDIO_INDEX_FILE = Path(
+    os.environ.get(
+        "AUDIO_INDEX_FILE",
+        str(DATA_DIR / ".cache" / "audio_index.sqlite3"),
+    )
+).resolve()
+AUDIO_INDEX_SCHEMA_VERSION = 2
+TRAINED_WAKE_WORD_INDEX_FILE = Path(
+    os.environ.get(
+        "TRAINED_WAKE_WORD_INDEX_FILE",
+        str(DATA_DIR / ".cache" / "trained_wake_words_index.json"),
+    )
+).resolve()
+TRAINED_WAKE_WORD_INDEX_VERSION = 2
+JSON_GZIP_MINIMUM_BYTES = 1024
 TRAIN_LOG_TAIL_LINES = int(os.environ.get("REC_TRAIN_LOG_TAIL_LINES", "400"))
 TRAIN_LOG_MAX_BYTES = int(os.environ.get("REC_TRAIN_LOG_MAX_BYTES", str(512 * 1024)))
+TRAIN_LOG_STREAM_KEEPALIVE_SECONDS = 15.0
+TRAIN_LOG_STREAM_STATUS_SECONDS = 1.0
+TRAIN_LOG_MEMORY_LINES = 250
+TRAIN_LOG_FLUSH_SECONDS = max(0.05, float(os.environ.get("REC_TRAIN_LOG_FLUSH_SECONDS", "0.25")))
+TRAIN_LOG_WRITE_BUFFER = 64 * 1024
+DATA_USAGE_CHECK_SECONDS = max(1.0, float(os.environ.get("REC_DATA_USAGE_CHECK_SECONDS", "30")))
+DATA_USAGE_MAX_AGE_SECONDS = max(DATA_USAGE_CHECK_SECONDS, float(os.environ.get("REC_DATA_USAGE_MAX_AGE_SECONDS", "900")))
 
 DATASET_CLEANUP_ARCHIVES = os.environ.get("REC_DATASET_CLEANUP_ARCHIVES", "false").lower() in ("1", "true", "yes", "y")
 DATASET_CLEANUP_INTERMEDIATE = os.environ.get("REC_DATASET_CLEANUP_INTERMEDIATE_FILES", "false").lower() in ("1", "true", "yes", "y")
@@ -121,6 +154,11 @@ SPEAKERS_TOTAL_DEFAULT = int(os.environ.get("REC_SPEAKERS_TOTAL", "1"))
 TARGET_SAMPLE_RATE = 16000
 TARGET_CHANNELS = 1
 TARGET_SAMPLE_WIDTH_BYTES = 2
+FFMPEG_MAX_WORKERS = max(1, int(os.environ.get("FFMPEG_MAX_WORKERS", "2")))
+UPLOAD_MAX_WORKERS = max(1, int(os.environ.get("UPLOAD_MAX_WORKERS", "4")))
+CAPTURE_BATCH_MAX_CLIPS = 256
+# Batch upload client ids remembered per source device, so a retried clip is acknowledged instead of saved twice.
+CAPTURE_CLIENT_IDS_PER_DEVICE = 4096
 CAPTURE_GAIN_PROFILE = "capture_rms_v1"
 STT_ENGINE_FASTER_WHISPER = "faster_whisper"
 STT_ENGINE_PARAKEET_ONNX = "parakeet_onnx"
@@ -152,6 +190,48 @@ DEFAULT_PARAKEET_ONNX_REPO = os.environ.get(
 )
 DEFAULT_PARAKEET_ONNX_QUANTIZATION = "int8"
 WAKE_PHRASE_GUIDANCE_MIN_SIMILARITY = 0.68
+# How close transcripts are confirmed: "guided" re-decodes with a hotword
+# prompt, "score" force-aligns the wake phrase against the audio in one pass.
+# Guided stays the default until the score threshold is calibrated on real
+# captures.
+CLOSE_MATCH_CHECKS = ("guided", "score")
+# Per-token geometric-mean probability of the aligned wake phrase, relative to
+# the free transcript's, needed to confirm a close match.
+WAKE_PHRASE_SCORE_MIN_CONFIDENCE = 0.5
+# faster-whisper's transcribe() defaults, applied to batched decodes as well so
+# a noise clip is dropped the same way whichever path transcribes it.
+FASTER_WHISPER_NO_SPEECH_THRESHOLD = 0.6
+FASTER_WHISPER_LOG_PROB_THRESHOLD = -1.0
+FASTER_WHISPER_COMPRESSION_RATIO_THRESHOLD = 2.4
+AUTO_TRAIN_REVIEW_BATCH_SIZE = max(1, int(os.environ.get("AUTO_TRAIN_REVIEW_BATCH_SIZE", "8")))
+AUTO_TRAIN_REVIEW_WORKERS = max(1, int(os.environ.get("AUTO_TRAIN_REVIEW_WORKERS", "1")))
+AUTO_TRAIN_SCHEDULE_RECHECK_SECONDS = 300.0
+AUTO_TRAIN_QUEUE_LATENCY_SAMPLES = 200
+# Queued reviews are kept in the audio index so a restart resumes them without
+# scanning the inbox. Reviews an earlier run left in flight are queued again at
+# startup; a claimed review also holds a lease, so one this process has lost
+# track of is queued again once the lease runs out.
+AUTO_TRAIN_REVIEW_LEASE_SECONDS = max(10.0, float(os.environ.get("AUTO_TRAIN_REVIEW_LEASE_SECONDS", "300")))
+AUTO_REVIEW_QUEUE_DONE_MAX_ROWS = 20000
+# Lower priorities are reviewed first: reported false triggers feed the next
+# training run directly, close misses only add optional positives.
+AUTO_REVIEW_FALSE_TRIGGER_PRIORITY = 0
+AUTO_REVIEW_DEFAULT_PRIORITY = 1
+AUTO_REVIEW_CLOSE_MISS_PRIORITY = 2
+# Review statuses that only hold for the wake phrase they were decided against.
+AUTO_REVIEW_PHRASE_STATUSES = {
+    "wake_phrase_detected",
+    "wake_phrase_ambiguous",
+    "close_miss_phrase_not_detected",
+    "different_wake_phrase",
+}
+TRANSCRIPT_CACHE_MAX_ROWS = 20000
+STT_MODEL_IDLE_UNLOAD_SECONDS = max(0.0, float(os.environ.get("AUTO_TRAIN_STT_IDLE_UNLOAD_SECONDS", "1800")))
+STT_MODEL_RAM_BUDGET_BYTES = max(0, int(float(os.environ.get("AUTO_TRAIN_STT_RAM_BUDGET_MB", "0")) * 1024 * 1024))
+STT_MODEL_EVENT_LIMIT = 50
+AUTO_TRAIN_STATE_SAVE_DELAY_SECONDS = max(
+    0.0, float(os.environ.get("AUTO_TRAIN_STATE_SAVE_DELAY_SECONDS", "2.0"))
+)
 
 AUTO_TRAIN_DEFAULT_CONFIG: Dict[str, Any] = {
     "enabled": False,
@@ -159,6 +239,9 @@ AUTO_TRAIN_DEFAULT_CONFIG: Dict[str, Any] = {
     "language": DEFAULT_LANGUAGE,
     "stt_engine": DEFAULT_STT_ENGINE,
     "minimum_transcript_chars": 2,
+    "vad_gate_enabled": True,
+    "vad_min_speech_ms": 150,
+    "close_match_check": "guided",
     "delete_confirmed_wakes": False,
     "promote_close_misses": False,
     "schedule_hours": 24,
@@ -184,6 +267,12 @@ AUTO_TRAIN_DEFAULT_STATE: Dict[str, Any] = {
     "last_stt_model": "",
     "last_stt_device": "",
     "last_stt_compute_type": "",
+    "review_stt_clips": 0,
+    "review_stt_seconds": 0.0,
+    "review_vad_clips": 0,
+    "review_vad_seconds": 0.0,
+    "review_vad_skipped_clips": 0,
+    "review_transcript_cache_hits": 0,
     "last_train_started_at": "",
     "last_train_finished_at": "",
     "last_train_exit_code": None,
@@ -193,7 +282,58 @@ AUTO_TRAIN_DEFAULT_STATE: Dict[str, Any] = {
 }
 
 
+def _gzip_json_middleware(app):
+    """ASGI middleware that gzips complete JSON responses for clients that accept it.
+
+    Only 200 responses typed application/json are buffered and compressed, so
+    audio, model files, byte ranges and the training log event stream pass
+    through untouched. Responses that already carry an ETag are left alone
+    too, since their validator (a file's sha256 or stat tag) names the
+    uncompressed bytes.
+    """
+
+    async def middleware(scope, receive, send):
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("accept-encoding", ""):
+            await app(scope, receive, send)
+            return
+        deferred: Dict[str, Any] | None = None
+        chunks: List[bytes] = []
+
+        async def send_compressed(message):
+            nonlocal deferred
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] == 200
+                    and headers.get("content-type", "").startswith("application/json")
+                    and "content-encoding" not in headers
+                    and "etag" not in headers
+                ):
+                    deferred = message
+                    return
+            elif deferred is not None and message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+                body = b"".join(chunks)
+                headers = MutableHeaders(raw=deferred["headers"])
+                if len(body) >= JSON_GZIP_MINIMUM_BYTES:
+                    body = gzip.compress(body, compresslevel=6)
+                    headers["Content-Encoding"] = "gzip"
+                    headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+                start, deferred = deferred, None
+                await send(start)
+                message = {"type": "http.response.body", "body": body}
+            await send(message)
+
+        await app(scope, receive, send_compressed)
+
+    return middleware
+
+
 app = FastAPI(title="microWakeWord Personal Samples")
+app.add_middleware(_gzip_json_middleware)
 
 # Serve static UI
 STATIC_DIR.mkdir(parents=True, exist_ok=True)
@@ -226,13 +366,18 @@ STATE: Dict[str, Any] = {
     "training": {
         "running": False,
         "exit_code": None,
-        "log_lines": [],
         "log_path": None,
+        "log_id": secrets.token_hex(6),
         "safe_word": None,
     },
 }
 
 STATE_LOCK = threading.Lock()
+# Recent training output for the session payloads. Appends come from the
+# training thread once per subprocess line, so they use their own lock rather
+# than STATE_LOCK, which every API handler takes.
+TRAIN_LOG_RING: deque[str] = deque(maxlen=TRAIN_LOG_MEMORY_LINES)
+TRAIN_LOG_RING_LOCK = threading.Lock()
 SAMPLES_LOCK = threading.Lock()
 DATA_MANAGEMENT_LOCK = threading.RLock()
 PIPER_CATALOG_LOCK = threading.Lock()
@@ -241,8 +386,12 @@ AUTO_TRAIN_LOCK = threading.RLock()
 AUTO_TRAIN_WAKE_EVENT = threading.Event()
 AUTO_TRAIN_STOP_EVENT = threading.Event()
 AUTO_TRAIN_REVIEW_QUEUE: queue.Queue[str] = queue.Queue()
-AUTO_TRAIN_QUEUED_FILES: set[str] = set()
+# Queued or in-review capture names mapped to the monotonic time they were queued.
+AUTO_TRAIN_QUEUED_FILES: Dict[str, float] = {}
+AUTO_TRAIN_QUEUE_LATENCIES: deque[float] = deque(maxlen=AUTO_TRAIN_QUEUE_LATENCY_SAMPLES)
 AUTO_TRAIN_WORKER: threading.Thread | None = None
+AUTO_TRAIN_REVIEW_THREADS: List[threading.Thread] = []
+AUTO_TRAIN_STATE_SAVE_TIMER: threading.Timer | None = None
 TRAINING_RUNTIME_LOCK = threading.RLock()
 TRAINING_STOP_EVENT = threading.Event()
 TRAINING_PROCESS: subprocess.Popen | None = None
@@ -250,16 +399,28 @@ TRAINING_THREAD: threading.Thread | None = None
 AUTO_TRAIN_RUNTIME: Dict[str, Any] = {
     "review_running": False,
     "review_file": "",
+    "reviews_in_flight": 0,
+    "review_workers": AUTO_TRAIN_REVIEW_WORKERS,
     "scheduler_running": False,
     "training_pending_consumed": 0,
+    "vad_gate_error": "",
 }
 LAN_ADDRESS_CACHE: Dict[str, Any] = {"value": "", "fetched_at": 0.0}
 FASTER_WHISPER_MODEL_LOCK = threading.RLock()
 FASTER_WHISPER_MODEL_CACHE: Dict[Tuple[str, str, str], Any] = {}
-FASTER_WHISPER_TRANSCRIBE_LOCK = threading.RLock()
+# One transcription slot per review worker: parallel reviews share the loaded
+# model, which CTranslate2 and ONNX Runtime both allow.
+FASTER_WHISPER_TRANSCRIBE_SLOTS = threading.BoundedSemaphore(AUTO_TRAIN_REVIEW_WORKERS)
 PARAKEET_ONNX_MODEL_LOCK = threading.RLock()
 PARAKEET_ONNX_MODEL_CACHE: Dict[Tuple[str, str, Tuple[str, ...]], Any] = {}
-PARAKEET_ONNX_TRANSCRIBE_LOCK = threading.RLock()
+PARAKEET_ONNX_TRANSCRIBE_SLOTS = threading.BoundedSemaphore(AUTO_TRAIN_REVIEW_WORKERS)
+# Which STT engine has a model resident, what it cost to load, and when it
+# was last used; guarded by STT_RESIDENCY_LOCK, which is never held while
+# taking AUTO_TRAIN_LOCK or a model lock.
+STT_RESIDENCY_LOCK = threading.Lock()
+STT_MODEL_RESIDENCY: Dict[str, Dict[str, Any]] = {}
+STT_MODEL_FOOTPRINTS: Dict[str, int] = {}
+STT_MODEL_EVENTS: deque = deque(maxlen=STT_MODEL_EVENT_LIMIT)
 PIPER_CATALOG_CACHE: Dict[str, Any] = {
     "fetched_at": 0.0,
     "entries": None,
@@ -268,6 +429,31 @@ OMNIVOICE_CATALOG_CACHE: Dict[str, Any] = {
     "fetched_at": 0.0,
     "entries": None,
 }
+LANGUAGE_CATALOG_LOCK = threading.Lock()
+LANGUAGE_CATALOG_CACHE: Dict[str, Any] = {
+    "key": None,
+    "built_at": 0.0,
+    "languages": None,
+    "by_code": {},
+}
+AUDIO_INDEX_LOCK = threading.RLock()
+AUDIO_INDEX_CONNECTIONS: Dict[str, sqlite3.Connection] = {}
+AUDIO_INDEX_DIRECTORY_MTIMES: Dict[Tuple[str, str], int] = {}
+AUDIO_INDEX_BUCKET_COUNTS: Dict[Tuple[str, str], int] = {}
+CAPTURE_GAIN_MIGRATION_THREAD: threading.Thread | None = None
+TRAINED_WAKE_WORD_INDEX_LOCK = threading.RLock()
+TRAINED_WAKE_WORD_INDEX: Dict[str, Any] = {}
+FFMPEG_SLOTS = threading.BoundedSemaphore(FFMPEG_MAX_WORKERS)
+# Upload handlers are async; conversion, file and sidecar writes run here so one slow clip cannot stall the event loop.
+UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix="upload")
+TRAIN_LOG_SUBSCRIBERS_LOCK = threading.Lock()
+TRAIN_LOG_SUBSCRIBERS: set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+# Data tab usage per managed path, filled by a background walker so GET /api/data never walks the trees.
+DATA_USAGE_LOCK = threading.Lock()
+DATA_USAGE_CACHE: Dict[str, Dict[str, Any]] = {}
+DATA_USAGE_FORCED: set[str] = set()
+DATA_USAGE_WAKE_EVENT = threading.Event()
+DATA_USAGE_THREAD: threading.Thread | None = None
 
 
 def _managed_data_registry() -> List[Dict[str, Any]]:
@@ -333,8 +519,12 @@ def _managed_data_location(paths: List[Path]) -> str:
     return ", ".join(locations)
 
 
-def _managed_path_usage(path: Path) -> Tuple[int, int]:
-    """Return allocated bytes and file count without following symbolic links."""
+def _managed_path_usage(path: Path, dir_mtimes: Optional[Dict[str, int]] = None) -> Tuple[int, int]:
+    """Return allocated bytes and file count without following symbolic links.
+
+    When ``dir_mtimes`` is given, the mtime of every directory walked is
+    recorded in it so the result can be revalidated without another walk.
+    """
     if not os.path.lexists(path):
         return 0, 0
     total_bytes = 0
@@ -356,6 +546,8 @@ def _managed_path_usage(path: Path) -> Tuple[int, int]:
             total_bytes += allocated or int(stat.st_size)
             file_count += 1
             continue
+        if dir_mtimes is not None:
+            dir_mtimes[current] = int(stat.st_mtime_ns)
         try:
             with os.scandir(current) as entries:
                 stack.extend(entry.path for entry in entries)
@@ -364,26 +556,140 @@ def _managed_path_usage(path: Path) -> Tuple[int, int]:
     return total_bytes, file_count
 
 
+def _managed_usage_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.lstat(path)
+    except OSError:
+        return None
+    return int(stat.st_mode), int(stat.st_mtime_ns), int(stat.st_size)
+
+
+def _scan_managed_usage(path: Path) -> Dict[str, Any]:
+    dir_mtimes: Dict[str, int] = {}
+    signature = _managed_usage_signature(path)
+    size_bytes, file_count = _managed_path_usage(path, dir_mtimes)
+    return {
+        "size_bytes": size_bytes,
+        "file_count": file_count,
+        "signature": signature,
+        "dir_mtimes": dir_mtimes,
+        "scanned_at": time.time(),
+    }
+
+
+def _managed_usage_is_current(path: Path, entry: Dict[str, Any]) -> bool:
+    """Cheap revalidation: one stat per directory instead of one per file.
+
+    Adding, removing or renaming entries bumps the parent directory's mtime.
+    Files rewritten in place do not, so every entry is also rescanned once it
+    is older than DATA_USAGE_MAX_AGE_SECONDS.
+    """
+    if time.time() - float(entry["scanned_at"]) > DATA_USAGE_MAX_AGE_SECONDS:
+        return False
+    if _managed_usage_signature(path) != entry["signature"]:
+        return False
+    for directory, mtime_ns in entry["dir_mtimes"].items():
+        try:
+            if os.stat(directory).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _managed_usage_paths() -> List[Path]:
+    return [Path(path) for definition in _managed_data_registry() for path in definition["paths"]]
+
+
+def _refresh_managed_usage() -> int:
+    """Rescan every managed path whose cached usage is missing, stale or forced."""
+    refreshed = 0
+    for path in _managed_usage_paths():
+        key = os.fspath(path)
+        with DATA_USAGE_LOCK:
+            entry = DATA_USAGE_CACHE.get(key)
+            forced = key in DATA_USAGE_FORCED
+            DATA_USAGE_FORCED.discard(key)
+        if entry is not None and not forced and _managed_usage_is_current(path, entry):
+            continue
+        scanned = _scan_managed_usage(path)
+        with DATA_USAGE_LOCK:
+            # A delete that finished during the walk already stored the fresher value.
+            if DATA_USAGE_CACHE.get(key) is entry:
+                DATA_USAGE_CACHE[key] = scanned
+                refreshed += 1
+    return refreshed
+
+
+def _request_managed_usage_refresh(force: bool = False) -> None:
+    if force:
+        with DATA_USAGE_LOCK:
+            DATA_USAGE_FORCED.update(os.fspath(path) for path in _managed_usage_paths())
+    DATA_USAGE_WAKE_EVENT.set()
+
+
+def _managed_usage_worker() -> None:
+    while True:
+        try:
+            _refresh_managed_usage()
+        except Exception as exc:
+            print(f"[WARN] Data usage scan failed: {exc}", flush=True)
+        DATA_USAGE_WAKE_EVENT.wait(DATA_USAGE_CHECK_SECONDS)
+        DATA_USAGE_WAKE_EVENT.clear()
+
+
+def _start_managed_usage_worker() -> None:
+    global DATA_USAGE_THREAD
+    with DATA_USAGE_LOCK:
+        if DATA_USAGE_THREAD is not None and DATA_USAGE_THREAD.is_alive():
+            return
+        DATA_USAGE_THREAD = threading.Thread(target=_managed_usage_worker, name="data-usage", daemon=True)
+        DATA_USAGE_THREAD.start()
+
+
 def _managed_data_payload() -> Dict[str, Any]:
     items: List[Dict[str, Any]] = []
     total_size = 0
     total_files = 0
-    with DATA_MANAGEMENT_LOCK:
-        for definition in _managed_data_registry():
-            paths = [Path(path) for path in definition["paths"]]
-            usages = [_managed_path_usage(path) for path in paths]
-            size_bytes = sum(size for size, _ in usages)
-            file_count = sum(count for _, count in usages)
-            total_size += size_bytes
-            total_files += file_count
-            items.append({
-                **{key: value for key, value in definition.items() if key != "paths"},
-                "location": _managed_data_location(paths),
-                "size_bytes": size_bytes,
-                "file_count": file_count,
-                "exists": any(os.path.lexists(path) for path in paths),
-            })
-    return {"ok": True, "items": items, "total_size_bytes": total_size, "total_file_count": total_files}
+    oldest_scan: Optional[float] = None
+    pending = False
+    now = time.time()
+    with DATA_USAGE_LOCK:
+        cache = dict(DATA_USAGE_CACHE)
+        forced = bool(DATA_USAGE_FORCED)
+    for definition in _managed_data_registry():
+        paths = [Path(path) for path in definition["paths"]]
+        entries = [cache.get(os.fspath(path)) for path in paths]
+        known = [entry for entry in entries if entry is not None]
+        size_bytes = sum(int(entry["size_bytes"]) for entry in known)
+        file_count = sum(int(entry["file_count"]) for entry in known)
+        item_pending = len(known) < len(entries)
+        updated_at = min((float(entry["scanned_at"]) for entry in known), default=None)
+        if updated_at is not None:
+            oldest_scan = updated_at if oldest_scan is None else min(oldest_scan, updated_at)
+        pending = pending or item_pending
+        total_size += size_bytes
+        total_files += file_count
+        items.append({
+            **{key: value for key, value in definition.items() if key != "paths"},
+            "location": _managed_data_location(paths),
+            "size_bytes": size_bytes,
+            "file_count": file_count,
+            "exists": any(os.path.lexists(path) for path in paths),
+            "usage_pending": item_pending,
+            "updated_seconds_ago": None if updated_at is None else max(0, int(now - updated_at)),
+        })
+    if pending:
+        _request_managed_usage_refresh()
+    return {
+        "ok": True,
+        "items": items,
+        "total_size_bytes": total_size,
+        "total_file_count": total_files,
+        "usage_pending": pending,
+        "refreshing": pending or forced,
+        "updated_seconds_ago": None if oldest_scan is None else max(0, int(now - oldest_scan)),
+    }
 
 
 def _remove_managed_path(path: Path) -> None:
@@ -398,13 +704,22 @@ def _remove_managed_path(path: Path) -> None:
 def _clear_auto_review_queue() -> None:
     with AUTO_TRAIN_LOCK:
         AUTO_TRAIN_QUEUED_FILES.clear()
+    with AUDIO_INDEX_LOCK:
+        with contextlib.suppress(sqlite3.Error, OSError):
+            connection = _audio_index_connection()
+            with connection:
+                connection.execute("DELETE FROM review_queue")
+    stop_markers = 0
     while True:
         try:
-            AUTO_TRAIN_REVIEW_QUEUE.get_nowait()
+            file_name = AUTO_TRAIN_REVIEW_QUEUE.get_nowait()
         except queue.Empty:
             break
         else:
+            stop_markers += not file_name
             AUTO_TRAIN_REVIEW_QUEUE.task_done()
+    for _marker in range(stop_markers):
+        AUTO_TRAIN_REVIEW_QUEUE.put("")
 
 
 def _delete_managed_data_item(item_id: str) -> Dict[str, Any]:
@@ -418,11 +733,17 @@ def _delete_managed_data_item(item_id: str) -> Dict[str, Any]:
             if STATE["training"]["running"]:
                 raise RuntimeError("Stop training before deleting trainer data.")
         with AUTO_TRAIN_LOCK:
-            if AUTO_TRAIN_RUNTIME.get("review_running"):
-                raise RuntimeError("Wait for the current automatic audio review to finish before deleting data.")
-        previous_size = sum(_managed_path_usage(path)[0] for path in paths)
+            if item_id == "stt_models" and AUTO_TRAIN_RUNTIME.get("review_running"):
+                raise RuntimeError("Wait for the current automatic audio review to finish before deleting STT models.")
+        with DATA_USAGE_LOCK:
+            cached = [DATA_USAGE_CACHE.get(os.fspath(path)) for path in paths]
+        previous_size = sum(
+            int(entry["size_bytes"]) if entry is not None else _managed_path_usage(path)[0]
+            for path, entry in zip(paths, cached)
+        )
         for path in paths:
             _remove_managed_path(path)
+            _forget_indexed_directory(path)
         if item_id == "personal_samples":
             PERSONAL_DIR.mkdir(parents=True, exist_ok=True)
             _sync_personal_samples_state()
@@ -436,6 +757,10 @@ def _delete_managed_data_item(item_id: str) -> Dict[str, Any]:
             _clear_auto_review_queue()
         elif item_id == "trim_history":
             TRIM_HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+        # The paths are gone or empty now, so scanning them again is trivial.
+        emptied = {os.fspath(path): _scan_managed_usage(path) for path in paths}
+        with DATA_USAGE_LOCK:
+            DATA_USAGE_CACHE.update(emptied)
     payload = _managed_data_payload()
     payload.update({"deleted_id": item_id, "released_bytes": previous_size})
     return payload
@@ -444,6 +769,8 @@ def _delete_managed_data_item(item_id: str) -> Dict[str, Any]:
 _silero_vad_model = None
 _silero_vad_utils = None
 _SILERO_VAD_LOCK = threading.Lock()
+# Silero keeps recurrent state inside the model, so one clip is scored at a time.
+_SILERO_VAD_RUN_LOCK = threading.Lock()
 VAD_SELECTION_PAD_START_S = 0.08
 VAD_SELECTION_PAD_END_S = 0.08
 
@@ -467,25 +794,31 @@ def _load_silero_vad():
 
 def _detect_speech_segments(wav_bytes: bytes) -> List[Dict[str, float]]:
     """Run Silero VAD on 16 kHz mono WAV bytes. Return {start, end} seconds."""
-    model, utils = _load_silero_vad()
-    torch = utils["torch"]
     import numpy as np
-    from silero_vad.utils_vad import get_speech_timestamps
 
     with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
         raw = wf.readframes(wf.getnframes())
-    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+    return _detect_speech_in_samples(np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0)
+
+
+def _detect_speech_in_samples(samples) -> List[Dict[str, float]]:
+    """Run Silero VAD on 16 kHz mono float32 samples. Return {start, end} seconds."""
+    model, utils = _load_silero_vad()
+    torch = utils["torch"]
+    from silero_vad.utils_vad import get_speech_timestamps
+
     audio_tensor = torch.from_numpy(samples)
 
-    timestamps = get_speech_timestamps(
-        audio_tensor,
-        model,
-        sampling_rate=16000,
-        threshold=0.5,
-        min_speech_duration_ms=150,
-        min_silence_duration_ms=100,
-        return_seconds=True,
-    )
+    with _SILERO_VAD_RUN_LOCK:
+        timestamps = get_speech_timestamps(
+            audio_tensor,
+            model,
+            sampling_rate=16000,
+            threshold=0.5,
+            min_speech_duration_ms=150,
+            min_silence_duration_ms=100,
+            return_seconds=True,
+        )
     return [{"start": round(ts["start"], 3), "end": round(ts["end"], 3)} for ts in timestamps]
 
 
@@ -502,11 +835,14 @@ def _reset_audio_dir(directory: Path):
                 p.unlink()
             except Exception:
                 pass
+    _forget_indexed_directory(directory)
 
 
 def _list_audio_samples(directory: Path) -> List[str]:
     directory.mkdir(parents=True, exist_ok=True)
-    return sorted(p.name for p in directory.glob("*.wav"))
+    if _audio_index_directory_key(directory) is None:
+        return sorted(p.name for p in directory.glob("*.wav"))
+    return [row["name"] for row in _indexed_audio_rows(directory, order="name")]
 
 
 def _list_personal_samples() -> List[str]:
@@ -521,10 +857,31 @@ def _list_captured_sample_names() -> List[str]:
     return _list_audio_samples(CAPTURED_DIR)
 
 
-def _sync_trained_wake_word_artifacts() -> None:
-    """Mirror generated output artifacts into /data/trained_wake_words for live wake-word links."""
+def _artifact_signature(path: Path) -> List[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [int(stat.st_mtime_ns), int(stat.st_size)]
+
+
+def _directory_mtime(path: Path) -> int | None:
+    try:
+        return int(os.stat(path).st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _sync_trained_wake_word_artifacts(sources: Optional[Dict[str, Any]] = None) -> None:
+    """Mirror generated output artifacts into /data/trained_wake_words for live wake-word links.
+
+    ``sources`` maps each output JSON to the signatures seen when it was last
+    published.  Unchanged packages whose copies still exist are skipped without
+    being parsed; the mapping is updated in place.
+    """
     TRAINED_WAKE_WORDS_DIR.mkdir(parents=True, exist_ok=True)
     candidate_jsons: list[Path] = []
+    published: Dict[str, Any] = {}
 
     output_dir = DATA_DIR / "output"
     if output_dir.exists():
@@ -536,6 +893,17 @@ def _sync_trained_wake_word_artifacts() -> None:
     for json_path in sorted(candidate_jsons):
         if TRAINED_WAKE_WORDS_DIR in json_path.parents:
             continue
+        key = os.fspath(json_path)
+        signature = _artifact_signature(json_path)
+        previous = (sources or {}).get(key)
+        if (
+            isinstance(previous, dict)
+            and previous.get("signature") == signature
+            and previous.get("model_signature") == _artifact_signature(Path(str(previous.get("model") or "")))
+            and all((TRAINED_WAKE_WORDS_DIR / name).exists() for name in previous.get("published") or [])
+        ):
+            published[key] = previous
+            continue
         try:
             meta = json.loads(json_path.read_text(encoding="utf-8"))
         except Exception:
@@ -562,6 +930,108 @@ def _sync_trained_wake_word_artifacts() -> None:
                 json_path.unlink()
             with contextlib.suppress(Exception):
                 tflite_path.unlink()
+            continue
+        published[key] = {
+            "signature": signature,
+            "model": os.fspath(tflite_path),
+            "model_signature": _artifact_signature(tflite_path),
+            "published": [json_path.name, tflite_path.name],
+        }
+
+    if sources is not None:
+        sources.clear()
+        sources.update(published)
+
+
+def _trained_wake_word_watch_mtimes() -> Dict[str, int | None]:
+    """Directory mtimes that reveal new, removed or renamed output packages."""
+    watched: Dict[str, int | None] = {os.fspath(ROOT_DIR): _directory_mtime(ROOT_DIR)}
+    output_dir = DATA_DIR / "output"
+    watched[os.fspath(output_dir)] = _directory_mtime(output_dir)
+    for current, _dirs, _files in os.walk(output_dir):
+        watched[current] = _directory_mtime(Path(current))
+    return watched
+
+
+def _trained_wake_word_index_is_current(index: Dict[str, Any]) -> bool:
+    if index.get("version") != TRAINED_WAKE_WORD_INDEX_VERSION:
+        return False
+    if index.get("directory") != os.fspath(TRAINED_WAKE_WORDS_DIR):
+        return False
+    watched = index.get("watch")
+    if not isinstance(watched, dict) or not watched:
+        return False
+    return all(_directory_mtime(Path(directory)) == mtime for directory, mtime in watched.items())
+
+
+def _rebuild_trained_wake_word_index(previous: Dict[str, Any]) -> Dict[str, Any]:
+    same_directory = previous.get("directory") == os.fspath(TRAINED_WAKE_WORDS_DIR)
+    sources = dict(previous.get("sources") or {}) if same_directory else {}
+    packages_before = previous.get("packages") if same_directory and isinstance(previous.get("packages"), dict) else {}
+    # Output directories are stamped before syncing so a run that lands mid-sync marks the index dirty again.
+    watched = _trained_wake_word_watch_mtimes()
+    _sync_trained_wake_word_artifacts(sources)
+    watched[os.fspath(TRAINED_WAKE_WORDS_DIR)] = _directory_mtime(TRAINED_WAKE_WORDS_DIR)
+
+    files_before = previous.get("files") if same_directory and isinstance(previous.get("files"), dict) else {}
+    files: Dict[str, Dict[str, Any]] = {}
+    with contextlib.suppress(OSError), os.scandir(TRAINED_WAKE_WORDS_DIR) as entries:
+        for entry in entries:
+            if not entry.is_file() or Path(entry.name).suffix.lower() not in {".json", ".tflite"}:
+                continue
+            signature = _artifact_signature(Path(entry.path))
+            cached = files_before.get(entry.name)
+            if isinstance(cached, dict) and cached.get("signature") == signature and cached.get("sha256"):
+                files[entry.name] = cached
+                continue
+            try:
+                digest = hashlib.sha256(Path(entry.path).read_bytes()).hexdigest()
+            except OSError:
+                continue
+            files[entry.name] = {"signature": signature, "sha256": digest}
+    packages: Dict[str, Any] = {}
+    for name in files:
+        if not name.endswith(".json"):
+            continue
+        path = TRAINED_WAKE_WORDS_DIR / name
+        signature = _artifact_signature(path)
+        cached = packages_before.get(name)
+        if isinstance(cached, dict) and cached.get("signature") == signature:
+            packages[name] = cached
+            continue
+        try:
+            metadata = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            metadata = None
+        packages[name] = {"signature": signature, "metadata": metadata if isinstance(metadata, dict) else None}
+
+    index = {
+        "version": TRAINED_WAKE_WORD_INDEX_VERSION,
+        "directory": os.fspath(TRAINED_WAKE_WORDS_DIR),
+        "watch": watched,
+        "sources": sources,
+        "files": files,
+        "packages": packages,
+    }
+    try:
+        _write_json_object(TRAINED_WAKE_WORD_INDEX_FILE, index)
+    except OSError as exc:
+        print(f"[WARN] Could not save the trained wake-word index: {exc}", flush=True)
+    return index
+
+
+def _trained_wake_word_index(force: bool = False) -> Dict[str, Any]:
+    """Return the published artifact index, rebuilding it only when a watched directory changed."""
+    with TRAINED_WAKE_WORD_INDEX_LOCK:
+        index = TRAINED_WAKE_WORD_INDEX
+        if not index:
+            index = _read_json_object(TRAINED_WAKE_WORD_INDEX_FILE)
+        if force or not _trained_wake_word_index_is_current(index):
+            index = _rebuild_trained_wake_word_index(index)
+        if index is not TRAINED_WAKE_WORD_INDEX:
+            TRAINED_WAKE_WORD_INDEX.clear()
+            TRAINED_WAKE_WORD_INDEX.update(index)
+        return TRAINED_WAKE_WORD_INDEX
 
 
 def _metadata_float(value: Any) -> float | None:
@@ -600,22 +1070,21 @@ def _esphome_manifest(metadata: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _list_trained_wake_words(base_url: str = "") -> List[Dict[str, Any]]:
-    _sync_trained_wake_word_artifacts()
+    index = _trained_wake_word_index()
+    files = index["files"]
     base = str(base_url or "").rstrip("/")
     rows: List[Dict[str, Any]] = []
     seen: set[str] = set()
 
-    for json_path in sorted(TRAINED_WAKE_WORDS_DIR.glob("*.json")):
-        try:
-            meta = json.loads(json_path.read_text(encoding="utf-8"))
-        except Exception:
-            continue
+    for json_name, package in sorted(index["packages"].items()):
+        meta = package.get("metadata")
         if not isinstance(meta, dict):
             continue
 
+        json_path = TRAINED_WAKE_WORDS_DIR / json_name
         model_name = str(meta.get("model") or json_path.with_suffix(".tflite").name).strip()
         model_path = TRAINED_WAKE_WORDS_DIR / Path(model_name).name
-        if not model_path.exists():
+        if model_path.name not in files:
             continue
 
         safe = json_path.stem
@@ -674,6 +1143,47 @@ def _list_trained_wake_words(base_url: str = "") -> List[Dict[str, Any]]:
     return rows
 
 
+def _stat_etag(stat: os.stat_result) -> str:
+    """Strong validator for files that are only ever replaced atomically."""
+    return f'"{stat.st_ino:x}-{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _request_is_fresh(request: Request, etag: str, modified_at: float | None) -> bool:
+    """Evaluate If-None-Match, falling back to If-Modified-Since as RFC 9110 requires."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or modified_at is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(modified_at) <= since
+
+
+def _validated_file_response(
+    request: Request,
+    path: Path,
+    *,
+    etag: str,
+    media_type: str,
+    filename: str,
+) -> Response:
+    """Serve a file with validators, answering conditional requests with 304.
+
+    FileResponse handles Range and If-Range against the same ETag.
+    """
+    stat = path.stat()
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _request_is_fresh(request, etag, stat.st_mtime):
+        headers["Last-Modified"] = formatdate(stat.st_mtime, usegmt=True)
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, filename=filename, headers=headers, stat_result=stat)
+
+
 def _request_base_url(request: Request) -> str:
     return str(request.base_url).rstrip("/")
 
@@ -789,6 +1299,13 @@ def _normalize_auto_train_config(values: Dict[str, Any] | None, *, base: Dict[st
         "language": language,
         "stt_engine": _normalize_stt_engine(source.get("stt_engine")),
         "minimum_transcript_chars": _bounded_int(source.get("minimum_transcript_chars"), 2, 1, 100),
+        "vad_gate_enabled": _config_bool(source.get("vad_gate_enabled"), True),
+        "vad_min_speech_ms": _bounded_int(source.get("vad_min_speech_ms"), 150, 0, 10000),
+        "close_match_check": (
+            str(source.get("close_match_check") or "").strip().lower()
+            if str(source.get("close_match_check") or "").strip().lower() in CLOSE_MATCH_CHECKS
+            else CLOSE_MATCH_CHECKS[0]
+        ),
         "delete_confirmed_wakes": _config_bool(source.get("delete_confirmed_wakes")),
         "promote_close_misses": _config_bool(source.get("promote_close_misses")),
         "schedule_hours": schedule_hours,
@@ -820,10 +1337,43 @@ def _save_auto_train_config_locked() -> None:
 
 
 def _save_auto_train_state_locked() -> None:
+    global AUTO_TRAIN_STATE_SAVE_TIMER
+    if AUTO_TRAIN_STATE_SAVE_TIMER is not None:
+        AUTO_TRAIN_STATE_SAVE_TIMER.cancel()
+        AUTO_TRAIN_STATE_SAVE_TIMER = None
     persisted = {key: AUTO_TRAIN_STATE.get(key) for key in AUTO_TRAIN_DEFAULT_STATE}
     _write_json_object(AUTO_TRAIN_STATE_FILE, persisted)
 
 
+def _schedule_auto_train_state_save_locked() -> None:
+    """Persist AUTO_TRAIN_STATE after a short delay so a burst of reviews costs one write.
+
+    Review bookkeeping (last transcript, STT runtime, pending negatives) goes
+    through here; schedule, training and Tater link changes still save
+    immediately.
+    """
+    global AUTO_TRAIN_STATE_SAVE_TIMER
+    if AUTO_TRAIN_STATE_SAVE_DELAY_SECONDS <= 0:
+        _save_auto_train_state_locked()
+        return
+    if AUTO_TRAIN_STATE_SAVE_TIMER is not None:
+        return
+    timer = threading.Timer(AUTO_TRAIN_STATE_SAVE_DELAY_SECONDS, _flush_auto_train_state)
+    timer.daemon = True
+    AUTO_TRAIN_STATE_SAVE_TIMER = timer
+    timer.start()
+
+
+def _flush_auto_train_state() -> None:
+    with AUTO_TRAIN_LOCK:
+        if AUTO_TRAIN_STATE_SAVE_TIMER is None:
+            return
+        try:
+            _save_auto_train_state_locked()
+        except OSError as exc:
+            print(f"[WARN] Could not save auto-train state: {exc}", flush=True)
+
+
 def _parse_iso_datetime(value: Any) -> datetime | None:
     token = str(value or "").strip()
     if not token:
@@ -867,7 +1417,12 @@ def _auto_train_status_payload() -> Dict[str, Any]:
         return {
             "config": _public_auto_train_config(),
             "state": dict(AUTO_TRAIN_STATE),
-            "runtime": dict(AUTO_TRAIN_RUNTIME),
+            "runtime": {
+                **AUTO_TRAIN_RUNTIME,
+                **_auto_review_queue_stats_locked(),
+                **_auto_review_stt_savings_locked(),
+                "stt_models": _stt_residency_status(),
+            },
             "stt_engines": _stt_engine_catalog(language),
             "advertised_base_url": _advertised_base_url(),
             "trainer_link": _tater_link_public_status(),
@@ -1062,39 +1617,15 @@ def _unlink_tater() -> Dict[str, Any]:
 
 
 def _normalize_transcript_text(value: Any) -> str:
-    text = unicodedata.normalize("NFKC", str(value or "")).casefold().replace("_", " ")
-    text = re.sub(r"[^\w]+", " ", text, flags=re.UNICODE)
-    return re.sub(r"\s+", " ", text).strip()
+    return phrase_match.normalize_text(value)
 
 
 def _transcript_contains_wake_phrase(transcript: Any, wake_phrase: Any) -> bool:
-    normalized_transcript = _normalize_transcript_text(transcript)
-    normalized_phrase = _normalize_transcript_text(wake_phrase)
-    if not normalized_transcript or not normalized_phrase:
-        return False
-    return f" {normalized_phrase} " in f" {normalized_transcript} "
+    return phrase_match.compile_phrase(wake_phrase).contains(transcript)
 
 
 def _wake_phrase_similarity(transcript: Any, wake_phrase: Any) -> float:
-    transcript_words = _normalize_transcript_text(transcript).split()
-    phrase_words = _normalize_transcript_text(wake_phrase).split()
-    if not transcript_words or not phrase_words:
-        return 0.0
-    if _transcript_contains_wake_phrase(transcript, wake_phrase):
-        return 1.0
-
-    phrase_token = "".join(phrase_words)
-    minimum_words = max(1, len(phrase_words) - 1)
-    maximum_words = min(len(transcript_words), len(phrase_words) + 1)
-    best_score = 0.0
-    for word_count in range(minimum_words, maximum_words + 1):
-        for start in range(0, len(transcript_words) - word_count + 1):
-            candidate = "".join(transcript_words[start : start + word_count])
-            best_score = max(
-                best_score,
-                SequenceMatcher(None, candidate, phrase_token).ratio(),
-            )
-    return best_score
+    return phrase_match.compile_phrase(wake_phrase).score(transcript).similarity
 
 
 def _captured_event_is_close_miss(metadata: Dict[str, Any]) -> bool:
@@ -1114,6 +1645,15 @@ def _captured_event_is_auto_reviewable(
     return event_type in {"captured", "trigger", "false_trigger"} or "wake" in event_type or "detect" in event_type
 
 
+def _auto_review_priority(metadata: Dict[str, Any]) -> int:
+    event_type = str(metadata.get("event_type") or "captured").strip().lower()
+    if "close" in event_type:
+        return AUTO_REVIEW_CLOSE_MISS_PRIORITY
+    if event_type == "false_trigger":
+        return AUTO_REVIEW_FALSE_TRIGGER_PRIORITY
+    return AUTO_REVIEW_DEFAULT_PRIORITY
+
+
 def _resolve_faster_whisper_runtime(device_value: Any, compute_value: Any) -> Tuple[str, str]:
     requested_device = str(device_value or "auto").strip().lower()
     if requested_device not in {"auto", "cuda", "cpu"}:
@@ -1136,39 +1676,66 @@ def _resolve_faster_whisper_runtime(device_value: Any, compute_value: Any) -> Tu
     return device, compute_type
 
 
-def _load_faster_whisper_model(*, model_name: str, device: str, compute_type: str):
+def _load_faster_whisper_model(*, model_name: str, device: str, compute_type: str, reason: str = "on_demand"):
     cache_key = (model_name, device, compute_type)
+    if cache_key not in FASTER_WHISPER_MODEL_CACHE:
+        _make_room_for_stt_model(STT_ENGINE_FASTER_WHISPER)
     with FASTER_WHISPER_MODEL_LOCK:
         cached = FASTER_WHISPER_MODEL_CACHE.get(cache_key)
         if cached is not None:
+            _touch_stt_model(STT_ENGINE_FASTER_WHISPER)
             return cached
         try:
             from faster_whisper import WhisperModel
         except Exception as exc:
             raise RuntimeError(f"faster-whisper is unavailable: {exc}") from exc
 
+        started = time.monotonic()
+        rss_before = _process_rss_bytes()
         AUTO_TRAIN_MODEL_DIR.mkdir(parents=True, exist_ok=True)
+        kwargs: Dict[str, Any] = {"num_workers": AUTO_TRAIN_REVIEW_WORKERS}
+        if device == "cpu" and AUTO_TRAIN_REVIEW_WORKERS > 1:
+            kwargs["cpu_threads"] = max(1, (os.cpu_count() or 1) // AUTO_TRAIN_REVIEW_WORKERS)
         model = WhisperModel(
             model_name,
             device=device,
             compute_type=compute_type,
             download_root=str(AUTO_TRAIN_MODEL_DIR),
+            **kwargs,
         )
         FASTER_WHISPER_MODEL_CACHE.clear()
         FASTER_WHISPER_MODEL_CACHE[cache_key] = model
-        return model
+    _record_stt_model_load(
+        STT_ENGINE_FASTER_WHISPER,
+        model=model_name,
+        device=device,
+        reason=reason,
+        started=started,
+        rss_before=rss_before,
+    )
+    return model
+
+
+def _record_stt_runtime(engine: str, model: str, device: str, compute_type: str) -> None:
+    with AUTO_TRAIN_LOCK:
+        AUTO_TRAIN_STATE["last_stt_engine"] = engine
+        AUTO_TRAIN_STATE["last_stt_model"] = model
+        AUTO_TRAIN_STATE["last_stt_device"] = device
+        AUTO_TRAIN_STATE["last_stt_compute_type"] = compute_type
+        _schedule_auto_train_state_save_locked()
 
 
-def _transcribe_capture_with_faster_whisper(audio_path: Path, *, model: str, language: str) -> str:
+def _transcribe_capture_with_faster_whisper(audio_path: Path, *, model: str, language: str, samples=None) -> str:
+    """Transcribe one capture; ``samples`` is its decoded 16 kHz float32 audio, read from disk when omitted."""
     device, compute_type = _resolve_faster_whisper_runtime("auto", "auto")
     whisper_model = _load_faster_whisper_model(
         model_name=model,
         device=device,
         compute_type=compute_type,
     )
-    with FASTER_WHISPER_TRANSCRIBE_LOCK:
+    with FASTER_WHISPER_TRANSCRIBE_SLOTS:
         segments, _info = whisper_model.transcribe(
-            str(audio_path),
+            str(audio_path) if samples is None else samples,
             language=language or None,
             beam_size=1,
             condition_on_previous_text=False,
@@ -1178,21 +1745,134 @@ def _transcribe_capture_with_faster_whisper(audio_path: Path, *, model: str, lan
             " ",
             " ".join(str(segment.text or "").strip() for segment in segments),
         ).strip()
-    with AUTO_TRAIN_LOCK:
-        AUTO_TRAIN_STATE["last_stt_engine"] = STT_ENGINE_FASTER_WHISPER
-        AUTO_TRAIN_STATE["last_stt_model"] = model
-        AUTO_TRAIN_STATE["last_stt_device"] = device
-        AUTO_TRAIN_STATE["last_stt_compute_type"] = compute_type
-        _save_auto_train_state_locked()
+    _record_stt_runtime(STT_ENGINE_FASTER_WHISPER, model, device, compute_type)
     return transcript
 
 
+def _text_compression_ratio(text: str) -> float:
+    """zlib compression ratio of a transcript, as faster-whisper computes it to spot repetition loops."""
+    data = text.encode("utf-8")
+    return len(data) / len(zlib.compress(data)) if data else 0.0
+
+
+def _transcribe_captures_with_faster_whisper(
+    audio_paths: List[Path],
+    *,
+    model: str,
+    language: str,
+    samples: List[Any] | None = None,
+) -> List[str]:
+    """Greedy-decode several short captures with one CTranslate2 generate call.
+
+    Each clip is padded into its own 30 s Whisper window, the way
+    faster-whisper's batched pipeline feeds VAD chunks, so clips in a batch
+    cannot run into each other's transcripts. The batch is transcribe()'s
+    first attempt: greedy at temperature 0 with beam_size=1. A window whose
+    no-speech probability and average log-probability fail transcribe()'s
+    thresholds yields an empty transcript, as transcribe() would skip it. A
+    window that would make transcribe() fall back to a higher temperature
+    (compression ratio too high or log-probability too low) is transcribed
+    again on its own by transcribe(), so its result goes through the same
+    fallback schedule. Batched windows decode without timestamp tokens,
+    which only changes segment boundaries, not the joined text of a clip
+    this short. Clips longer than a window, and batches without a language
+    to force, are transcribed on their own. ``samples`` holds already
+    decoded audio per path; entries that are missing or None are read from
+    disk.
+    """
+    import ctranslate2
+    import numpy as np
+    from faster_whisper.tokenizer import Tokenizer
+
+    device, compute_type = _resolve_faster_whisper_runtime("auto", "auto")
+    whisper_model = _load_faster_whisper_model(
+        model_name=model,
+        device=device,
+        compute_type=compute_type,
+    )
+    clips = [
+        samples[index] if samples and samples[index] is not None else _normalized_wav_float32(audio_path)
+        for index, audio_path in enumerate(audio_paths)
+    ]
+    if not language and whisper_model.model.is_multilingual:
+        return [
+            _transcribe_capture_with_faster_whisper(audio_path, model=model, language=language, samples=clip)
+            for audio_path, clip in zip(audio_paths, clips)
+        ]
+    feature_extractor = whisper_model.feature_extractor
+    window_samples = int(feature_extractor.n_samples)
+    window_frames = int(feature_extractor.nb_max_frames)
+    transcripts: List[str] = [""] * len(audio_paths)
+    batch_indexes: List[int] = []
+    features = []
+    for index, (audio_path, clip) in enumerate(zip(audio_paths, clips)):
+        if clip.shape[0] > window_samples:
+            transcripts[index] = _transcribe_capture_with_faster_whisper(
+                audio_path,
+                model=model,
+                language=language,
+                samples=clip,
+            )
+            continue
+        padded = np.pad(clip, (0, window_samples - clip.shape[0]))
+        features.append(feature_extractor(padded)[:, :window_frames])
+        batch_indexes.append(index)
+    if not batch_indexes:
+        return transcripts
+
+    tokenizer = Tokenizer(
+        whisper_model.hf_tokenizer,
+        whisper_model.model.is_multilingual,
+        task="transcribe",
+        language=language or None,
+    )
+    prompt = list(tokenizer.sot_sequence) + [tokenizer.no_timestamps]
+    with FASTER_WHISPER_TRANSCRIBE_SLOTS:
+        results = whisper_model.model.generate(
+            ctranslate2.StorageView.from_array(np.ascontiguousarray(np.stack(features), dtype=np.float32)),
+            [prompt] * len(features),
+            beam_size=1,
+            suppress_blank=True,
+            suppress_tokens=[-1],
+            return_scores=True,
+            return_no_speech_prob=True,
+        )
+    fallback_indexes: List[int] = []
+    for index, result in zip(batch_indexes, results):
+        tokens = [token for token in result.sequences_ids[0] if token < tokenizer.eot]
+        # Scores are length-normalized; faster-whisper averages over the tokens plus EOT.
+        avg_logprob = float(result.scores[0]) * len(tokens) / (len(tokens) + 1)
+        if (
+            float(result.no_speech_prob) > FASTER_WHISPER_NO_SPEECH_THRESHOLD
+            and avg_logprob <= FASTER_WHISPER_LOG_PROB_THRESHOLD
+        ):
+            continue
+        text = tokenizer.decode(tokens).strip()
+        if (
+            _text_compression_ratio(text) > FASTER_WHISPER_COMPRESSION_RATIO_THRESHOLD
+            or avg_logprob < FASTER_WHISPER_LOG_PROB_THRESHOLD
+        ):
+            fallback_indexes.append(index)
+            continue
+        transcripts[index] = re.sub(r"\s+", " ", text).strip()
+    for index in fallback_indexes:
+        transcripts[index] = _transcribe_capture_with_faster_whisper(
+            audio_paths[index],
+            model=model,
+            language=language,
+            samples=clips[index],
+        )
+    _record_stt_runtime(STT_ENGINE_FASTER_WHISPER, model, device, compute_type)
+    return transcripts
+
+
 def _transcribe_capture_with_faster_whisper_guided(
     audio_path: Path,
     *,
     model: str,
     language: str,
     wake_phrase: str,
+    samples=None,
 ) -> str:
     normalized_phrase = _normalize_transcript_text(wake_phrase)
     if not normalized_phrase:
@@ -1203,9 +1883,9 @@ def _transcribe_capture_with_faster_whisper_guided(
         device=device,
         compute_type=compute_type,
     )
-    with FASTER_WHISPER_TRANSCRIBE_LOCK:
+    with FASTER_WHISPER_TRANSCRIBE_SLOTS:
         segments, _info = whisper_model.transcribe(
-            str(audio_path),
+            str(audio_path) if samples is None else samples,
             language=language or None,
             beam_size=5,
             best_of=5,
@@ -1221,6 +1901,71 @@ def _transcribe_capture_with_faster_whisper_guided(
         ).strip()
 
 
+def _score_wake_phrase_with_faster_whisper(
+    audio_path: Path,
+    *,
+    model: str,
+    language: str,
+    wake_phrase: str,
+    transcript: str,
+    samples=None,
+) -> float:
+    """Score how strongly a capture supports the wake phrase, with one encoder pass.
+
+    The wake phrase and the free transcript, as decoded, are each
+    force-aligned against the same encoder output. The confidence is the ratio of their per-token
+    geometric-mean probabilities, capped at 1, so 1.0 means the audio
+    supports the phrase at least as well as what the first pass heard.
+    """
+    import ctranslate2
+    import numpy as np
+    from faster_whisper.tokenizer import Tokenizer
+
+    normalized_phrase = _normalize_transcript_text(wake_phrase)
+    if not normalized_phrase:
+        return 0.0
+    device, compute_type = _resolve_faster_whisper_runtime("auto", "auto")
+    whisper_model = _load_faster_whisper_model(
+        model_name=model,
+        device=device,
+        compute_type=compute_type,
+    )
+    if samples is None:
+        samples = _normalized_wav_float32(audio_path)
+    feature_extractor = whisper_model.feature_extractor
+    window_samples = int(feature_extractor.n_samples)
+    clip = samples[:window_samples]
+    features = feature_extractor(np.pad(clip, (0, window_samples - clip.shape[0])))
+    features = features[:, : int(feature_extractor.nb_max_frames)]
+    num_frames = max(1, clip.shape[0] // int(feature_extractor.hop_length))
+    tokenizer = Tokenizer(
+        whisper_model.hf_tokenizer,
+        whisper_model.model.is_multilingual,
+        task="transcribe",
+        language=language or None,
+    )
+    # The reference is what the first pass decoded, casing and punctuation
+    # included: faster-whisper's segment text is the decoded tokens joined, so
+    # encoding it again gives back the decoder's own tokens.
+    heard = str(transcript or "").strip()
+    texts = [tokenizer.encode(f" {normalized_phrase}")] + ([tokenizer.encode(f" {heard}")] if heard else [])
+    with FASTER_WHISPER_TRANSCRIBE_SLOTS:
+        encoder_output = whisper_model.model.encode(
+            ctranslate2.StorageView.from_array(np.ascontiguousarray(features[None], dtype=np.float32)),
+            to_cpu=False,
+        )
+        alignments = [
+            whisper_model.model.align(encoder_output, list(tokenizer.sot_sequence), [tokens], [num_frames])[0]
+            for tokens in texts
+        ]
+    mean_logprobs = [
+        float(np.mean(np.log(np.maximum(np.asarray(alignment.text_token_probs, dtype=np.float64), 1e-12))))
+        for alignment in alignments
+    ]
+    relative = mean_logprobs[0] - (mean_logprobs[1] if len(mean_logprobs) > 1 else 0.0)
+    return float(min(1.0, np.exp(relative)))
+
+
 def _parakeet_onnx_providers() -> List[str]:
     try:
         import onnxruntime as ort
@@ -1237,7 +1982,7 @@ def _parakeet_onnx_providers() -> List[str]:
     return resolved
 
 
-def _load_parakeet_onnx_model():
+def _load_parakeet_onnx_model(*, reason: str = "on_demand"):
     try:
         import onnx_asr
     except Exception as exc:
@@ -1249,10 +1994,15 @@ def _load_parakeet_onnx_model():
         DEFAULT_PARAKEET_ONNX_QUANTIZATION,
         providers,
     )
+    if cache_key not in PARAKEET_ONNX_MODEL_CACHE:
+        _make_room_for_stt_model(STT_ENGINE_PARAKEET_ONNX)
     with PARAKEET_ONNX_MODEL_LOCK:
         cached = PARAKEET_ONNX_MODEL_CACHE.get(cache_key)
         if cached is not None:
+            _touch_stt_model(STT_ENGINE_PARAKEET_ONNX)
             return cached
+        started = time.monotonic()
+        rss_before = _process_rss_bytes()
         suffix = (
             f".{DEFAULT_PARAKEET_ONNX_QUANTIZATION}"
             if DEFAULT_PARAKEET_ONNX_QUANTIZATION
@@ -1311,111 +2061,516 @@ def _load_parakeet_onnx_model():
                     os.environ[key] = value
         PARAKEET_ONNX_MODEL_CACHE.clear()
         PARAKEET_ONNX_MODEL_CACHE[cache_key] = model
-        return model
+    _record_stt_model_load(
+        STT_ENGINE_PARAKEET_ONNX,
+        model=DEFAULT_PARAKEET_ONNX_MODEL,
+        device=providers[0],
+        reason=reason,
+        started=started,
+        rss_before=rss_before,
+    )
+    return model
 
 
-def _normalized_wav_float32(audio_path: Path):
-    import numpy as np
+def _process_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
 
-    with wave.open(str(audio_path), "rb") as wav_file:
-        channels = wav_file.getnchannels()
-        sample_width = wav_file.getsampwidth()
-        sample_rate = wav_file.getframerate()
-        frames = wav_file.readframes(wav_file.getnframes())
-    if sample_width != 2 or sample_rate != TARGET_SAMPLE_RATE or channels < 1:
-        raise RuntimeError("STT input must be 16 kHz, 16-bit PCM WAV audio.")
-    samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
-    if channels > 1:
-        samples = samples.reshape((-1, channels)).mean(axis=1)
-    return samples / 32768.0
 
+def _record_stt_model_event(event: str, engine: str, *, model: str, reason: str, duration_s: float, size: int) -> None:
+    """Append a load/unload event; callers hold STT_RESIDENCY_LOCK."""
+    STT_MODEL_EVENTS.append(
+        {
+            "at": _iso_now(),
+            "event": event,
+            "engine": engine,
+            "model": model,
+            "reason": reason,
+            "duration_ms": round(duration_s * 1000, 1),
+            "bytes": size,
+        }
+    )
 
-def _transcribe_capture_with_parakeet(audio_path: Path, *, model: str, language: str) -> str:
-    parakeet_model = _load_parakeet_onnx_model()
-    kwargs: Dict[str, Any] = {
-        "sample_rate": TARGET_SAMPLE_RATE,
-        "channel": "mean",
-    }
-    if language:
-        kwargs["language"] = language
-    with PARAKEET_ONNX_TRANSCRIBE_LOCK:
-        result = parakeet_model.recognize(
-            _normalized_wav_float32(audio_path),
-            **kwargs,
-        )
-    providers = _parakeet_onnx_providers()
-    with AUTO_TRAIN_LOCK:
-        AUTO_TRAIN_STATE["last_stt_engine"] = STT_ENGINE_PARAKEET_ONNX
-        AUTO_TRAIN_STATE["last_stt_model"] = model
-        AUTO_TRAIN_STATE["last_stt_device"] = providers[0]
-        AUTO_TRAIN_STATE["last_stt_compute_type"] = DEFAULT_PARAKEET_ONNX_QUANTIZATION
-        _save_auto_train_state_locked()
-    return re.sub(r"\s+", " ", str(result or "")).strip()
 
+def _record_stt_model_load(
+    engine: str,
+    *,
+    model: str,
+    device: str,
+    reason: str,
+    started: float,
+    rss_before: int,
+) -> None:
+    """Note a freshly loaded model; its footprint is the process RSS growth across the load."""
+    now = time.monotonic()
+    size = max(0, _process_rss_bytes() - rss_before) if rss_before else 0
+    with STT_RESIDENCY_LOCK:
+        STT_MODEL_RESIDENCY[engine] = {
+            "model": model,
+            "device": device,
+            "loaded_at": _iso_now(),
+            "last_used": now,
+            "bytes": size,
+        }
+        if size:
+            STT_MODEL_FOOTPRINTS[engine] = size
+        _record_stt_model_event("load", engine, model=model, reason=reason, duration_s=now - started, size=size)
+    _make_room_for_stt_model(engine)
+    # Let the scheduler pick up the new idle deadline.
+    AUTO_TRAIN_WAKE_EVENT.set()
 
-def _transcribe_capture(audio_path: Path, *, engine: str, language: str) -> str:
-    token = _normalize_stt_engine(engine)
-    model = _managed_stt_model(token, language)
-    if token == STT_ENGINE_PARAKEET_ONNX:
-        return _transcribe_capture_with_parakeet(
-            audio_path,
-            model=model,
-            language=language,
-        )
-    return _transcribe_capture_with_faster_whisper(
-        audio_path,
-        model=model,
-        language=language,
-    )
 
+def _touch_stt_model(engine: str) -> None:
+    with STT_RESIDENCY_LOCK:
+        info = STT_MODEL_RESIDENCY.get(engine)
+        if info is not None:
+            info["last_used"] = time.monotonic()
 
-def _clear_stt_model_caches(*, keep_engine: str) -> None:
-    token = _normalize_stt_engine(keep_engine)
-    cleared = False
-    if token != STT_ENGINE_FASTER_WHISPER:
-        with FASTER_WHISPER_TRANSCRIBE_LOCK:
-            with FASTER_WHISPER_MODEL_LOCK:
-                cleared = bool(FASTER_WHISPER_MODEL_CACHE) or cleared
-                FASTER_WHISPER_MODEL_CACHE.clear()
-    if token != STT_ENGINE_PARAKEET_ONNX:
-        with PARAKEET_ONNX_TRANSCRIBE_LOCK:
-            with PARAKEET_ONNX_MODEL_LOCK:
-                cleared = bool(PARAKEET_ONNX_MODEL_CACHE) or cleared
-                PARAKEET_ONNX_MODEL_CACHE.clear()
-    if cleared:
+
+def _unload_stt_model(engine: str, *, reason: str) -> bool:
+    """Drop an engine's cached model. Reviews already transcribing keep their own reference."""
+    if engine == STT_ENGINE_PARAKEET_ONNX:
+        lock, cache = PARAKEET_ONNX_MODEL_LOCK, PARAKEET_ONNX_MODEL_CACHE
+    else:
+        lock, cache = FASTER_WHISPER_MODEL_LOCK, FASTER_WHISPER_MODEL_CACHE
+    started = time.monotonic()
+    with lock:
+        if not cache:
+            return False
+        cache.clear()
         gc.collect()
+    with STT_RESIDENCY_LOCK:
+        info = STT_MODEL_RESIDENCY.pop(engine, {})
+        _record_stt_model_event(
+            "unload",
+            engine,
+            model=str(info.get("model") or ""),
+            reason=reason,
+            duration_s=time.monotonic() - started,
+            size=int(info.get("bytes") or 0),
+        )
+    return True
 
 
-def _queue_auto_review(file_name: str) -> bool:
-    safe_file_name = Path(str(file_name or "")).name
-    if not safe_file_name:
-        return False
+def _make_room_for_stt_model(engine: str) -> None:
+    """Unload other engines, least recently used first, until ``engine`` fits STT_MODEL_RAM_BUDGET_BYTES.
+
+    The budget is checked against each model's last measured footprint. A
+    model that alone exceeds the budget still loads, since review cannot run
+    without it.
+    """
+    if STT_MODEL_RAM_BUDGET_BYTES <= 0:
+        return
+    with STT_RESIDENCY_LOCK:
+        own = STT_MODEL_RESIDENCY.get(engine)
+        needed = int(own["bytes"]) if own else STT_MODEL_FOOTPRINTS.get(engine, 0)
+        others = sorted(
+            (info["last_used"], name, int(info.get("bytes") or 0))
+            for name, info in STT_MODEL_RESIDENCY.items()
+            if name != engine
+        )
+    resident = sum(size for _last_used, _name, size in others)
+    for _last_used, name, size in others:
+        if resident + needed <= STT_MODEL_RAM_BUDGET_BYTES:
+            break
+        if _unload_stt_model(name, reason="ram_budget"):
+            resident -= size
+
+
+def _unload_idle_stt_models() -> float | None:
+    """Unload models idle past STT_MODEL_IDLE_UNLOAD_SECONDS; return seconds until the next one is due."""
+    if STT_MODEL_IDLE_UNLOAD_SECONDS <= 0:
+        return None
+    now = time.monotonic()
+    with STT_RESIDENCY_LOCK:
+        idle = {name: now - float(info["last_used"]) for name, info in STT_MODEL_RESIDENCY.items()}
+    next_due: float | None = None
+    for name, idle_seconds in idle.items():
+        remaining = STT_MODEL_IDLE_UNLOAD_SECONDS - idle_seconds
+        if remaining <= 0:
+            _unload_stt_model(name, reason="idle")
+        elif next_due is None or remaining < next_due:
+            next_due = remaining
+    return next_due
+
+
+def _preload_stt_model() -> None:
+    """Load the configured engine's model ahead of the first capture."""
     with AUTO_TRAIN_LOCK:
-        if safe_file_name in AUTO_TRAIN_QUEUED_FILES:
+        config = dict(AUTO_TRAIN_CONFIG)
+    if not config.get("enabled"):
+        return
+    engine = _normalize_stt_engine(config.get("stt_engine"))
+    try:
+        if engine == STT_ENGINE_PARAKEET_ONNX:
+            _load_parakeet_onnx_model(reason="preload")
+        else:
+            device, compute_type = _resolve_faster_whisper_runtime("auto", "auto")
+            _load_faster_whisper_model(
+                model_name=_managed_stt_model(engine, config.get("language")),
+                device=device,
+                compute_type=compute_type,
+                reason="preload",
+            )
+    except Exception as exc:
+        print(f"[WARN] STT model preload failed: {exc}", flush=True)
+
+
+def _start_stt_model_preload() -> None:
+    threading.Thread(target=_preload_stt_model, name="stt-model-preload", daemon=True).start()
+
+
+def _stt_residency_status() -> Dict[str, Any]:
+    now = time.monotonic()
+    with STT_RESIDENCY_LOCK:
+        resident = {
+            name: {
+                "model": info["model"],
+                "device": info["device"],
+                "loaded_at": info["loaded_at"],
+                "idle_seconds": round(now - float(info["last_used"]), 1),
+                "bytes": info["bytes"],
+            }
+            for name, info in STT_MODEL_RESIDENCY.items()
+        }
+        events = list(STT_MODEL_EVENTS)
+    return {
+        "resident": resident,
+        "resident_bytes": sum(int(info["bytes"]) for info in resident.values()),
+        "ram_budget_bytes": STT_MODEL_RAM_BUDGET_BYTES,
+        "idle_unload_seconds": STT_MODEL_IDLE_UNLOAD_SECONDS,
+        "events": events,
+    }
+
+
+def _normalized_wav_float32(audio_path: Path):
+    return _wav_bytes_float32(audio_path.read_bytes())
+
+
+def _wav_bytes_float32(wav_bytes: bytes):
+    """Decode 16 kHz, 16-bit PCM WAV bytes to mono float32 samples in [-1, 1)."""
+    import numpy as np
+
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wav_file:
+        channels = wav_file.getnchannels()
+        sample_width = wav_file.getsampwidth()
+        sample_rate = wav_file.getframerate()
+        frames = wav_file.readframes(wav_file.getnframes())
+    if sample_width != 2 or sample_rate != TARGET_SAMPLE_RATE or channels < 1:
+        raise RuntimeError("STT input must be 16 kHz, 16-bit PCM WAV audio.")
+    samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
+    if channels > 1:
+        samples = samples.reshape((-1, channels)).mean(axis=1)
+    return samples / 32768.0
+
+
+def _transcribe_capture_with_parakeet(audio_path: Path, *, model: str, language: str, samples=None) -> str:
+    parakeet_model = _load_parakeet_onnx_model()
+    kwargs: Dict[str, Any] = {
+        "sample_rate": TARGET_SAMPLE_RATE,
+        "channel": "mean",
+    }
+    if language:
+        kwargs["language"] = language
+    if samples is None:
+        samples = _normalized_wav_float32(audio_path)
+    with PARAKEET_ONNX_TRANSCRIBE_SLOTS:
+        result = parakeet_model.recognize(samples, **kwargs)
+    providers = _parakeet_onnx_providers()
+    _record_stt_runtime(STT_ENGINE_PARAKEET_ONNX, model, providers[0], DEFAULT_PARAKEET_ONNX_QUANTIZATION)
+    return re.sub(r"\s+", " ", str(result or "")).strip()
+
+
+def _transcribe_captures_with_parakeet(
+    audio_paths: List[Path],
+    *,
+    model: str,
+    language: str,
+    samples: List[Any] | None = None,
+) -> List[str]:
+    """Recognize several captures in one padded onnx-asr batch."""
+    parakeet_model = _load_parakeet_onnx_model()
+    kwargs: Dict[str, Any] = {
+        "sample_rate": TARGET_SAMPLE_RATE,
+        "channel": "mean",
+    }
+    if language:
+        kwargs["language"] = language
+    waveforms = [
+        samples[index] if samples and samples[index] is not None else _normalized_wav_float32(audio_path)
+        for index, audio_path in enumerate(audio_paths)
+    ]
+    with PARAKEET_ONNX_TRANSCRIBE_SLOTS:
+        results = parakeet_model.recognize(waveforms, **kwargs)
+    providers = _parakeet_onnx_providers()
+    _record_stt_runtime(STT_ENGINE_PARAKEET_ONNX, model, providers[0], DEFAULT_PARAKEET_ONNX_QUANTIZATION)
+    return [re.sub(r"\s+", " ", str(result or "")).strip() for result in results]
+
+
+def _transcribe_capture(audio_path: Path, *, engine: str, language: str, samples=None) -> str:
+    token = _normalize_stt_engine(engine)
+    model = _managed_stt_model(token, language)
+    if token == STT_ENGINE_PARAKEET_ONNX:
+        return _transcribe_capture_with_parakeet(
+            audio_path,
+            model=model,
+            language=language,
+            samples=samples,
+        )
+    return _transcribe_capture_with_faster_whisper(
+        audio_path,
+        model=model,
+        language=language,
+        samples=samples,
+    )
+
+
+def _transcribe_captures(
+    audio_paths: List[Path],
+    *,
+    engine: str,
+    language: str,
+    samples: List[Any] | None = None,
+) -> List[str]:
+    """Transcribe a batch of captures, returning one transcript per path in order.
+
+    ``samples`` optionally carries each capture's decoded float32 audio so
+    the engines do not read and decode the files again.
+    """
+    if len(audio_paths) == 1:
+        return [
+            _transcribe_capture(
+                audio_paths[0],
+                engine=engine,
+                language=language,
+                samples=samples[0] if samples else None,
+            )
+        ]
+    token = _normalize_stt_engine(engine)
+    model = _managed_stt_model(token, language)
+    if token == STT_ENGINE_PARAKEET_ONNX:
+        return _transcribe_captures_with_parakeet(audio_paths, model=model, language=language, samples=samples)
+    return _transcribe_captures_with_faster_whisper(audio_paths, model=model, language=language, samples=samples)
+
+
+def _clear_stt_model_caches(*, keep_engine: str) -> None:
+    token = _normalize_stt_engine(keep_engine)
+    for engine in (STT_ENGINE_FASTER_WHISPER, STT_ENGINE_PARAKEET_ONNX):
+        if engine != token:
+            _unload_stt_model(engine, reason="engine_switch")
+
+
+def _persist_auto_reviews_queued(entries: List[Tuple[str, int | None]]) -> None:
+    """Mark captures queued in the review queue table; a None priority keeps the stored one."""
+    now_ns = time.time_ns()
+    try:
+        with AUDIO_INDEX_LOCK:
+            connection = _audio_index_connection()
+            with connection:
+                connection.executemany(
+                    "INSERT INTO review_queue (name, state, priority, queued_ns, updated_ns) "
+                    "VALUES (?, 'queued', COALESCE(?, ?), ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET state = 'queued', "
+                    "priority = COALESCE(?, priority), queued_ns = excluded.queued_ns, "
+                    "lease_expires_ns = 0, updated_ns = excluded.updated_ns",
+                    [
+                        (name, priority, AUTO_REVIEW_DEFAULT_PRIORITY, now_ns, now_ns, priority)
+                        for name, priority in entries
+                    ],
+                )
+    except sqlite3.Error as exc:
+        print(f"[WARN] Review queue update failed; reviews will not survive a restart: {exc}", flush=True)
+
+
+def _track_auto_review(file_name: str) -> bool:
+    """Add a capture to the in-memory queue unless it is already queued or in review."""
+    with AUTO_TRAIN_LOCK:
+        if file_name in AUTO_TRAIN_QUEUED_FILES:
             return False
-        AUTO_TRAIN_QUEUED_FILES.add(safe_file_name)
+        AUTO_TRAIN_QUEUED_FILES[file_name] = time.monotonic()
+    return True
+
+
+def _queue_auto_review(file_name: str, metadata: Dict[str, Any] | None = None) -> bool:
+    """Queue one capture for review and persist it so a restart resumes it.
+
+    ``metadata`` sets the review priority from the event type; without it a
+    re-queued capture keeps the priority it was first queued with.
+    """
+    safe_file_name = Path(str(file_name or "")).name
+    if not safe_file_name or not _track_auto_review(safe_file_name):
+        return False
+    priority = None if metadata is None else _auto_review_priority(metadata)
+    _persist_auto_reviews_queued([(safe_file_name, priority)])
     AUTO_TRAIN_REVIEW_QUEUE.put(safe_file_name)
-    AUTO_TRAIN_WAKE_EVENT.set()
     return True
 
 
+def _claim_auto_reviews(tokens: List[str]) -> List[str]:
+    """Lease the highest-priority queued captures, one per queue entry taken.
+
+    The in-memory queue only counts and wakes workers; which captures a worker
+    reviews comes from the table, ordered by priority and then queue time.
+    Entries whose capture never reached the table (a failed write) are
+    reviewed by name. Entries left over because another worker already
+    claimed their capture are marked done here, so the queue's join() still
+    balances.
+    """
+    now_ns = time.time_ns()
+    try:
+        with AUDIO_INDEX_LOCK:
+            connection = _audio_index_connection()
+            with connection:
+                claimed = [
+                    str(row[0])
+                    for row in connection.execute(
+                        "SELECT name FROM review_queue WHERE state = 'queued' "
+                        "ORDER BY priority, queued_ns, name LIMIT ?",
+                        (len(tokens),),
+                    )
+                ]
+                connection.executemany(
+                    "UPDATE review_queue SET state = 'in_flight', lease_expires_ns = ?, "
+                    "attempts = attempts + 1, updated_ns = ? WHERE name = ?",
+                    [(now_ns + int(AUTO_TRAIN_REVIEW_LEASE_SECONDS * 1e9), now_ns, name) for name in claimed],
+                )
+                unknown = [
+                    name
+                    for name in dict.fromkeys(tokens)
+                    if name not in claimed
+                    and connection.execute("SELECT 1 FROM review_queue WHERE name = ?", (name,)).fetchone() is None
+                ]
+    except sqlite3.Error as exc:
+        print(f"[WARN] Review queue claim failed; reviewing in arrival order: {exc}", flush=True)
+        return tokens
+    batch = claimed + unknown[: len(tokens) - len(claimed)]
+    for _token in range(len(tokens) - len(batch)):
+        AUTO_TRAIN_REVIEW_QUEUE.task_done()
+    return batch
+
+
+def _finish_auto_reviews(file_names: List[str]) -> None:
+    """Mark reviewed captures done, keeping only the newest AUTO_REVIEW_QUEUE_DONE_MAX_ROWS done rows."""
+    now_ns = time.time_ns()
+    try:
+        with AUDIO_INDEX_LOCK:
+            connection = _audio_index_connection()
+            with connection:
+                connection.executemany(
+                    "UPDATE review_queue SET state = 'done', lease_expires_ns = 0, updated_ns = ? "
+                    "WHERE name = ? AND state = 'in_flight'",
+                    [(now_ns, name) for name in file_names],
+                )
+                connection.execute(
+                    "DELETE FROM review_queue WHERE rowid IN ("
+                    "SELECT rowid FROM review_queue WHERE state = 'done' "
+                    "ORDER BY updated_ns DESC LIMIT -1 OFFSET ?)",
+                    (AUTO_REVIEW_QUEUE_DONE_MAX_ROWS,),
+                )
+    except sqlite3.Error as exc:
+        print(f"[WARN] Review queue update failed: {exc}", flush=True)
+
+
+def _requeue_expired_auto_reviews() -> float | None:
+    """Queue again the reviews whose lease ran out; return seconds until the next lease expires.
+
+    Captures this process still has in review are left alone, so only work
+    abandoned by a process that exited mid-review is picked up again.
+    """
+    now_ns = time.time_ns()
+    try:
+        with AUDIO_INDEX_LOCK:
+            connection = _audio_index_connection()
+            leases = connection.execute(
+                "SELECT name, lease_expires_ns FROM review_queue WHERE state = 'in_flight'"
+            ).fetchall()
+    except sqlite3.Error as exc:
+        print(f"[WARN] Review queue lease check failed: {exc}", flush=True)
+        return None
+    with AUTO_TRAIN_LOCK:
+        held = set(AUTO_TRAIN_QUEUED_FILES)
+    expired = [str(name) for name, expires_ns in leases if int(expires_ns) <= now_ns and name not in held]
+    if expired:
+        print(f"[WARN] Re-queuing {len(expired)} review(s) whose lease expired.", flush=True)
+        for file_name in expired:
+            _queue_auto_review(file_name)
+    pending = [int(expires_ns) for name, expires_ns in leases if int(expires_ns) > now_ns and name not in held]
+    return (min(pending) - now_ns) / 1e9 if pending else None
+
+
+def _restore_auto_review_queue() -> int:
+    """Resume the reviews an earlier run left queued or in flight, costing O(pending) rather than an inbox scan.
+
+    Reviews still marked in flight were cut off when that run stopped, so
+    they are queued again straight away instead of waiting out their lease;
+    ones this process is reviewing itself are left alone. The first start
+    with an empty queue table seeds it from the inbox once.
+    """
+    with AUTO_TRAIN_LOCK:
+        enabled = bool(AUTO_TRAIN_CONFIG.get("enabled"))
+    if not enabled:
+        return 0
+    try:
+        with AUDIO_INDEX_LOCK:
+            connection = _audio_index_connection()
+            seeded = connection.execute("SELECT 1 FROM review_queue LIMIT 1").fetchone() is not None
+            rows = connection.execute(
+                "SELECT name, state FROM review_queue WHERE state IN ('queued', 'in_flight') "
+                "ORDER BY priority, queued_ns, name"
+            ).fetchall()
+    except sqlite3.Error as exc:
+        print(f"[WARN] Review queue unavailable; scanning the inbox instead: {exc}", flush=True)
+        return _queue_pending_auto_reviews()
+    if not seeded:
+        return _queue_pending_auto_reviews()
+    with AUTO_TRAIN_LOCK:
+        held = set(AUTO_TRAIN_QUEUED_FILES)
+    abandoned = [str(name) for name, state in rows if state == "in_flight" and name not in held]
+    if abandoned:
+        print(f"[WARN] Re-queuing {len(abandoned)} review(s) left in flight by the previous run.", flush=True)
+    queued = 0
+    for file_name in abandoned:
+        if _queue_auto_review(file_name):
+            queued += 1
+    for name, state in rows:
+        if state == "queued" and _track_auto_review(str(name)):
+            AUTO_TRAIN_REVIEW_QUEUE.put(str(name))
+            queued += 1
+    return queued
+
+
 def _queue_pending_auto_reviews(*, force: bool = False) -> int:
+    """Queue every inbox capture that still needs a review, from the audio index rather than the sidecars.
+
+    Used when the review config changes or a retry is forced; only captures
+    whose status has to be cleared have their sidecar rewritten.
+    """
     queued = 0
     with AUTO_TRAIN_LOCK:
         config = dict(AUTO_TRAIN_CONFIG)
     if not config.get("enabled"):
         return queued
     CAPTURED_DIR.mkdir(parents=True, exist_ok=True)
-    for audio_path in sorted(CAPTURED_DIR.glob("*.wav")):
-        metadata = _load_sidecar_json(audio_path)
+    for row in _indexed_audio_rows(CAPTURED_DIR, order="name"):
+        metadata = _indexed_row_metadata(row)
         if not _captured_event_is_auto_reviewable(metadata, config):
             continue
+        audio_path = CAPTURED_DIR / str(row["name"])
         status = str(metadata.get("auto_review_status") or "").strip()
         if status == "transcribing":
             metadata.pop("auto_review_status", None)
             _write_sidecar_json(audio_path, metadata)
             status = ""
-        if force and status in {"error", "no_speech", "wake_phrase_ambiguous"}:
+        reviewed_phrase = str(metadata.get("auto_review_wake_phrase") or "")
+        phrase_changed = (
+            status in AUTO_REVIEW_PHRASE_STATUSES
+            and bool(reviewed_phrase)
+            and _normalize_transcript_text(reviewed_phrase) != _normalize_transcript_text(config.get("wake_phrase"))
+        )
+        if phrase_changed or (force and status in {"error", "no_speech", "wake_phrase_ambiguous"}):
             metadata.pop("auto_review_status", None)
             _write_sidecar_json(audio_path, metadata)
             status = ""
@@ -1427,7 +2582,7 @@ def _queue_pending_auto_reviews(*, force: bool = False) -> int:
             status = ""
         if status:
             continue
-        if _queue_auto_review(audio_path.name):
+        if _queue_auto_review(audio_path.name, metadata):
             queued += 1
     return queued
 
@@ -1439,203 +2594,632 @@ def _record_auto_review_result(*, file_name: str, transcript: str = "", result:
         AUTO_TRAIN_STATE["last_review_transcript"] = transcript
         AUTO_TRAIN_STATE["last_review_result"] = result
         AUTO_TRAIN_STATE["last_review_error"] = error
-        _save_auto_train_state_locked()
+        _schedule_auto_train_state_save_locked()
 
 
-def _auto_review_capture(file_name: str) -> None:
+def _fail_auto_review(file_name: str, exc: BaseException) -> None:
+    error = str(exc)
+    with contextlib.suppress(Exception):
+        _commit_capture_metadata(
+            _resolve_audio_path(CAPTURED_DIR, file_name),
+            {
+                "auto_review_status": "error",
+                "auto_review_error": error,
+                "auto_reviewed_at": _iso_now(),
+            },
+        )
+    _record_auto_review_result(file_name=file_name, result="error", error=error)
+
+
+def _record_auto_review_timing(*, key: str, clips: int, seconds: float, skipped: int = 0) -> None:
+    with AUTO_TRAIN_LOCK:
+        AUTO_TRAIN_STATE[f"review_{key}_clips"] = int(AUTO_TRAIN_STATE.get(f"review_{key}_clips") or 0) + clips
+        AUTO_TRAIN_STATE[f"review_{key}_seconds"] = round(
+            float(AUTO_TRAIN_STATE.get(f"review_{key}_seconds") or 0.0) + seconds, 3
+        )
+        if skipped:
+            AUTO_TRAIN_STATE["review_vad_skipped_clips"] = (
+                int(AUTO_TRAIN_STATE.get("review_vad_skipped_clips") or 0) + skipped
+            )
+        _schedule_auto_train_state_save_locked()
+
+
+def _auto_review_stt_savings_locked() -> Dict[str, Any]:
+    """Estimate the STT time the VAD gate saved, net of the time spent running VAD."""
+    stt_clips = int(AUTO_TRAIN_STATE.get("review_stt_clips") or 0)
+    stt_seconds = float(AUTO_TRAIN_STATE.get("review_stt_seconds") or 0.0)
+    skipped = int(AUTO_TRAIN_STATE.get("review_vad_skipped_clips") or 0)
+    vad_seconds = float(AUTO_TRAIN_STATE.get("review_vad_seconds") or 0.0)
+    per_clip = stt_seconds / stt_clips if stt_clips else 0.0
+    return {
+        "stt_seconds_per_clip": round(per_clip, 3),
+        "vad_skipped_clips": skipped,
+        "stt_seconds_saved": round(skipped * per_clip - vad_seconds, 2),
+    }
+
+
+def _measure_capture_speech(audio_path: Path, samples=None) -> Dict[str, Any]:
+    """Run Silero VAD over a capture and return its speech time and ratio as sidecar fields."""
+    if samples is None:
+        samples = _normalized_wav_float32(audio_path)
+    segments = _detect_speech_in_samples(samples)
+    duration_s = samples.shape[0] / TARGET_SAMPLE_RATE
+    speech_s = sum(segment["end"] - segment["start"] for segment in segments)
+    return {
+        "auto_review_speech_ms": int(round(speech_s * 1000)),
+        "auto_review_speech_ratio": round(min(1.0, speech_s / duration_s), 4) if duration_s > 0 else 0.0,
+    }
+
+
+def _vad_gate_auto_reviews(
+    pending: List[Tuple[str, Path, Dict[str, Any], List[List[int] | None]]],
+    *,
+    config: Dict[str, Any],
+    updates: Dict[str, Any],
+    decoded: Dict[str, Any] | None = None,
+) -> Tuple[List[Tuple[str, Path, Dict[str, Any], List[List[int] | None]]], Dict[str, Dict[str, Any]], List[str]]:
+    """Settle captures Silero VAD hears no speech in as ``no_speech`` without STT.
+
+    Returns the captures that still need STT, the speech fields measured for
+    them, and any gated capture that changed on disk meanwhile. A capture
+    that cannot be decoded for VAD goes on to STT by itself; if VAD cannot
+    run at all, every capture goes on to STT as before.
+    """
+    minimum_ms = int(config.get("vad_min_speech_ms") or 0)
+    started = time.monotonic()
+    clips: Dict[str, Any] = {}
+    for file_name, audio_path, _metadata, _signature in pending:
+        samples = (decoded or {}).get(file_name)
+        if samples is None:
+            try:
+                samples = _normalized_wav_float32(audio_path)
+            except Exception as exc:
+                print(f"[WARN] VAD gate could not decode {file_name}, sending it to STT: {exc}", flush=True)
+                continue
+        clips[file_name] = samples
     try:
+        speech = {
+            file_name: _measure_capture_speech(audio_path, clips[file_name])
+            for file_name, audio_path, _metadata, _signature in pending
+            if file_name in clips
+        }
+    except Exception as exc:
+        error = str(exc) or exc.__class__.__name__
         with AUTO_TRAIN_LOCK:
-            config = dict(AUTO_TRAIN_CONFIG)
-            AUTO_TRAIN_RUNTIME["review_running"] = True
-            AUTO_TRAIN_RUNTIME["review_file"] = file_name
-        if not config.get("enabled"):
-            return
-        wake_phrase = str(config.get("wake_phrase") or "").strip()
-        if not wake_phrase:
-            _record_auto_review_result(file_name=file_name, result="waiting_for_wake_phrase")
-            return
-
+            first_failure = AUTO_TRAIN_RUNTIME.get("vad_gate_error") != error
+            AUTO_TRAIN_RUNTIME["vad_gate_error"] = error
+        if first_failure:
+            print(f"[WARN] VAD gate unavailable, sending captures straight to STT: {error}", flush=True)
+        return pending, {}, []
+    vad_seconds = time.monotonic() - started
+    with AUTO_TRAIN_LOCK:
+        AUTO_TRAIN_RUNTIME["vad_gate_error"] = ""
+
+    needs_stt: List[Tuple[str, Path, Dict[str, Any], List[List[int] | None]]] = []
+    changed: List[str] = []
+    for entry in pending:
+        file_name, audio_path, _metadata, signature = entry
+        if file_name not in speech or speech[file_name]["auto_review_speech_ms"] >= minimum_ms:
+            needs_stt.append(entry)
+            continue
+        file_updates = {
+            **updates,
+            **speech[file_name],
+            "auto_review_status": "no_speech",
+            "auto_review_reason": "VAD heard no speech, so STT was skipped; left for manual review.",
+        }
         try:
-            audio_path = _resolve_audio_path(CAPTURED_DIR, file_name)
-        except FileNotFoundError:
-            return
-        metadata = _load_sidecar_json(audio_path)
-        is_close_miss = _captured_event_is_close_miss(metadata)
-        status = str(metadata.get("auto_review_status") or "").strip()
-        if (
-            status == "wake_phrase_detected"
-            and config.get("delete_confirmed_wakes")
-            and not is_close_miss
-        ):
-            transcript = str(metadata.get("transcript") or "")
-            _remove_audio_with_sidecar(audio_path)
-            _record_auto_review_result(
-                file_name=file_name,
-                transcript=transcript,
-                result="deleted_confirmed_wake",
+            with DATA_MANAGEMENT_LOCK:
+                applied = _apply_auto_review(
+                    file_name, audio_path, signature, "", "keep", "vad_no_speech", file_updates
+                )
+        except Exception as exc:
+            with DATA_MANAGEMENT_LOCK:
+                _fail_auto_review(file_name, exc)
+            continue
+        if not applied and audio_path.exists():
+            changed.append(file_name)
+    _record_auto_review_timing(
+        key="vad",
+        clips=len(pending),
+        seconds=vad_seconds,
+        skipped=len(pending) - len(needs_stt),
+    )
+    return needs_stt, {file_name: speech[file_name] for file_name, *_rest in needs_stt if file_name in speech}, changed
+
+
+def _cached_transcripts(keys: Iterable[Tuple[str, str, str, str, str]]) -> Dict[Tuple[str, str, str, str, str], str]:
+    """Look up transcripts by (audio_sha256, engine, model, language, hint); a cache failure is a miss."""
+    found: Dict[Tuple[str, str, str, str, str], str] = {}
+    try:
+        with AUDIO_INDEX_LOCK:
+            connection = _audio_index_connection()
+            for key in keys:
+                row = connection.execute(
+                    "SELECT transcript FROM transcript_cache "
+                    "WHERE audio_sha256 = ? AND engine = ? AND model = ? AND language = ? AND hint = ?",
+                    key,
+                ).fetchone()
+                if row is not None:
+                    found[key] = str(row[0])
+    except sqlite3.Error as exc:
+        print(f"[WARN] Transcript cache lookup failed: {exc}", flush=True)
+    return found
+
+
+def _store_cached_transcripts(entries: Dict[Tuple[str, str, str, str, str], str]) -> None:
+    """Remember STT output for each key, keeping only the newest TRANSCRIPT_CACHE_MAX_ROWS entries."""
+    if not entries:
+        return
+    now_ns = time.time_ns()
+    try:
+        with AUDIO_INDEX_LOCK:
+            connection = _audio_index_connection()
+            connection.executemany(
+                "INSERT OR REPLACE INTO transcript_cache "
+                "(audio_sha256, engine, model, language, hint, transcript, created_ns) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(*key, transcript, now_ns) for key, transcript in entries.items()],
             )
-            return
-        if status or not _captured_event_is_auto_reviewable(metadata, config):
-            return
-        captured_wake_phrase = str(metadata.get("wake_word") or "").strip()
-        if captured_wake_phrase and _normalize_transcript_text(captured_wake_phrase) != _normalize_transcript_text(wake_phrase):
-            metadata["auto_review_status"] = "different_wake_phrase"
-            metadata["auto_review_reason"] = (
-                f"Capture is for '{captured_wake_phrase}', not configured phrase '{wake_phrase}'; left for manual review."
+            connection.execute(
+                "DELETE FROM transcript_cache WHERE rowid IN ("
+                "SELECT rowid FROM transcript_cache ORDER BY created_ns DESC LIMIT -1 OFFSET ?)",
+                (TRANSCRIPT_CACHE_MAX_ROWS,),
             )
-            metadata["auto_reviewed_at"] = _iso_now()
-            _write_sidecar_json(audio_path, metadata)
-            _record_auto_review_result(file_name=file_name, result="different_wake_phrase")
-            return
+            connection.commit()
+    except sqlite3.Error as exc:
+        print(f"[WARN] Transcript cache update failed: {exc}", flush=True)
 
-        metadata["auto_review_status"] = "transcribing"
-        metadata["auto_reviewed_at"] = _iso_now()
-        metadata["auto_review_wake_phrase"] = wake_phrase
-        stt_engine = _normalize_stt_engine(config.get("stt_engine"))
-        metadata["auto_review_stt_engine"] = stt_engine
-        metadata["auto_review_stt_model"] = _managed_stt_model(
-            stt_engine,
-            config.get("language"),
-        )
-        _write_sidecar_json(audio_path, metadata)
 
-        transcript = _transcribe_capture(
+def _capture_review_signature(audio_path: Path) -> List[List[int] | None]:
+    return [_artifact_signature(audio_path), _artifact_signature(_audio_sidecar_path(audio_path))]
+
+
+def _begin_auto_review(
+    file_name: str,
+    config: Dict[str, Any],
+    wake_phrase: str,
+) -> Tuple[Path, Dict[str, Any], List[List[int] | None]] | None:
+    """Run the pre-STT checks for one capture.
+
+    Returns its path, metadata and the WAV/sidecar signature STT will be
+    judged against, or None when the capture does not need STT.
+    """
+    try:
+        audio_path = _resolve_audio_path(CAPTURED_DIR, file_name)
+    except FileNotFoundError:
+        return None
+    metadata = _load_sidecar_json(audio_path)
+    is_close_miss = _captured_event_is_close_miss(metadata)
+    status = str(metadata.get("auto_review_status") or "").strip()
+    if (
+        status == "wake_phrase_detected"
+        and config.get("delete_confirmed_wakes")
+        and not is_close_miss
+    ):
+        transcript = str(metadata.get("transcript") or "")
+        _remove_audio_with_sidecar(audio_path)
+        _record_auto_review_result(
+            file_name=file_name,
+            transcript=transcript,
+            result="deleted_confirmed_wake",
+        )
+        return None
+    if status or not _captured_event_is_auto_reviewable(metadata, config):
+        return None
+    captured_wake_phrase = str(metadata.get("wake_word") or "").strip()
+    if captured_wake_phrase and _normalize_transcript_text(captured_wake_phrase) != _normalize_transcript_text(wake_phrase):
+        _commit_capture_metadata(
             audio_path,
-            engine=stt_engine,
-            language=str(config.get("language") or DEFAULT_LANGUAGE),
+            {
+                "auto_review_status": "different_wake_phrase",
+                "auto_review_reason": (
+                    f"Capture is for '{captured_wake_phrase}', not configured phrase '{wake_phrase}'; left for manual review."
+                ),
+                "auto_review_wake_phrase": wake_phrase,
+                "auto_reviewed_at": _iso_now(),
+            },
         )
-        normalized = _normalize_transcript_text(transcript)
-        metadata = _load_sidecar_json(audio_path)
-        metadata["transcript"] = transcript
-        metadata["transcribed_at"] = _iso_now()
-
-        if len(normalized) < int(config.get("minimum_transcript_chars") or 2):
-            metadata["auto_review_status"] = "no_speech"
-            metadata["auto_review_reason"] = "STT did not return enough text; left for manual review."
-            _write_sidecar_json(audio_path, metadata)
-            _record_auto_review_result(file_name=file_name, transcript=transcript, result="no_speech")
-            return
+        _record_auto_review_result(file_name=file_name, result="different_wake_phrase")
+        return None
+    return audio_path, metadata, _capture_review_signature(audio_path)
 
-        phrase_similarity = _wake_phrase_similarity(transcript, wake_phrase)
-        phrase_detected = _transcript_contains_wake_phrase(transcript, wake_phrase)
-        match_method = "exact" if phrase_detected else ""
-        metadata["auto_review_phrase_similarity"] = round(phrase_similarity, 4)
 
-        if (
-            not phrase_detected
-            and phrase_similarity >= WAKE_PHRASE_GUIDANCE_MIN_SIMILARITY
-            and stt_engine == STT_ENGINE_FASTER_WHISPER
-        ):
-            guided_transcript = _transcribe_capture_with_faster_whisper_guided(
-                audio_path,
-                model=str(metadata["auto_review_stt_model"]),
-                language=str(config.get("language") or DEFAULT_LANGUAGE),
-                wake_phrase=wake_phrase,
-            )
-            metadata["auto_review_guided_transcript"] = guided_transcript
+def _decide_auto_review(
+    audio_path: Path,
+    metadata: Dict[str, Any],
+    transcript: str,
+    *,
+    config: Dict[str, Any],
+    updates: Dict[str, Any],
+    audio_sha256: str = "",
+    samples=None,
+) -> Tuple[str, str, Dict[str, Any]]:
+    """Work out where a transcribed capture goes without touching it.
+
+    Returns ``(action, result, updates)`` where action is ``keep``,
+    ``promote``, ``negative`` or ``delete``. Runs outside the data lock,
+    including the close-match check for faster-whisper transcripts near the
+    wake phrase (alignment scoring, or the guided re-decode when configured),
+    whose result is cached per audio hash and wake-phrase hint when
+    ``audio_sha256`` is given.
+    """
+    wake_phrase = str(updates["auto_review_wake_phrase"])
+    stt_engine = str(updates["auto_review_stt_engine"])
+    is_close_miss = _captured_event_is_close_miss(metadata)
+    normalized = _normalize_transcript_text(transcript)
+    updates = {**updates, "transcript": transcript, "transcribed_at": _iso_now()}
+
+    if len(normalized) < int(config.get("minimum_transcript_chars") or 2):
+        updates["auto_review_status"] = "no_speech"
+        updates["auto_review_reason"] = "STT did not return enough text; left for manual review."
+        return "keep", "no_speech", updates
+
+    phrase_similarity = _wake_phrase_similarity(transcript, wake_phrase)
+    phrase_detected = _transcript_contains_wake_phrase(transcript, wake_phrase)
+    match_method = "exact" if phrase_detected else ""
+    updates["auto_review_phrase_similarity"] = round(phrase_similarity, 4)
+
+    if (
+        not phrase_detected
+        and phrase_similarity >= WAKE_PHRASE_GUIDANCE_MIN_SIMILARITY
+        and stt_engine == STT_ENGINE_FASTER_WHISPER
+    ):
+        guided_model = str(updates["auto_review_stt_model"])
+        guided_language = str(config.get("language") or DEFAULT_LANGUAGE)
+        guided_hint = _normalize_transcript_text(wake_phrase)
+        if config.get("close_match_check") == "guided":
+            guided_key = (audio_sha256, stt_engine, guided_model, guided_language, guided_hint)
+            guided_transcript = _cached_transcripts([guided_key]).get(guided_key) if audio_sha256 else None
+            if guided_transcript is None:
+                guided_transcript = _transcribe_capture_with_faster_whisper_guided(
+                    audio_path,
+                    model=guided_model,
+                    language=guided_language,
+                    wake_phrase=wake_phrase,
+                    samples=samples,
+                )
+                if audio_sha256:
+                    _store_cached_transcripts({guided_key: guided_transcript})
+            updates["auto_review_guided_transcript"] = guided_transcript
             if _transcript_contains_wake_phrase(guided_transcript, wake_phrase):
                 phrase_detected = True
                 match_method = "guided_close_match"
-
-        if match_method:
-            metadata["auto_review_match_method"] = match_method
-
-        if phrase_detected:
-            guided_confirmation = match_method == "guided_close_match"
-            if is_close_miss:
-                metadata["auto_review_status"] = "approved_positive"
-                metadata["auto_review_reason"] = (
-                    "Close miss was confirmed as the configured wake phrase and promoted to a positive sample."
-                    if guided_confirmation
-                    else "Close miss contained the configured wake phrase and was promoted to a positive sample."
-                )
-                metadata["auto_positive"] = True
-                _write_sidecar_json(audio_path, metadata)
-                _move_captured_audio(
-                    file_name,
-                    PERSONAL_DIR,
-                    target_prefix="sample",
-                    review_status="auto_approved_personal",
-                )
-                _record_auto_review_result(
-                    file_name=file_name,
-                    transcript=transcript,
-                    result="promoted_close_miss",
-                )
-                return
-            if config.get("delete_confirmed_wakes"):
-                _remove_audio_with_sidecar(audio_path)
-                _record_auto_review_result(
-                    file_name=file_name,
+        else:
+            # Scores share the transcript cache; the hint keeps them apart
+            # from guided transcripts, and the free transcript they are
+            # relative to is fixed by the audio hash.
+            score_key = (audio_sha256, stt_engine, guided_model, guided_language, f"score:{guided_hint}")
+            cached_score = _cached_transcripts([score_key]).get(score_key) if audio_sha256 else None
+            if cached_score is not None:
+                confidence = float(cached_score)
+            else:
+                confidence = _score_wake_phrase_with_faster_whisper(
+                    audio_path,
+                    model=guided_model,
+                    language=guided_language,
+                    wake_phrase=wake_phrase,
                     transcript=transcript,
-                    result="deleted_confirmed_wake",
+                    samples=samples,
                 )
-                return
-            metadata["auto_review_status"] = "wake_phrase_detected"
-            metadata["auto_review_reason"] = (
-                "Wake phrase confirmed by a guided second STT pass; left for manual positive review."
-                if guided_confirmation
-                else "Wake phrase found in transcript; left for manual positive review."
-            )
-            _write_sidecar_json(audio_path, metadata)
-            _record_auto_review_result(file_name=file_name, transcript=transcript, result="wake_phrase_detected")
-            return
+                if audio_sha256:
+                    _store_cached_transcripts({score_key: f"{confidence:.6f}"})
+            updates["auto_review_phrase_confidence"] = round(confidence, 4)
+            if confidence >= WAKE_PHRASE_SCORE_MIN_CONFIDENCE:
+                phrase_detected = True
+                match_method = "scored_close_match"
 
-        if phrase_similarity >= WAKE_PHRASE_GUIDANCE_MIN_SIMILARITY:
-            metadata["auto_review_status"] = "wake_phrase_ambiguous"
-            metadata["auto_review_reason"] = (
-                "STT sounded close to the configured wake phrase but could not confirm it; "
-                "left for manual review."
-            )
-            _write_sidecar_json(audio_path, metadata)
-            _record_auto_review_result(
-                file_name=file_name,
-                transcript=transcript,
-                result="wake_phrase_ambiguous",
-            )
-            return
+    if match_method:
+        updates["auto_review_match_method"] = match_method
 
+    if phrase_detected:
+        close_confirmation = {
+            "guided_close_match": "a guided second STT pass",
+            "scored_close_match": "wake-phrase alignment scoring",
+        }.get(match_method, "")
         if is_close_miss:
-            metadata["auto_review_status"] = "close_miss_phrase_not_detected"
-            metadata["auto_review_reason"] = (
-                "Close miss did not contain the configured wake phrase; left for manual review."
-            )
-            _write_sidecar_json(audio_path, metadata)
-            _record_auto_review_result(
-                file_name=file_name,
-                transcript=transcript,
-                result="close_miss_phrase_not_detected",
+            updates["auto_review_status"] = "approved_positive"
+            updates["auto_review_reason"] = (
+                "Close miss was confirmed as the configured wake phrase and promoted to a positive sample."
+                if close_confirmation
+                else "Close miss contained the configured wake phrase and was promoted to a positive sample."
             )
-            return
+            updates["auto_positive"] = True
+            return "promote", "promoted_close_miss", updates
+        if config.get("delete_confirmed_wakes"):
+            return "delete", "deleted_confirmed_wake", updates
+        updates["auto_review_status"] = "wake_phrase_detected"
+        updates["auto_review_reason"] = (
+            f"Wake phrase confirmed by {close_confirmation}; left for manual positive review."
+            if close_confirmation
+            else "Wake phrase found in transcript; left for manual positive review."
+        )
+        return "keep", "wake_phrase_detected", updates
 
-        metadata["auto_review_status"] = "approved_negative"
-        metadata["auto_review_reason"] = "Wake phrase was not found in the STT transcript."
-        metadata["auto_negative"] = True
-        _write_sidecar_json(audio_path, metadata)
+    if phrase_similarity >= WAKE_PHRASE_GUIDANCE_MIN_SIMILARITY:
+        updates["auto_review_status"] = "wake_phrase_ambiguous"
+        updates["auto_review_reason"] = (
+            "STT sounded close to the configured wake phrase but could not confirm it; "
+            "left for manual review."
+        )
+        return "keep", "wake_phrase_ambiguous", updates
+
+    if is_close_miss:
+        updates["auto_review_status"] = "close_miss_phrase_not_detected"
+        updates["auto_review_reason"] = (
+            "Close miss did not contain the configured wake phrase; left for manual review."
+        )
+        return "keep", "close_miss_phrase_not_detected", updates
+
+    updates["auto_review_status"] = "approved_negative"
+    updates["auto_review_reason"] = "Wake phrase was not found in the STT transcript."
+    updates["auto_negative"] = True
+    return "negative", "approved_negative", updates
+
+
+def _apply_auto_review(
+    file_name: str,
+    audio_path: Path,
+    signature: List[List[int] | None],
+    transcript: str,
+    action: str,
+    result: str,
+    updates: Dict[str, Any],
+) -> bool:
+    """Commit a review decision; callers hold DATA_MANAGEMENT_LOCK.
+
+    A clip whose WAV or sidecar changed while STT ran (deleted, trimmed,
+    reviewed by hand) is left alone, since the decision was made on what it
+    used to be. Returns whether the decision was committed.
+    """
+    if _capture_review_signature(audio_path) != signature:
+        return False
+    if action == "promote":
+        _move_captured_audio(
+            file_name,
+            PERSONAL_DIR,
+            target_prefix="sample",
+            review_status="auto_approved_personal",
+            metadata_updates=updates,
+        )
+    elif action == "negative":
         _move_captured_audio(
             file_name,
             NEGATIVE_DIR,
             target_prefix="negative",
             review_status="auto_approved_negative",
+            metadata_updates=updates,
         )
         with AUTO_TRAIN_LOCK:
             AUTO_TRAIN_STATE["pending_negative_count"] = int(AUTO_TRAIN_STATE.get("pending_negative_count") or 0) + 1
-            _save_auto_train_state_locked()
-        _record_auto_review_result(file_name=file_name, transcript=transcript, result="approved_negative")
-    except Exception as exc:
-        error = str(exc)
-        with contextlib.suppress(Exception):
-            audio_path = _resolve_audio_path(CAPTURED_DIR, file_name)
-            metadata = _load_sidecar_json(audio_path)
-            metadata["auto_review_status"] = "error"
-            metadata["auto_review_error"] = error
-            metadata["auto_reviewed_at"] = _iso_now()
-            _write_sidecar_json(audio_path, metadata)
-        _record_auto_review_result(file_name=file_name, result="error", error=error)
+    elif action == "delete":
+        _remove_audio_with_sidecar(audio_path)
+    else:
+        _commit_capture_metadata(audio_path, updates)
+    _record_auto_review_result(file_name=file_name, transcript=transcript, result=result)
+    return True
+
+
+def _auto_review_captures(file_names: List[str]) -> List[str]:
+    """Transcribe a batch of inbox captures with one STT call and sort each of them.
+
+    Review runs in three phases so STT never holds the data lock: the clips
+    are claimed and pre-checked under DATA_MANAGEMENT_LOCK, transcribed and
+    classified with no global lock held, then each decision is committed
+    under a short DATA_MANAGEMENT_LOCK. Each clip's result, transcript and
+    reason reach its sidecar in a single write, or as part of the move into
+    the personal or negative folder. Clips whose audio was transcribed before
+    by the same engine, model and language reuse the cached transcript and
+    skip VAD and STT. When the VAD gate is on, clips Silero hears no speech
+    in are settled as ``no_speech`` before STT. If the batched call fails,
+    the clips are retried one at a time so a bad clip only fails itself.
+
+    Returns the captures that changed on disk during STT and still exist, so
+    the caller can queue them for a fresh review.
+    """
+    with AUTO_TRAIN_LOCK:
+        config = dict(AUTO_TRAIN_CONFIG)
+        AUTO_TRAIN_RUNTIME["reviews_in_flight"] = int(AUTO_TRAIN_RUNTIME.get("reviews_in_flight") or 0) + len(file_names)
+        AUTO_TRAIN_RUNTIME["review_running"] = True
+        AUTO_TRAIN_RUNTIME["review_file"] = file_names[0] if file_names else ""
+    changed: List[str] = []
+    try:
+        if not config.get("enabled"):
+            return changed
+        wake_phrase = str(config.get("wake_phrase") or "").strip()
+        if not wake_phrase:
+            for file_name in file_names:
+                _record_auto_review_result(file_name=file_name, result="waiting_for_wake_phrase")
+            return changed
+
+        language = str(config.get("language") or DEFAULT_LANGUAGE)
+        stt_engine = _normalize_stt_engine(config.get("stt_engine"))
+        stt_model = _managed_stt_model(stt_engine, config.get("language"))
+        pending: List[Tuple[str, Path, Dict[str, Any], List[List[int] | None]]] = []
+        with DATA_MANAGEMENT_LOCK:
+            for file_name in file_names:
+                try:
+                    prepared = _begin_auto_review(file_name, config, wake_phrase)
+                except Exception as exc:
+                    _fail_auto_review(file_name, exc)
+                    continue
+                if prepared is not None:
+                    pending.append((file_name, *prepared))
+        if not pending:
+            return changed
+
+        updates: Dict[str, Any] = {
+            "auto_reviewed_at": _iso_now(),
+            "auto_review_wake_phrase": wake_phrase,
+            "auto_review_stt_engine": stt_engine,
+            "auto_review_stt_model": stt_model,
+        }
+        # Each clip is read and decoded once; the hash, VAD, STT and the
+        # close-match check all work from these bytes and samples.
+        cache_keys: Dict[str, Tuple[str, str, str, str, str]] = {}
+        decoded: Dict[str, Any] = {}
+        for file_name, audio_path, _metadata, _signature in pending:
+            try:
+                wav_bytes = audio_path.read_bytes()
+            except OSError:
+                continue
+            cache_keys[file_name] = (hashlib.sha256(wav_bytes).hexdigest(), stt_engine, stt_model, language, "")
+            with contextlib.suppress(Exception):
+                decoded[file_name] = _wav_bytes_float32(wav_bytes)
+        cached = _cached_transcripts(cache_keys.values())
+        results: Dict[str, str | Exception] = {
+            file_name: cached[key] for file_name, key in cache_keys.items() if key in cached
+        }
+        if results:
+            with AUTO_TRAIN_LOCK:
+                AUTO_TRAIN_STATE["review_transcript_cache_hits"] = (
+                    int(AUTO_TRAIN_STATE.get("review_transcript_cache_hits") or 0) + len(results)
+                )
+        uncached = [entry for entry in pending if entry[0] not in results]
+
+        speech: Dict[str, Dict[str, Any]] = {}
+        if uncached and config.get("vad_gate_enabled"):
+            uncached, speech, gated_changed = _vad_gate_auto_reviews(
+                uncached,
+                config=config,
+                updates=updates,
+                decoded=decoded,
+            )
+            changed.extend(gated_changed)
+
+        if uncached:
+            audio_paths = [audio_path for _file_name, audio_path, _metadata, _signature in uncached]
+            samples = [decoded.get(file_name) for file_name, _audio_path, _metadata, _signature in uncached]
+            transcripts: List[str | Exception]
+            stt_started = time.monotonic()
+            try:
+                transcripts = list(
+                    _transcribe_captures(audio_paths, engine=stt_engine, language=language, samples=samples)
+                )
+            except Exception as exc:
+                if len(audio_paths) == 1:
+                    transcripts = [exc]
+                else:
+                    transcripts = []
+                    for audio_path, clip in zip(audio_paths, samples):
+                        try:
+                            transcripts.append(
+                                _transcribe_capture(audio_path, engine=stt_engine, language=language, samples=clip)
+                            )
+                        except Exception as item_exc:
+                            transcripts.append(item_exc)
+            _record_auto_review_timing(key="stt", clips=len(audio_paths), seconds=time.monotonic() - stt_started)
+            fresh: Dict[Tuple[str, str, str, str, str], str] = {}
+            for (file_name, audio_path, _metadata, signature), transcript in zip(uncached, transcripts):
+                results[file_name] = transcript
+                # Only cache what STT heard if the clip still matches the hash it is filed under.
+                if (
+                    isinstance(transcript, str)
+                    and file_name in cache_keys
+                    and _capture_review_signature(audio_path) == signature
+                ):
+                    fresh[cache_keys[file_name]] = transcript
+            _store_cached_transcripts(fresh)
+
+        for file_name, audio_path, metadata, signature in pending:
+            if file_name not in results:
+                continue
+            transcript = results[file_name]
+            with AUTO_TRAIN_LOCK:
+                AUTO_TRAIN_RUNTIME["review_file"] = file_name
+            try:
+                if isinstance(transcript, Exception):
+                    raise transcript
+                action, result, file_updates = _decide_auto_review(
+                    audio_path,
+                    metadata,
+                    transcript,
+                    config=config,
+                    updates={
+                        **updates,
+                        **speech.get(file_name, {}),
+                        "auto_review_cached_transcript": cache_keys.get(file_name) in cached,
+                    },
+                    audio_sha256=cache_keys[file_name][0] if file_name in cache_keys else "",
+                    samples=decoded.get(file_name),
+                )
+                with DATA_MANAGEMENT_LOCK:
+                    applied = _apply_auto_review(
+                        file_name, audio_path, signature, transcript, action, result, file_updates
+                    )
+                if not applied and audio_path.exists():
+                    changed.append(file_name)
+            except Exception as exc:
+                with DATA_MANAGEMENT_LOCK:
+                    _fail_auto_review(file_name, exc)
     finally:
         with AUTO_TRAIN_LOCK:
-            AUTO_TRAIN_RUNTIME["review_running"] = False
-            AUTO_TRAIN_RUNTIME["review_file"] = ""
+            in_flight = max(0, int(AUTO_TRAIN_RUNTIME.get("reviews_in_flight") or 0) - len(file_names))
+            AUTO_TRAIN_RUNTIME["reviews_in_flight"] = in_flight
+            if not in_flight:
+                AUTO_TRAIN_RUNTIME["review_running"] = False
+                AUTO_TRAIN_RUNTIME["review_file"] = ""
+    return changed
+
+
+def _auto_review_capture(file_name: str) -> None:
+    _auto_review_captures([file_name])
+
+
+def _take_auto_review_batch(limit: int, *, block: bool = False) -> List[str]:
+    """Take up to ``limit`` queued captures, optionally blocking until the first arrives.
+
+    An empty name is the stop marker put by _stop_auto_train_worker: it ends
+    the batch, and a marker met while draining is put back for the next worker.
+    The captures returned are the ones leased from the review queue table.
+    """
+    batch: List[str] = []
+    try:
+        first = AUTO_TRAIN_REVIEW_QUEUE.get(block=block)
+    except queue.Empty:
+        return batch
+    if not first:
+        AUTO_TRAIN_REVIEW_QUEUE.task_done()
+        return batch
+    batch.append(first)
+    while len(batch) < limit:
+        try:
+            file_name = AUTO_TRAIN_REVIEW_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+        if not file_name:
+            AUTO_TRAIN_REVIEW_QUEUE.task_done()
+            AUTO_TRAIN_REVIEW_QUEUE.put("")
+            break
+        batch.append(file_name)
+    return _claim_auto_reviews(batch)
+
+
+def _note_auto_review_started(file_names: List[str]) -> None:
+    now = time.monotonic()
+    with AUTO_TRAIN_LOCK:
+        for file_name in file_names:
+            queued_at = AUTO_TRAIN_QUEUED_FILES.get(file_name)
+            if queued_at is not None:
+                AUTO_TRAIN_QUEUE_LATENCIES.append(now - queued_at)
+
+
+def _auto_review_queue_stats_locked() -> Dict[str, Any]:
+    samples = sorted(AUTO_TRAIN_QUEUE_LATENCIES)
+    latency: Dict[str, Any] = {"samples": len(samples)}
+    if samples:
+        latency.update(
+            {
+                "last": round(AUTO_TRAIN_QUEUE_LATENCIES[-1] * 1000, 1),
+                "p50": round(samples[len(samples) // 2] * 1000, 1),
+                "p95": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000, 1),
+                "max": round(samples[-1] * 1000, 1),
+            }
+        )
+    return {
+        "review_queue_depth": max(0, len(AUTO_TRAIN_QUEUED_FILES) - int(AUTO_TRAIN_RUNTIME.get("reviews_in_flight") or 0)),
+        "review_queue_latency_ms": latency,
+    }
 
 
 def _notify_tater_satellites(wake_word_name: str = "") -> Dict[str, Any]:
@@ -1758,25 +3342,30 @@ def _start_auto_training() -> Dict[str, Any]:
     }
 
 
-def _maybe_run_scheduled_auto_training() -> None:
+def _maybe_run_scheduled_auto_training() -> float | None:
+    """Start a due scheduled training run; return seconds until the schedule next needs a look.
+
+    None means no schedule is active, so the worker can sleep until a config
+    change wakes it.
+    """
     with AUTO_TRAIN_LOCK:
         if not AUTO_TRAIN_CONFIG.get("enabled"):
-            return
+            return None
         schedule_hours = int(AUTO_TRAIN_CONFIG.get("schedule_hours") or 0)
         if schedule_hours <= 0:
-            return
+            return None
         next_run = _parse_iso_datetime(AUTO_TRAIN_STATE.get("next_run_at"))
+        now = _utc_now()
         if next_run is None:
             _schedule_next_auto_run_locked()
-            return
-        now = _utc_now()
+            return _seconds_until_next_auto_run_locked()
         if now < next_run:
-            return
+            return (next_run - now).total_seconds()
         pending = int(AUTO_TRAIN_STATE.get("pending_negative_count") or 0)
         minimum = int(AUTO_TRAIN_CONFIG.get("minimum_new_negatives") or 1)
         if pending < minimum:
             _schedule_next_auto_run_locked(from_time=now)
-            return
+            return _seconds_until_next_auto_run_locked()
     result = _start_auto_training()
     with AUTO_TRAIN_LOCK:
         if result.get("started"):
@@ -1784,40 +3373,86 @@ def _maybe_run_scheduled_auto_training() -> None:
         else:
             AUTO_TRAIN_STATE["next_run_at"] = (_utc_now() + timedelta(minutes=10)).isoformat()
             _save_auto_train_state_locked()
+        return _seconds_until_next_auto_run_locked()
+
+
+def _seconds_until_next_auto_run_locked() -> float | None:
+    next_run = _parse_iso_datetime(AUTO_TRAIN_STATE.get("next_run_at"))
+    if next_run is None:
+        return None
+    return max(0.0, (next_run - _utc_now()).total_seconds())
+
+
+def _auto_review_worker_loop() -> None:
+    """Review queued captures as they arrive; exits on the stop marker."""
+    while True:
+        file_names = _take_auto_review_batch(AUTO_TRAIN_REVIEW_BATCH_SIZE, block=True)
+        if not file_names:
+            if AUTO_TRAIN_STOP_EVENT.is_set():
+                return
+            continue
+        _note_auto_review_started(file_names)
+        changed: List[str] = []
+        try:
+            changed = _auto_review_captures(file_names)
+        except Exception as exc:
+            print(f"[WARN] Automatic review failed: {exc}", flush=True)
+        finally:
+            _finish_auto_reviews(file_names)
+            with AUTO_TRAIN_LOCK:
+                for file_name in file_names:
+                    AUTO_TRAIN_QUEUED_FILES.pop(file_name, None)
+            for _file_name in file_names:
+                AUTO_TRAIN_REVIEW_QUEUE.task_done()
+        for file_name in changed:
+            _queue_auto_review(file_name)
 
 
 def _auto_train_worker_loop() -> None:
+    """Run the training schedule, STT model upkeep and review lease expiry.
+
+    Restores the persisted review queue and starts preloading the configured
+    STT model, then sleeps until the next training run, idle model unload or
+    review lease expiry is due, or a config change or model load wakes it.
+    """
     with AUTO_TRAIN_LOCK:
         AUTO_TRAIN_RUNTIME["scheduler_running"] = True
-    _queue_pending_auto_reviews()
+    _restore_auto_review_queue()
+    _start_stt_model_preload()
     try:
         while not AUTO_TRAIN_STOP_EVENT.is_set():
-            try:
-                file_name = AUTO_TRAIN_REVIEW_QUEUE.get_nowait()
-            except queue.Empty:
-                file_name = ""
-            if file_name:
-                try:
-                    with DATA_MANAGEMENT_LOCK:
-                        _auto_review_capture(file_name)
-                finally:
-                    with AUTO_TRAIN_LOCK:
-                        AUTO_TRAIN_QUEUED_FILES.discard(file_name)
-                    AUTO_TRAIN_REVIEW_QUEUE.task_done()
-            _maybe_run_scheduled_auto_training()
-            AUTO_TRAIN_WAKE_EVENT.wait(1.0)
             AUTO_TRAIN_WAKE_EVENT.clear()
+            delays = [
+                delay
+                for delay in (
+                    _maybe_run_scheduled_auto_training(),
+                    _unload_idle_stt_models(),
+                    _requeue_expired_auto_reviews(),
+                )
+                if delay is not None
+            ]
+            AUTO_TRAIN_WAKE_EVENT.wait(min(delays + [AUTO_TRAIN_SCHEDULE_RECHECK_SECONDS]) if delays else None)
     finally:
         with AUTO_TRAIN_LOCK:
             AUTO_TRAIN_RUNTIME["scheduler_running"] = False
 
 
 def _start_auto_train_worker() -> None:
+    """Start the schedule thread and AUTO_TRAIN_REVIEW_WORKERS review threads."""
     global AUTO_TRAIN_WORKER
     with AUTO_TRAIN_LOCK:
         if AUTO_TRAIN_WORKER is not None and AUTO_TRAIN_WORKER.is_alive():
             return
         AUTO_TRAIN_STOP_EVENT.clear()
+        AUTO_TRAIN_REVIEW_THREADS[:] = [thread for thread in AUTO_TRAIN_REVIEW_THREADS if thread.is_alive()]
+        for index in range(len(AUTO_TRAIN_REVIEW_THREADS), AUTO_TRAIN_REVIEW_WORKERS):
+            thread = threading.Thread(
+                target=_auto_review_worker_loop,
+                name=f"auto-review-worker-{index}",
+                daemon=True,
+            )
+            AUTO_TRAIN_REVIEW_THREADS.append(thread)
+            thread.start()
         AUTO_TRAIN_WORKER = threading.Thread(
             target=_auto_train_worker_loop,
             name="auto-train-worker",
@@ -1829,7 +3464,10 @@ def _start_auto_train_worker() -> None:
 def _stop_auto_train_worker() -> None:
     AUTO_TRAIN_STOP_EVENT.set()
     AUTO_TRAIN_WAKE_EVENT.set()
-
+    with AUTO_TRAIN_LOCK:
+        review_threads = [thread for thread in AUTO_TRAIN_REVIEW_THREADS if thread.is_alive()]
+    for _thread in review_threads:
+        AUTO_TRAIN_REVIEW_QUEUE.put("")
 
 
 def _sync_personal_samples_state() -> List[str]:
@@ -1995,7 +3633,7 @@ def _load_piper_catalog() -> Dict[str, Any] | None:
         return PIPER_CATALOG_CACHE.get("entries")
 
 
-def _available_languages() -> List[Dict[str, Any]]:
+def _build_available_languages() -> List[Dict[str, Any]]:
     languages: Dict[str, Dict[str, Any]] = {}
     omnivoice_catalog = _load_omnivoice_catalog()
 
@@ -2112,9 +3750,59 @@ def _available_languages() -> List[Dict[str, Any]]:
     return ordered
 
 
+def _language_catalog_key() -> Tuple[Any, ...]:
+    """Inputs that change the merged catalog: the two catalog caches and the installed Piper voices."""
+    piper_english_model = PIPER_ROOT / "models" / "en_US-libritts_r-medium.pt"
+    return (
+        os.fspath(OMNIVOICE_CATALOG_CACHE_FILE),
+        _artifact_signature(OMNIVOICE_CATALOG_CACHE_FILE),
+        os.fspath(PIPER_CATALOG_CACHE_FILE),
+        _artifact_signature(PIPER_CATALOG_CACHE_FILE),
+        os.fspath(PIPER_VOICES_DIR),
+        _directory_mtime(PIPER_VOICES_DIR),
+        os.fspath(piper_english_model),
+        _artifact_signature(piper_english_model),
+    )
+
+
+def _language_catalog() -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Return the memoized language list and its code index.
+
+    The catalog is rebuilt when a catalog cache file or the voices directory
+    changes, when _invalidate_language_catalog is called, or after
+    LANGUAGE_CATALOG_TTL_SECONDS so the provider catalogs get a chance to
+    refresh.  Callers must treat both values as read-only.
+    """
+    key = _language_catalog_key()
+    now = time.monotonic()
+    with LANGUAGE_CATALOG_LOCK:
+        languages = LANGUAGE_CATALOG_CACHE["languages"]
+        if (
+            languages is not None
+            and LANGUAGE_CATALOG_CACHE["key"] == key
+            and now - float(LANGUAGE_CATALOG_CACHE["built_at"]) < LANGUAGE_CATALOG_TTL_SECONDS
+        ):
+            return languages, LANGUAGE_CATALOG_CACHE["by_code"]
+
+    languages = _build_available_languages()
+    by_code = {entry["code"]: entry for entry in languages}
+    with LANGUAGE_CATALOG_LOCK:
+        LANGUAGE_CATALOG_CACHE.update({"key": key, "built_at": now, "languages": languages, "by_code": by_code})
+    return languages, by_code
+
+
+def _invalidate_language_catalog() -> None:
+    with LANGUAGE_CATALOG_LOCK:
+        LANGUAGE_CATALOG_CACHE["languages"] = None
+
+
+def _available_languages() -> List[Dict[str, Any]]:
+    return _language_catalog()[0]
+
+
 def _normalize_language(language: str | None) -> str:
     requested = (language or DEFAULT_LANGUAGE).strip().lower().replace("-", "_") or DEFAULT_LANGUAGE
-    available_codes = {item["code"] for item in _available_languages()}
+    available_codes = _language_catalog()[1]
     if requested in available_codes:
         return requested
     family = requested.split("_", 1)[0]
@@ -2214,6 +3902,8 @@ def _ensure_non_english_language_voices(language_family: str, log) -> Dict[str,
         _download_to_path(url, dest_path)
         downloaded_files += 1
 
+    if downloaded_files:
+        _invalidate_language_catalog()
     log(
         f"✓ Piper voices ready for '{language_family}' "
         f"({downloaded_files} file(s) downloaded, {existing_files} already present)"
@@ -2270,108 +3960,766 @@ def _is_target_wav(info: Dict[str, Any] | None) -> bool:
     )
 
 
-def _next_personal_sample_name(original_name: str) -> str:
-    return _next_directory_sample_name(PERSONAL_DIR, "sample", original_name)
+def _next_personal_sample_name(original_name: str) -> str:
+    return _next_directory_sample_name(PERSONAL_DIR, "sample", original_name)
+
+
+def _next_negative_sample_name(original_name: str) -> str:
+    return _next_directory_sample_name(NEGATIVE_DIR, "negative", original_name)
+
+
+def _next_captured_sample_name(original_name: str) -> str:
+    return _next_directory_sample_name(CAPTURED_DIR, "captured", original_name)
+
+
+def _next_directory_sample_name(directory: Path, prefix: str, original_name: str) -> str:
+    directory.mkdir(parents=True, exist_ok=True)
+    stem = safe_name(Path(original_name or "sample").stem)
+    suffix = f"_{stem[:32]}" if stem and stem != "wakeword" else ""
+    while True:
+        name = f"{prefix}_{_allocate_sample_index(directory, prefix):04d}{suffix}.wav"
+        if not (directory / name).exists():
+            return name
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _parse_float(value: Any) -> float | None:
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except Exception:
+        return None
+
+
+def _parse_int(value: Any) -> int | None:
+    if value in (None, ""):
+        return None
+    try:
+        return int(float(value))
+    except Exception:
+        return None
+
+
+def _parse_probability_history(value: Any) -> List[int]:
+    if value in (None, ""):
+        return []
+    if isinstance(value, list):
+        raw_values = value
+    else:
+        raw_values = str(value).split(",")
+    history: List[int] = []
+    for raw_value in raw_values:
+        parsed = _parse_int(raw_value)
+        if parsed is not None:
+            history.append(parsed)
+    return history
+
+
+def _audio_sidecar_path(audio_path: Path) -> Path:
+    return audio_path.with_suffix(".json")
+
+
+def _load_sidecar_json(audio_path: Path) -> Dict[str, Any]:
+    sidecar = _audio_sidecar_path(audio_path)
+    if not sidecar.exists():
+        return {}
+    try:
+        data = json.loads(sidecar.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_sidecar_json(audio_path: Path, payload: Dict[str, Any]):
+    sidecar = _audio_sidecar_path(audio_path)
+    temp_path = sidecar.with_name(f".{sidecar.name}.tmp")
+    temp_path.write_text(
+        json.dumps(payload, indent=2, ensure_ascii=True),
+        encoding="utf-8",
+    )
+    temp_path.replace(sidecar)
+    _index_audio_path(audio_path, payload)
+
+
+def _commit_capture_metadata(audio_path: Path, updates: Dict[str, Any]) -> bool:
+    """Merge one review's sidecar fields into a clip's current metadata with a single write.
+
+    The sidecar is re-read under SAMPLES_LOCK so edits made while STT was
+    running are kept, and a clip that has since left its directory is not
+    given a stray sidecar.
+    """
+    with SAMPLES_LOCK:
+        if not audio_path.exists():
+            return False
+        metadata = _load_sidecar_json(audio_path)
+        metadata.update(updates)
+        _write_sidecar_json(audio_path, metadata)
+    return True
+
+
+def _remove_audio_with_sidecar(audio_path: Path):
+    if audio_path.exists():
+        audio_path.unlink()
+    sidecar = _audio_sidecar_path(audio_path)
+    if sidecar.exists():
+        sidecar.unlink()
+    _forget_indexed_audio(audio_path)
+
+
+def _resolve_audio_path(directory: Path, file_name: str) -> Path:
+    candidate = Path(file_name or "").name
+    if not candidate or candidate != (file_name or "") or not candidate.endswith(".wav"):
+        raise FileNotFoundError("Invalid audio file name.")
+    path = (directory / candidate).resolve()
+    if path.parent != directory.resolve() or not path.exists():
+        raise FileNotFoundError("Audio file not found.")
+    return path
+
+
+# --- Audio catalog index ---
+# Captured, personal, and negative clips are listed from a small SQLite catalog
+# instead of globbing each directory and parsing every sidecar per request. The
+# WAV and JSON files stay authoritative; the catalog is refreshed by the write
+# paths below and reconciled against the directories on startup or whenever a
+# directory changes behind the server's back.
+AUDIO_INDEX_COLUMNS = (
+    "directory",
+    "name",
+    "mtime_ns",
+    "size_bytes",
+    "sidecar_mtime_ns",
+    "received_ns",
+    "event_type",
+    "review_status",
+    "auto_review_status",
+    "source_device",
+    "received_at",
+    "trimmed",
+    "wav_format",
+    "metadata",
+)
+# Keyset orders: SQL ORDER BY clause, the row columns that make up a cursor,
+# and the WHERE clause selecting rows strictly after that cursor.
+AUDIO_INDEX_ORDERS: Dict[str, Tuple[str, Tuple[str, ...], str]] = {
+    "recent": (
+        "mtime_ns DESC, name DESC",
+        ("mtime_ns", "mtime_ns", "name"),
+        "(mtime_ns < ? OR (mtime_ns = ? AND name < ?))",
+    ),
+    "samples": (
+        "trimmed ASC, mtime_ns DESC, name DESC",
+        ("trimmed", "trimmed", "mtime_ns", "mtime_ns", "name"),
+        "(trimmed > ? OR (trimmed = ? AND (mtime_ns < ? OR (mtime_ns = ? AND name < ?))))",
+    ),
+    "name": ("name ASC", ("name",), "name > ?"),
+}
+AUDIO_PAGE_DEFAULT_LIMIT = 50
+AUDIO_PAGE_MAX_LIMIT = 500
+
+
+def _create_audio_index_schema(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS audio_items (
+            directory TEXT NOT NULL,
+            name TEXT NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            sidecar_mtime_ns INTEGER NOT NULL DEFAULT 0,
+            received_ns INTEGER NOT NULL DEFAULT 0,
+            event_type TEXT NOT NULL DEFAULT '',
+            review_status TEXT NOT NULL DEFAULT '',
+            auto_review_status TEXT NOT NULL DEFAULT '',
+            source_device TEXT NOT NULL DEFAULT '',
+            received_at TEXT NOT NULL DEFAULT '',
+            trimmed INTEGER NOT NULL DEFAULT 0,
+            wav_format TEXT NOT NULL DEFAULT '{}',
+            metadata TEXT NOT NULL DEFAULT '{}',
+            PRIMARY KEY (directory, name)
+        )
+        """
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS audio_items_recent "
+        "ON audio_items (directory, mtime_ns DESC, name DESC)"
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS audio_items_samples "
+        "ON audio_items (directory, trimmed, mtime_ns DESC, name DESC)"
+    )
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sample_counters (
+            directory TEXT NOT NULL,
+            prefix TEXT NOT NULL,
+            last_index INTEGER NOT NULL,
+            PRIMARY KEY (directory, prefix)
+        )
+        """
+    )
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS capture_client_ids (
+            source_device TEXT NOT NULL,
+            client_id TEXT NOT NULL,
+            directory TEXT NOT NULL,
+            name TEXT NOT NULL,
+            created_ns INTEGER NOT NULL,
+            PRIMARY KEY (source_device, client_id)
+        )
+        """
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS capture_client_ids_clip "
+        "ON capture_client_ids (directory, name)"
+    )
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS review_queue (
+            name TEXT PRIMARY KEY,
+            state TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            queued_ns INTEGER NOT NULL,
+            lease_expires_ns INTEGER NOT NULL DEFAULT 0,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            updated_ns INTEGER NOT NULL
+        )
+        """
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS review_queue_pending "
+        "ON review_queue (state, priority, queued_ns)"
+    )
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS transcript_cache (
+            audio_sha256 TEXT NOT NULL,
+            engine TEXT NOT NULL,
+            model TEXT NOT NULL,
+            language TEXT NOT NULL,
+            hint TEXT NOT NULL DEFAULT '',
+            transcript TEXT NOT NULL,
+            created_ns INTEGER NOT NULL,
+            PRIMARY KEY (audio_sha256, engine, model, language, hint)
+        )
+        """
+    )
+
+
+def _audio_index_connection() -> sqlite3.Connection:
+    """Return the catalog connection for AUDIO_INDEX_FILE; callers hold AUDIO_INDEX_LOCK."""
+    db_key = str(AUDIO_INDEX_FILE)
+    connection = AUDIO_INDEX_CONNECTIONS.get(db_key)
+    if connection is not None:
+        return connection
+    AUDIO_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_key, timeout=10.0, check_same_thread=False)
+    try:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        version = int(connection.execute("PRAGMA user_version").fetchone()[0] or 0)
+        if version != AUDIO_INDEX_SCHEMA_VERSION:
+            connection.execute("DROP TABLE IF EXISTS audio_items")
+        _create_audio_index_schema(connection)
+        connection.execute(f"PRAGMA user_version = {AUDIO_INDEX_SCHEMA_VERSION}")
+        connection.commit()
+    except sqlite3.Error:
+        connection.close()
+        raise
+    AUDIO_INDEX_CONNECTIONS[db_key] = connection
+    return connection
+
+
+def _close_audio_index() -> None:
+    with AUDIO_INDEX_LOCK:
+        for connection in AUDIO_INDEX_CONNECTIONS.values():
+            with contextlib.suppress(sqlite3.Error):
+                connection.close()
+        AUDIO_INDEX_CONNECTIONS.clear()
+        AUDIO_INDEX_DIRECTORY_MTIMES.clear()
+        AUDIO_INDEX_BUCKET_COUNTS.clear()
+
+
+def _audio_index_directories() -> List[Path]:
+    return [CAPTURED_DIR, PERSONAL_DIR, NEGATIVE_DIR]
+
+
+def _audio_index_directory_key(directory: Path) -> str | None:
+    """Return the catalog key for a sample bucket directory, or None for other paths."""
+    resolved = Path(directory).resolve()
+    for candidate in _audio_index_directories():
+        if resolved == Path(candidate).resolve():
+            return str(resolved)
+    return None
+
+
+def _audio_index_directory_mtime(directory: Path) -> int:
+    try:
+        return int(os.stat(directory).st_mtime_ns)
+    except OSError:
+        return 0
+
+
+def _note_audio_index_directory_locked(directory_key: str) -> None:
+    """Remember the directory mtime produced by our own write so it does not force a rescan."""
+    AUDIO_INDEX_DIRECTORY_MTIMES[(str(AUDIO_INDEX_FILE), directory_key)] = _audio_index_directory_mtime(
+        Path(directory_key)
+    )
+
+
+def _audio_index_row(
+    directory_key: str,
+    audio_path: Path,
+    audio_stat: os.stat_result,
+    metadata: Dict[str, Any],
+    sidecar_mtime_ns: int,
+) -> Tuple[Any, ...]:
+    wav_format: Dict[str, Any] = {}
+    if not (metadata.get("final_format") or metadata.get("detected_format")):
+        with contextlib.suppress(OSError):
+            wav_format = _inspect_wav_bytes(audio_path.read_bytes()) or {}
+    received = _parse_iso_datetime(metadata.get("received_at"))
+    received_ns = int(received.timestamp() * 1e9) if received is not None else int(audio_stat.st_mtime_ns)
+    return (
+        directory_key,
+        audio_path.name,
+        int(audio_stat.st_mtime_ns),
+        int(audio_stat.st_size),
+        int(sidecar_mtime_ns),
+        received_ns,
+        str(metadata.get("event_type") or "").strip(),
+        str(metadata.get("review_status") or ""),
+        str(metadata.get("auto_review_status") or "").strip(),
+        str(metadata.get("source_device") or ""),
+        str(metadata.get("received_at") or ""),
+        1 if metadata.get("trimmed") else 0,
+        json.dumps(wav_format, ensure_ascii=True),
+        json.dumps(metadata, ensure_ascii=True),
+    )
+
+
+def _sidecar_mtime_ns(audio_path: Path) -> int:
+    try:
+        return int(_audio_sidecar_path(audio_path).stat().st_mtime_ns)
+    except OSError:
+        return 0
 
 
-def _next_negative_sample_name(original_name: str) -> str:
-    return _next_directory_sample_name(NEGATIVE_DIR, "negative", original_name)
+def _upsert_audio_index_rows_locked(connection: sqlite3.Connection, rows: List[Tuple[Any, ...]]) -> None:
+    placeholders = ", ".join("?" for _ in AUDIO_INDEX_COLUMNS)
+    connection.executemany(
+        f"INSERT OR REPLACE INTO audio_items ({', '.join(AUDIO_INDEX_COLUMNS)}) VALUES ({placeholders})",
+        rows,
+    )
 
 
-def _next_captured_sample_name(original_name: str) -> str:
-    return _next_directory_sample_name(CAPTURED_DIR, "captured", original_name)
+def _index_audio_path(audio_path: Path, metadata: Dict[str, Any] | None = None) -> None:
+    """Refresh one catalog row after a clip or its sidecar was written."""
+    directory_key = _audio_index_directory_key(audio_path.parent)
+    if directory_key is None:
+        return
+    try:
+        audio_stat = audio_path.stat()
+    except OSError:
+        _forget_indexed_audio(audio_path)
+        return
+    if metadata is None:
+        metadata = _load_sidecar_json(audio_path)
+    row = _audio_index_row(directory_key, audio_path, audio_stat, metadata, _sidecar_mtime_ns(audio_path))
+    with AUDIO_INDEX_LOCK:
+        with contextlib.suppress(sqlite3.Error, OSError):
+            connection = _audio_index_connection()
+            with connection:
+                known = connection.execute(
+                    "SELECT 1 FROM audio_items WHERE directory = ? AND name = ?",
+                    (directory_key, audio_path.name),
+                ).fetchone()
+                _upsert_audio_index_rows_locked(connection, [row])
+            if known is None:
+                _adjust_bucket_count_locked(directory_key, 1)
+            _note_audio_index_directory_locked(directory_key)
+
+
+def _forget_indexed_audio(audio_path: Path) -> None:
+    directory_key = _audio_index_directory_key(audio_path.parent)
+    if directory_key is None:
+        return
+    with AUDIO_INDEX_LOCK:
+        with contextlib.suppress(sqlite3.Error, OSError):
+            connection = _audio_index_connection()
+            with connection:
+                removed = connection.execute(
+                    "DELETE FROM audio_items WHERE directory = ? AND name = ?",
+                    (directory_key, audio_path.name),
+                ).rowcount
+            if removed:
+                _adjust_bucket_count_locked(directory_key, -removed)
+            _note_audio_index_directory_locked(directory_key)
+
+
+def _forget_indexed_directory(directory: Path) -> None:
+    directory_key = _audio_index_directory_key(directory)
+    if directory_key is None:
+        return
+    with AUDIO_INDEX_LOCK:
+        with contextlib.suppress(sqlite3.Error, OSError):
+            connection = _audio_index_connection()
+            with connection:
+                connection.execute("DELETE FROM audio_items WHERE directory = ?", (directory_key,))
+                # A cleared bucket starts numbering from 0001 again, as it did before the counters existed.
+                connection.execute("DELETE FROM sample_counters WHERE directory = ?", (directory_key,))
+                connection.execute("DELETE FROM capture_client_ids WHERE directory = ?", (directory_key,))
+        AUDIO_INDEX_DIRECTORY_MTIMES.pop((str(AUDIO_INDEX_FILE), directory_key), None)
+        AUDIO_INDEX_BUCKET_COUNTS.pop((str(AUDIO_INDEX_FILE), directory_key), None)
+
+
+def _reconcile_audio_index_into(connection: sqlite3.Connection, directory_key: str) -> Dict[str, int]:
+    counts = {"added": 0, "updated": 0, "removed": 0}
+    directory = Path(directory_key)
+    directory.mkdir(parents=True, exist_ok=True)
+    known = {
+        name: (mtime_ns, size_bytes, sidecar_mtime_ns)
+        for name, mtime_ns, size_bytes, sidecar_mtime_ns in connection.execute(
+            "SELECT name, mtime_ns, size_bytes, sidecar_mtime_ns FROM audio_items WHERE directory = ?",
+            (directory_key,),
+        )
+    }
+    rows: List[Tuple[Any, ...]] = []
+    present: set[str] = set()
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".wav"):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                audio_stat = entry.stat()
+            except OSError:
+                continue
+            present.add(entry.name)
+            audio_path = Path(entry.path)
+            sidecar_mtime_ns = _sidecar_mtime_ns(audio_path)
+            signature = (int(audio_stat.st_mtime_ns), int(audio_stat.st_size), sidecar_mtime_ns)
+            previous = known.get(entry.name)
+            if previous == signature:
+                continue
+            counts["updated" if previous is not None else "added"] += 1
+            rows.append(
+                _audio_index_row(
+                    directory_key,
+                    audio_path,
+                    audio_stat,
+                    _load_sidecar_json(audio_path),
+                    sidecar_mtime_ns,
+                )
+            )
+    stale = [(directory_key, name) for name in known if name not in present]
+    counts["removed"] = len(stale)
+    added = [row[1] for row in rows if row[1] not in known]
+    with connection:
+        if rows:
+            _upsert_audio_index_rows_locked(connection, rows)
+        if stale:
+            connection.executemany("DELETE FROM audio_items WHERE directory = ? AND name = ?", stale)
+        _raise_sample_counters_locked(connection, directory_key, added)
+    _adjust_bucket_count_locked(directory_key, counts["added"] - counts["removed"])
+    return counts
+
+
+def _reconcile_audio_index(directory: Path) -> Dict[str, int]:
+    """Bring the catalog for one bucket in line with the files on disk.
+
+    Only clips whose WAV or sidecar stat changed are re-read, so a warm catalog
+    costs one scandir and a stat per clip.
+    """
+    directory_key = _audio_index_directory_key(directory)
+    if directory_key is None:
+        return {"added": 0, "updated": 0, "removed": 0}
+    with AUDIO_INDEX_LOCK:
+        directory_mtime = _audio_index_directory_mtime(Path(directory_key))
+        counts = _reconcile_audio_index_into(_audio_index_connection(), directory_key)
+        AUDIO_INDEX_DIRECTORY_MTIMES[(str(AUDIO_INDEX_FILE), directory_key)] = directory_mtime
+    return counts
+
+
+def _reconcile_audio_indexes() -> None:
+    for directory in _audio_index_directories():
+        try:
+            _reconcile_audio_index(directory)
+        except (sqlite3.Error, OSError) as exc:
+            print(f"[WARN] Could not reconcile audio index for {directory}: {exc}", flush=True)
+
+
+def _adjust_bucket_count_locked(directory_key: str, delta: int) -> None:
+    cache_key = (str(AUDIO_INDEX_FILE), directory_key)
+    if delta and cache_key in AUDIO_INDEX_BUCKET_COUNTS:
+        AUDIO_INDEX_BUCKET_COUNTS[cache_key] = max(0, AUDIO_INDEX_BUCKET_COUNTS[cache_key] + delta)
+
+
+def _audio_bucket_count(directory: Path) -> int:
+    """Return the clip count for a bucket, kept current by the catalog write paths."""
+    directory_key = _audio_index_directory_key(directory)
+    if directory_key is None:
+        return len(_list_audio_samples(directory))
+    cache_key = (str(AUDIO_INDEX_FILE), directory_key)
+    with AUDIO_INDEX_LOCK:
+        cached = AUDIO_INDEX_BUCKET_COUNTS.get(cache_key)
+        if cached is not None and AUDIO_INDEX_DIRECTORY_MTIMES.get(cache_key) == _audio_index_directory_mtime(
+            Path(directory_key)
+        ):
+            return cached
+        count = _indexed_audio_count(directory)
+        if cache_key in AUDIO_INDEX_DIRECTORY_MTIMES:
+            AUDIO_INDEX_BUCKET_COUNTS[cache_key] = count
+        return count
 
 
-def _next_directory_sample_name(directory: Path, prefix: str, original_name: str) -> str:
-    current = _list_audio_samples(directory)
-    next_index = 1
-    for name in current:
-        match = re.match(rf"{re.escape(prefix)}_(\d{{4}})", name)
-        if match:
-            next_index = max(next_index, int(match.group(1)) + 1)
+SAMPLE_NAME_INDEX_RE = re.compile(r"^([A-Za-z][A-Za-z0-9]*)_(\d{4,})")
 
-    stem = safe_name(Path(original_name or "sample").stem)
-    suffix = f"_{stem[:32]}" if stem and stem != "wakeword" else ""
-    return f"{prefix}_{next_index:04d}{suffix}.wav"
 
+def _highest_sample_index(names: Iterable[str], prefix: str | None = None) -> Dict[str, int]:
+    highest: Dict[str, int] = {}
+    for name in names:
+        match = SAMPLE_NAME_INDEX_RE.match(name)
+        if not match or (prefix is not None and match.group(1) != prefix):
+            continue
+        highest[match.group(1)] = max(highest.get(match.group(1), 0), int(match.group(2)))
+    return highest
 
-def _parse_bool(value: Any) -> bool:
-    if isinstance(value, bool):
-        return value
-    return str(value or "").strip().lower() in {"1", "true", "yes", "on"}
 
+def _raise_sample_counters_locked(connection: sqlite3.Connection, directory_key: str, names: List[str]) -> None:
+    """Keep counters ahead of numbered clips that appeared on disk without going through the allocator."""
+    for prefix, index in _highest_sample_index(names).items():
+        connection.execute(
+            "UPDATE sample_counters SET last_index = MAX(last_index, ?) WHERE directory = ? AND prefix = ?",
+            (index, directory_key, prefix),
+        )
 
-def _parse_float(value: Any) -> float | None:
-    if value in (None, ""):
-        return None
-    try:
-        return float(value)
-    except Exception:
-        return None
 
+def _allocate_sample_index(directory: Path, prefix: str) -> int:
+    """Reserve the next ``prefix_NNNN`` number for a bucket.
 
-def _parse_int(value: Any) -> int | None:
-    if value in (None, ""):
-        return None
+    The counter lives in the catalog database, so allocation is a single
+    row update under an immediate transaction instead of a directory scan, and
+    concurrent uploads never receive the same number.
+    """
+    directory_key = _audio_index_directory_key(directory)
+    if directory_key is not None:
+        with AUDIO_INDEX_LOCK:
+            try:
+                connection = _audio_index_connection()
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    row = connection.execute(
+                        "SELECT last_index FROM sample_counters WHERE directory = ? AND prefix = ?",
+                        (directory_key, prefix),
+                    ).fetchone()
+                    if row is None:
+                        with os.scandir(directory_key) as entries:
+                            names = [entry.name for entry in entries if entry.name.endswith(".wav")]
+                        last_index = _highest_sample_index(names, prefix).get(prefix, 0)
+                    else:
+                        last_index = int(row[0])
+                    connection.execute(
+                        "INSERT OR REPLACE INTO sample_counters (directory, prefix, last_index) VALUES (?, ?, ?)",
+                        (directory_key, prefix, last_index + 1),
+                    )
+                    connection.commit()
+                except BaseException:
+                    connection.rollback()
+                    raise
+                return last_index + 1
+            except (sqlite3.Error, OSError) as exc:
+                print(f"[WARN] Sample counter unavailable for {directory}; scanning the directory instead: {exc}", flush=True)
+    names = [path.name for path in Path(directory).glob("*.wav")]
+    return _highest_sample_index(names, prefix).get(prefix, 0) + 1
+
+
+def _audio_index_filter_clause(filters: Dict[str, Any] | None) -> Tuple[str, List[Any]]:
+    """Translate listing filters into SQL over the catalog columns."""
+    clauses: List[str] = []
+    params: List[Any] = []
+    for column in ("event_type", "auto_review_status", "source_device"):
+        values = [str(value) for value in (filters or {}).get(column) or []]
+        if not values:
+            continue
+        if column == "event_type" and "captured" in values:
+            # Captures without an event type are shown as plain "captured" clips.
+            values.append("")
+        clauses.append(f"{column} IN ({', '.join('?' for _ in values)})")
+        params.extend(values)
+    if (filters or {}).get("since_ns") is not None:
+        clauses.append("received_ns >= ?")
+        params.append(int(filters["since_ns"]))
+    if (filters or {}).get("until_ns") is not None:
+        clauses.append("received_ns < ?")
+        params.append(int(filters["until_ns"]))
+    return "".join(f" AND {clause}" for clause in clauses), params
+
+
+def _scratch_audio_index(directory_key: str) -> sqlite3.Connection:
+    """Build a throwaway in-memory catalog when the persistent one cannot be used."""
+    connection = sqlite3.connect(":memory:")
+    _create_audio_index_schema(connection)
+    _reconcile_audio_index_into(connection, directory_key)
+    return connection
+
+
+def _run_audio_index_query(directory: Path, sql: str, params: List[Any]) -> List[sqlite3.Row]:
+    """Run a catalog query for one bucket, reconciling first if the directory changed on disk."""
+    directory_key = _audio_index_directory_key(directory)
+    if directory_key is None:
+        raise ValueError(f"{directory} is not an indexed audio directory.")
     try:
-        return int(float(value))
-    except Exception:
-        return None
+        with AUDIO_INDEX_LOCK:
+            seen_mtime = AUDIO_INDEX_DIRECTORY_MTIMES.get((str(AUDIO_INDEX_FILE), directory_key))
+            if seen_mtime is None or seen_mtime != _audio_index_directory_mtime(Path(directory_key)):
+                _reconcile_audio_index(Path(directory_key))
+            cursor = _audio_index_connection().execute(sql, [directory_key, *params])
+            cursor.row_factory = sqlite3.Row
+            return cursor.fetchall()
+    except (sqlite3.Error, OSError) as exc:
+        print(f"[WARN] Audio index unavailable for {directory}; scanning the directory instead: {exc}", flush=True)
+    connection = _scratch_audio_index(directory_key)
+    try:
+        cursor = connection.execute(sql, [directory_key, *params])
+        cursor.row_factory = sqlite3.Row
+        return cursor.fetchall()
+    finally:
+        connection.close()
 
 
-def _parse_probability_history(value: Any) -> List[int]:
-    if value in (None, ""):
-        return []
-    if isinstance(value, list):
-        raw_values = value
-    else:
-        raw_values = str(value).split(",")
-    history: List[int] = []
-    for raw_value in raw_values:
-        parsed = _parse_int(raw_value)
-        if parsed is not None:
-            history.append(parsed)
-    return history
+def _indexed_audio_rows(
+    directory: Path,
+    *,
+    order: str = "recent",
+    filters: Dict[str, Any] | None = None,
+    after: List[Any] | None = None,
+    limit: int | None = None,
+) -> List[sqlite3.Row]:
+    order_by, _, after_clause = AUDIO_INDEX_ORDERS[order]
+    where, params = _audio_index_filter_clause(filters)
+    if after is not None:
+        where += f" AND {after_clause}"
+        params.extend(after)
+    sql = f"SELECT {', '.join(AUDIO_INDEX_COLUMNS)} FROM audio_items WHERE directory = ?{where} ORDER BY {order_by}"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(int(limit))
+    return _run_audio_index_query(directory, sql, params)
+
+
+def _indexed_audio_count(directory: Path, filters: Dict[str, Any] | None = None) -> int:
+    where, params = _audio_index_filter_clause(filters)
+    rows = _run_audio_index_query(
+        directory,
+        f"SELECT COUNT(*) AS total FROM audio_items WHERE directory = ?{where}",
+        params,
+    )
+    return int(rows[0]["total"]) if rows else 0
 
 
-def _audio_sidecar_path(audio_path: Path) -> Path:
-    return audio_path.with_suffix(".json")
+def _encode_audio_cursor(row: sqlite3.Row, order: str) -> str:
+    _, cursor_columns, _ = AUDIO_INDEX_ORDERS[order]
+    values = [row[column] for column in dict.fromkeys(cursor_columns)]
+    raw = json.dumps([order, *values], separators=(",", ":"), ensure_ascii=True).encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
 
 
-def _load_sidecar_json(audio_path: Path) -> Dict[str, Any]:
-    sidecar = _audio_sidecar_path(audio_path)
-    if not sidecar.exists():
-        return {}
+def _decode_audio_cursor(token: Any, order: str) -> List[Any] | None:
+    """Return WHERE parameters for rows after an opaque cursor, or None for the first page."""
+    token = str(token or "").strip()
+    if not token:
+        return None
+    _, cursor_columns, _ = AUDIO_INDEX_ORDERS[order]
+    unique_columns = list(dict.fromkeys(cursor_columns))
     try:
-        data = json.loads(sidecar.read_text(encoding="utf-8"))
-        return data if isinstance(data, dict) else {}
-    except Exception:
-        return {}
+        decoded = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except ValueError as exc:
+        raise ValueError("Invalid pagination cursor.") from exc
+    if not isinstance(decoded, list) or len(decoded) != len(unique_columns) + 1 or decoded[0] != order:
+        raise ValueError("Invalid pagination cursor.")
+    values = dict(zip(unique_columns, decoded[1:]))
+    return [values[column] for column in cursor_columns]
 
 
-def _write_sidecar_json(audio_path: Path, payload: Dict[str, Any]):
-    _audio_sidecar_path(audio_path).write_text(
-        json.dumps(payload, indent=2, ensure_ascii=True),
-        encoding="utf-8",
+def _audio_listing_filters(
+    *,
+    event_type: Any = None,
+    auto_review_status: Any = None,
+    source_device: Any = None,
+    since: Any = None,
+    until: Any = None,
+) -> Dict[str, Any]:
+    """Parse listing query parameters; list filters accept comma-separated values."""
+    filters: Dict[str, Any] = {}
+    for key, value in (
+        ("event_type", event_type),
+        ("auto_review_status", auto_review_status),
+        ("source_device", source_device),
+    ):
+        values = [token.strip() for token in str(value or "").split(",") if token.strip()]
+        if values:
+            filters[key] = values
+    for key, value in (("since_ns", since), ("until_ns", until)):
+        if value in (None, ""):
+            continue
+        parsed = _parse_iso_datetime(value)
+        if parsed is None:
+            raise ValueError(f"'{key[:-3]}' must be an ISO-8601 date or timestamp.")
+        filters[key] = int(parsed.timestamp() * 1e9)
+    return filters
+
+
+def _audio_page_limit(value: Any) -> int | None:
+    if value in (None, ""):
+        return None
+    return _bounded_int(value, AUDIO_PAGE_DEFAULT_LIMIT, 1, AUDIO_PAGE_MAX_LIMIT)
+
+
+def _paged_audio_rows(
+    directory: Path,
+    *,
+    order: str,
+    filters: Dict[str, Any] | None,
+    cursor: Any,
+    limit: int | None,
+) -> Tuple[List[sqlite3.Row], str]:
+    """Return one keyset page of catalog rows and the cursor for the next page."""
+    after = _decode_audio_cursor(cursor, order)
+    rows = _indexed_audio_rows(
+        directory,
+        order=order,
+        filters=filters,
+        after=after,
+        limit=None if limit is None else limit + 1,
     )
+    if limit is None or len(rows) <= limit:
+        return rows, ""
+    rows = rows[:limit]
+    return rows, _encode_audio_cursor(rows[-1], order)
 
 
-def _remove_audio_with_sidecar(audio_path: Path):
-    if audio_path.exists():
-        audio_path.unlink()
-    sidecar = _audio_sidecar_path(audio_path)
-    if sidecar.exists():
-        sidecar.unlink()
+def _indexed_row_metadata(row: sqlite3.Row) -> Dict[str, Any]:
+    try:
+        metadata = json.loads(row["metadata"] or "{}")
+    except ValueError:
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
 
 
-def _resolve_audio_path(directory: Path, file_name: str) -> Path:
-    candidate = Path(file_name or "").name
-    if not candidate or candidate != (file_name or "") or not candidate.endswith(".wav"):
-        raise FileNotFoundError("Invalid audio file name.")
-    path = (directory / candidate).resolve()
-    if path.parent != directory.resolve() or not path.exists():
-        raise FileNotFoundError("Audio file not found.")
-    return path
+def _indexed_row_wav_format(row: sqlite3.Row) -> Dict[str, Any]:
+    try:
+        wav_format = json.loads(row["wav_format"] or "{}")
+    except ValueError:
+        return {}
+    return wav_format if isinstance(wav_format, dict) else {}
 
 
 def _format_hint_from_filename(original_name: str) -> Dict[str, Any]:
@@ -2387,7 +4735,29 @@ def _format_hint_from_filename(original_name: str) -> Dict[str, Any]:
     }
 
 
+def _resample_wav_in_process(data: bytes) -> bytes | None:
+    """Convert uncompressed WAV to the target format without spawning ffmpeg."""
+    decoded = audio_pcm.decode_wav(data)
+    if decoded is None:
+        return None
+    frames, sample_rate = decoded
+    if not frames.size:
+        return None
+    mono = audio_pcm.resample(audio_pcm.downmix(frames), sample_rate, TARGET_SAMPLE_RATE)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(TARGET_CHANNELS)
+        wav.setsampwidth(TARGET_SAMPLE_WIDTH_BYTES)
+        wav.setframerate(TARGET_SAMPLE_RATE)
+        wav.writeframes(audio_pcm.pcm16_to_bytes(audio_pcm.float_to_pcm16(mono)))
+    return buf.getvalue()
+
+
 def _normalize_audio_to_target_wav(data: bytes, original_name: str) -> bytes:
+    converted = _resample_wav_in_process(data)
+    if converted is not None:
+        return converted
+
     ffmpeg = _find_ffmpeg()
     if not ffmpeg:
         raise RuntimeError(
@@ -2414,7 +4784,9 @@ def _normalize_audio_to_target_wav(data: bytes, original_name: str) -> bytes:
             "pcm_s16le",
             str(dst_path),
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True)
+        # Compressed uploads still need ffmpeg; cap how many decoders run at once.
+        with FFMPEG_SLOTS:
+            proc = subprocess.run(cmd, capture_output=True, text=True)
         if proc.returncode != 0 or not dst_path.exists():
             err = (proc.stderr or proc.stdout or "ffmpeg conversion failed").strip()
             raise RuntimeError(err.splitlines()[-1] if err else "ffmpeg conversion failed")
@@ -2433,25 +4805,20 @@ def _boost_target_wav_bytes(
 ) -> tuple[bytes, Dict[str, Any]]:
     info = _inspect_wav_bytes(data) or {}
     if not _is_target_wav(info):
-        return data, {"applied": False, "reason": "not_target_wav"}
+        return data, {"applied": False, "reason": "not_target_wav", "profile": profile or ""}
 
     with wave.open(io.BytesIO(data), "rb") as wf:
         raw_frames = wf.readframes(wf.getnframes())
 
     if not raw_frames:
-        return data, {"applied": False, "reason": "empty"}
+        return data, {"applied": False, "reason": "empty", "profile": profile or ""}
 
-    samples = array("h")
-    samples.frombytes(raw_frames)
-    if sys.byteorder != "little":
-        samples.byteswap()
+    samples = audio_pcm.pcm16_from_bytes(raw_frames)
+    peak_ratio = audio_pcm.peak_ratio(samples)
+    if peak_ratio <= 0:
+        return data, {"applied": False, "reason": "silent", "peak_ratio": 0.0, "profile": profile or ""}
 
-    peak = max(abs(sample) for sample in samples) if samples else 0
-    if peak <= 0:
-        return data, {"applied": False, "reason": "silent", "peak_ratio": 0.0}
-
-    peak_ratio = peak / 32767.0
-    rms_ratio = (sum(sample * sample for sample in samples) / len(samples)) ** 0.5 / 32767.0
+    rms_ratio = audio_pcm.rms_ratio(samples)
     desired_peak = max(0.05, min(target_peak_ratio, 0.98))
     peak_limited_gain = desired_peak / peak_ratio
     target_gain = peak_limited_gain
@@ -2470,16 +4837,14 @@ def _boost_target_wav_bytes(
             "profile": profile or "",
         }
 
-    boosted = array("h", (max(-32768, min(32767, int(round(sample * gain_ratio)))) for sample in samples))
-    if sys.byteorder != "little":
-        boosted.byteswap()
+    boosted = audio_pcm.apply_gain(samples, gain_ratio)
 
     buf = io.BytesIO()
     with wave.open(buf, "wb") as wav:
         wav.setnchannels(TARGET_CHANNELS)
         wav.setsampwidth(TARGET_SAMPLE_WIDTH_BYTES)
         wav.setframerate(TARGET_SAMPLE_RATE)
-        wav.writeframes(boosted.tobytes())
+        wav.writeframes(audio_pcm.pcm16_to_bytes(boosted))
 
     return buf.getvalue(), {
         "applied": True,
@@ -2502,23 +4867,36 @@ def _build_audio_result_message(*, converted: bool, postprocess_info: Dict[str,
     return message
 
 
+def _capture_gain_is_current(metadata: Dict[str, Any]) -> bool:
+    postprocess = metadata.get("postprocess")
+    return isinstance(postprocess, dict) and postprocess.get("profile") == CAPTURE_GAIN_PROFILE
+
+
+def _boost_captured_wav_bytes(data: bytes) -> tuple[bytes, Dict[str, Any]]:
+    return _boost_target_wav_bytes(
+        data,
+        target_peak_ratio=0.88,
+        target_rms_ratio=0.06,
+        max_gain_ratio=220.0,
+        profile=CAPTURE_GAIN_PROFILE,
+    )
+
+
 def _ensure_captured_playback_ready(audio_path: Path, metadata: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    """Apply the capture gain profile to a legacy clip on disk; only the background migration calls this."""
     metadata = dict(metadata or {})
-    existing_postprocess = metadata.get("postprocess")
-    if isinstance(existing_postprocess, dict) and existing_postprocess.get("profile") == CAPTURE_GAIN_PROFILE:
+    if _capture_gain_is_current(metadata):
         return metadata
+    existing_postprocess = metadata.get("postprocess")
 
     with SAMPLES_LOCK:
         data = audio_path.read_bytes()
-        final_bytes, postprocess_info = _boost_target_wav_bytes(
-            data,
-            target_peak_ratio=0.88,
-            target_rms_ratio=0.06,
-            max_gain_ratio=220.0,
-            profile=CAPTURE_GAIN_PROFILE,
-        )
+        final_bytes, postprocess_info = _boost_captured_wav_bytes(data)
         if postprocess_info.get("applied"):
-            audio_path.write_bytes(final_bytes)
+            # Replace atomically so a concurrent playback request never reads a half-written clip.
+            temp_path = audio_path.with_name(f".{audio_path.name}.tmp")
+            temp_path.write_bytes(final_bytes)
+            temp_path.replace(audio_path)
         if isinstance(existing_postprocess, dict):
             try:
                 previous_gain = float(existing_postprocess.get("gain_ratio") or 1.0)
@@ -2540,6 +4918,41 @@ def _ensure_captured_playback_ready(audio_path: Path, metadata: Dict[str, Any] |
     return metadata
 
 
+def _migrate_legacy_capture_gain() -> Dict[str, int]:
+    """Bring clips captured before ingest-time gain up to the current profile, once."""
+    counts = {"migrated": 0, "failed": 0}
+    try:
+        rows = _indexed_audio_rows(CAPTURED_DIR)
+    except (sqlite3.Error, OSError) as exc:
+        print(f"[WARN] Could not list captured audio for gain migration: {exc}", flush=True)
+        return counts
+    for row in rows:
+        if AUTO_TRAIN_STOP_EVENT.is_set():
+            break
+        if _capture_gain_is_current(_indexed_row_metadata(row)):
+            continue
+        audio_path = CAPTURED_DIR / row["name"]
+        try:
+            _ensure_captured_playback_ready(audio_path, _load_sidecar_json(audio_path))
+            counts["migrated"] += 1
+        except (OSError, wave.Error, ValueError) as exc:
+            counts["failed"] += 1
+            print(f"[WARN] Could not migrate capture gain for {audio_path.name}: {exc}", flush=True)
+    return counts
+
+
+def _start_capture_gain_migration() -> None:
+    global CAPTURE_GAIN_MIGRATION_THREAD
+    if CAPTURE_GAIN_MIGRATION_THREAD is not None and CAPTURE_GAIN_MIGRATION_THREAD.is_alive():
+        return
+    CAPTURE_GAIN_MIGRATION_THREAD = threading.Thread(
+        target=_migrate_legacy_capture_gain,
+        name="capture-gain-migration",
+        daemon=True,
+    )
+    CAPTURE_GAIN_MIGRATION_THREAD.start()
+
+
 def _save_audio_sample(
     data: bytes,
     original_name: str,
@@ -2567,6 +4980,7 @@ def _save_audio_sample(
         final_name = out_name
         out_path = target_dir / final_name
         out_path.write_bytes(final_bytes)
+        _index_audio_path(out_path)
 
     return {
         "saved_as": final_name,
@@ -2597,13 +5011,7 @@ def _save_captured_sample(data: bytes, original_name: str, out_name: str | None
         original_name,
         target_dir=CAPTURED_DIR,
         out_name=out_name or _next_captured_sample_name(original_name),
-        postprocess_target_wav=lambda wav_data: _boost_target_wav_bytes(
-            wav_data,
-            target_peak_ratio=0.88,
-            target_rms_ratio=0.06,
-            max_gain_ratio=220.0,
-            profile=CAPTURE_GAIN_PROFILE,
-        ),
+        postprocess_target_wav=_boost_captured_wav_bytes,
     )
 
 
@@ -2633,11 +5041,225 @@ def _pcm_s16le_to_wav_bytes(
     return buf.getvalue()
 
 
+def _captured_upload_wav_bytes(data: bytes, audio_format: str, *, sample_rate: Any = None, channels: Any = None) -> bytes:
+    audio_format = (audio_format or "wav").strip().lower()
+    if audio_format == "pcm_s16le":
+        return _pcm_s16le_to_wav_bytes(
+            data,
+            sample_rate=_parse_int(sample_rate) or TARGET_SAMPLE_RATE,
+            channels=_parse_int(channels) or TARGET_CHANNELS,
+        )
+    if audio_format in {"wav", "audio/wav", "audio/x-wav"}:
+        return data
+    raise ValueError(f"Unsupported x-audio-format '{audio_format}'.")
+
+
+def _captured_sidecar(result: Dict[str, Any], metadata: Dict[str, Any], *, current_safe_word: str = "") -> Dict[str, Any]:
+    """Build the sidecar for a freshly saved capture from satellite-reported metadata."""
+    return {
+        **metadata,
+        "saved_as": result["saved_as"],
+        "original_name": result["original_name"],
+        "source_device": metadata.get("source_device") or "",
+        "wake_word": metadata.get("wake_word") or current_safe_word or "",
+        "event_type": str(metadata.get("event_type") or "captured").strip() or "captured",
+        "capture_label": metadata.get("capture_label") or "",
+        "captured_at": metadata.get("captured_at") or "",
+        "received_at": datetime.now(timezone.utc).isoformat(),
+        "blocked_by_vad": _parse_bool(metadata.get("blocked_by_vad")),
+        "max_probability": _parse_float(metadata.get("max_probability")),
+        "average_probability": _parse_float(metadata.get("average_probability")),
+        "probability_cutoff": _parse_int(metadata.get("probability_cutoff")),
+        "peak_probability_cutoff": _parse_int(metadata.get("peak_probability_cutoff")),
+        "active_window_count": _parse_int(metadata.get("active_window_count")),
+        "min_active_windows": _parse_int(metadata.get("min_active_windows")),
+        "rise_score": _parse_int(metadata.get("rise_score")),
+        "vad_max_probability": _parse_int(metadata.get("vad_max_probability")),
+        "vad_average_probability": _parse_int(metadata.get("vad_average_probability")),
+        "detection_profile": str(metadata.get("detection_profile") or "").strip(),
+        "probability_history": _parse_probability_history(metadata.get("probability_history")),
+        "notes": metadata.get("notes") or "",
+        "converted": result["converted"],
+        "detected_format": result["detected_format"],
+        "final_format": result["final_format"],
+        "postprocess": result["postprocess"],
+        "message": result["message"],
+        "review_status": "pending",
+    }
+
+
+def _store_captured_upload(data: bytes, original_name: str, metadata: Dict[str, Any]) -> Path:
+    """Save one satellite clip with its sidecar and queue it for auto-review when enabled."""
+    result = _save_captured_sample(data, original_name)
+    with STATE_LOCK:
+        current_safe_word = STATE.get("safe_word")
+
+    audio_path = CAPTURED_DIR / result["saved_as"]
+    sidecar = _captured_sidecar(result, metadata, current_safe_word=current_safe_word or "")
+    _write_sidecar_json(audio_path, sidecar)
+    with AUTO_TRAIN_LOCK:
+        auto_review_config = dict(AUTO_TRAIN_CONFIG)
+    if auto_review_config.get("enabled") and _captured_event_is_auto_reviewable(sidecar, auto_review_config):
+        _queue_auto_review(audio_path.name, sidecar)
+    return audio_path
+
+
+def _iter_capture_batch_frames(body: bytes):
+    """Yield (metadata, audio) pairs from a length-prefixed capture batch.
+
+    Each clip is a big-endian uint32 length and a JSON metadata object, then a
+    big-endian uint32 length and the audio bytes.
+    """
+    offset = 0
+    index = 0
+    while offset < len(body):
+        if index >= CAPTURE_BATCH_MAX_CLIPS:
+            raise ValueError(f"Capture batches are limited to {CAPTURE_BATCH_MAX_CLIPS} clips.")
+        parts: List[bytes] = []
+        for label in ("metadata", "audio"):
+            if offset + 4 > len(body):
+                raise ValueError(f"Clip {index} is missing its {label} length.")
+            length = int.from_bytes(body[offset:offset + 4], "big")
+            offset += 4
+            if offset + length > len(body):
+                raise ValueError(f"Clip {index} {label} is truncated.")
+            parts.append(body[offset:offset + length])
+            offset += length
+        try:
+            metadata = json.loads(parts[0].decode("utf-8")) if parts[0] else {}
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ValueError(f"Clip {index} metadata is not valid JSON: {exc}") from exc
+        if not isinstance(metadata, dict):
+            raise ValueError(f"Clip {index} metadata must be a JSON object.")
+        yield metadata, parts[1]
+        index += 1
+
+
+def _audio_bucket_name(directory_key: str) -> str:
+    for bucket, directory in (("captured", CAPTURED_DIR), ("personal", PERSONAL_DIR), ("negative", NEGATIVE_DIR)):
+        if _audio_index_directory_key(directory) == directory_key:
+            return bucket
+    return ""
+
+
+def _known_capture_client_id(source_device: str, client_id: str) -> Tuple[str, str] | None:
+    """Return (bucket, file name) of a clip already saved under this client id, wherever review moved it."""
+    try:
+        with AUDIO_INDEX_LOCK:
+            row = _audio_index_connection().execute(
+                "SELECT directory, name FROM capture_client_ids WHERE source_device = ? AND client_id = ?",
+                (source_device, client_id),
+            ).fetchone()
+    except sqlite3.Error as exc:
+        print(f"[WARN] Capture client id lookup failed: {exc}", flush=True)
+        return None
+    if row is None or not (Path(row[0]) / row[1]).is_file():
+        return None
+    bucket = _audio_bucket_name(str(row[0]))
+    return (bucket, str(row[1])) if bucket else None
+
+
+def _remember_capture_client_id(source_device: str, client_id: str, audio_path: Path) -> None:
+    """Persist a clip's client id, keeping the newest CAPTURE_CLIENT_IDS_PER_DEVICE per source device."""
+    directory_key = _audio_index_directory_key(audio_path.parent)
+    if directory_key is None:
+        return
+    try:
+        with AUDIO_INDEX_LOCK:
+            connection = _audio_index_connection()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO capture_client_ids "
+                    "(source_device, client_id, directory, name, created_ns) VALUES (?, ?, ?, ?, ?)",
+                    (source_device, client_id, directory_key, audio_path.name, time.time_ns()),
+                )
+                connection.execute(
+                    "DELETE FROM capture_client_ids WHERE rowid IN ("
+                    "SELECT rowid FROM capture_client_ids WHERE source_device = ? "
+                    "ORDER BY created_ns DESC LIMIT -1 OFFSET ?)",
+                    (source_device, CAPTURE_CLIENT_IDS_PER_DEVICE),
+                )
+    except sqlite3.Error as exc:
+        print(f"[WARN] Could not remember capture client id {client_id!r}: {exc}", flush=True)
+
+
+def _move_capture_client_ids(src_path: Path, dst_path: Path) -> None:
+    """Point client ids at a clip's new bucket and name after review moves it."""
+    src_key = _audio_index_directory_key(src_path.parent)
+    dst_key = _audio_index_directory_key(dst_path.parent)
+    if src_key is None or dst_key is None:
+        return
+    with AUDIO_INDEX_LOCK:
+        with contextlib.suppress(sqlite3.Error, OSError):
+            connection = _audio_index_connection()
+            with connection:
+                connection.execute(
+                    "UPDATE capture_client_ids SET directory = ?, name = ? WHERE directory = ? AND name = ?",
+                    (dst_key, dst_path.name, src_key, src_path.name),
+                )
+
+
+def _ingest_capture_batch(body: bytes) -> List[Dict[str, Any]]:
+    frames = list(_iter_capture_batch_frames(body))
+    acks: List[Dict[str, Any]] = []
+    for index, (metadata, audio) in enumerate(frames):
+        client_id = str(metadata.pop("client_id", "") or "").strip()
+        ack: Dict[str, Any] = {"i": index}
+        if client_id:
+            ack["id"] = client_id
+        source_device = str(metadata.get("source_device") or "")
+        previous = _known_capture_client_id(source_device, client_id) if client_id else None
+        if previous is not None:
+            bucket, saved_as = previous
+            acks.append({**ack, "ok": True, "saved_as": saved_as, "bucket": bucket, "duplicate": True})
+            continue
+        try:
+            data = _captured_upload_wav_bytes(
+                audio,
+                str(metadata.pop("audio_format", "") or "wav"),
+                sample_rate=metadata.pop("sample_rate", None),
+                channels=metadata.pop("channels", None),
+            )
+            original_name = str(metadata.pop("original_name", "") or "captured.wav")
+            audio_path = _store_captured_upload(data, original_name, metadata)
+        except Exception as e:
+            acks.append({**ack, "ok": False, "error": str(e)})
+            continue
+        if client_id:
+            _remember_capture_client_id(source_device, client_id, audio_path)
+        acks.append({**ack, "ok": True, "saved_as": audio_path.name})
+    return acks
+
+
+async def _run_upload_work(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(UPLOAD_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+def _captured_upload_payload(audio_path: Path) -> Dict[str, Any]:
+    return {
+        "ok": True,
+        "item": _captured_item_from_path(audio_path),
+        "captured_count": _audio_bucket_count(CAPTURED_DIR),
+    }
+
+
 def _captured_item_from_path(audio_path: Path) -> Dict[str, Any]:
-    meta = _ensure_captured_playback_ready(audio_path, _load_sidecar_json(audio_path))
+    meta = _load_sidecar_json(audio_path)
     stat = audio_path.stat()
-    event_type = str(meta.get("event_type") or "captured").strip() or "captured"
     final_format = meta.get("final_format") or _inspect_wav_bytes(audio_path.read_bytes()) or {}
+    return _captured_item(audio_path, meta, size_bytes=stat.st_size, mtime=stat.st_mtime, final_format=final_format)
+
+
+def _captured_item(
+    audio_path: Path,
+    meta: Dict[str, Any],
+    *,
+    size_bytes: int,
+    mtime: float,
+    final_format: Dict[str, Any],
+) -> Dict[str, Any]:
+    event_type = str(meta.get("event_type") or "captured").strip() or "captured"
     return {
         "saved_as": audio_path.name,
         "original_name": meta.get("original_name") or audio_path.name,
@@ -2645,7 +5267,7 @@ def _captured_item_from_path(audio_path: Path) -> Dict[str, Any]:
         "wake_word": meta.get("wake_word") or "",
         "event_type": event_type,
         "capture_label": str(meta.get("capture_label") or event_type.replace("_", " ").title()),
-        "received_at": meta.get("received_at") or datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat(),
+        "received_at": meta.get("received_at") or datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat(),
         "captured_at": meta.get("captured_at") or "",
         "converted": bool(meta.get("converted")),
         "blocked_by_vad": bool(meta.get("blocked_by_vad")),
@@ -2674,26 +5296,56 @@ def _captured_item_from_path(audio_path: Path) -> Dict[str, Any]:
         "auto_review_guided_transcript": meta.get("auto_review_guided_transcript") or "",
         "auto_review_phrase_similarity": meta.get("auto_review_phrase_similarity"),
         "auto_review_match_method": meta.get("auto_review_match_method") or "",
-        "size_bytes": stat.st_size,
+        "auto_review_phrase_confidence": meta.get("auto_review_phrase_confidence"),
+        "auto_review_speech_ratio": meta.get("auto_review_speech_ratio"),
+        "size_bytes": size_bytes,
         "audio_url": f"/api/audio/captured/{audio_path.name}",
     }
 
 
-def _list_captured_items() -> List[Dict[str, Any]]:
+def _captured_item_from_index_row(row: sqlite3.Row) -> Dict[str, Any]:
+    audio_path = CAPTURED_DIR / row["name"]
+    meta = _indexed_row_metadata(row)
+    return _captured_item(
+        audio_path,
+        meta,
+        size_bytes=int(row["size_bytes"]),
+        mtime=int(row["mtime_ns"]) / 1e9,
+        final_format=meta.get("final_format") or _indexed_row_wav_format(row),
+    )
+
+
+def _captured_items_from_rows(rows: List[sqlite3.Row]) -> List[Dict[str, Any]]:
     items: List[Dict[str, Any]] = []
-    CAPTURED_DIR.mkdir(parents=True, exist_ok=True)
-    for audio_path in sorted(CAPTURED_DIR.glob("*.wav"), key=lambda p: p.stat().st_mtime, reverse=True):
+    for row in rows:
         try:
-            items.append(_captured_item_from_path(audio_path))
+            items.append(_captured_item_from_index_row(row))
         except Exception:
             continue
     return items
 
 
+def _list_captured_items(filters: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+    CAPTURED_DIR.mkdir(parents=True, exist_ok=True)
+    return _captured_items_from_rows(_indexed_audio_rows(CAPTURED_DIR, filters=filters))
+
+
 def _sample_item_from_path(audio_path: Path, bucket: str) -> Dict[str, Any]:
     meta = _load_sidecar_json(audio_path)
     stat = audio_path.stat()
     final_format = meta.get("final_format") or meta.get("detected_format") or _inspect_wav_bytes(audio_path.read_bytes()) or {}
+    return _sample_item(audio_path, bucket, meta, size_bytes=stat.st_size, mtime=stat.st_mtime, final_format=final_format)
+
+
+def _sample_item(
+    audio_path: Path,
+    bucket: str,
+    meta: Dict[str, Any],
+    *,
+    size_bytes: int,
+    mtime: float,
+    final_format: Dict[str, Any],
+) -> Dict[str, Any]:
     return {
         "bucket": bucket,
         "saved_as": audio_path.name,
@@ -2703,7 +5355,7 @@ def _sample_item_from_path(audio_path: Path, bucket: str) -> Dict[str, Any]:
         "review_status": meta.get("review_status") or "",
         "received_at": meta.get("received_at") or "",
         "reviewed_at": meta.get("reviewed_at") or "",
-        "created_at": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat(),
+        "created_at": datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat(),
         "converted": bool(meta.get("converted")),
         "trimmed": bool(meta.get("trimmed")),
         "source_file": meta.get("source_file") or "",
@@ -2712,46 +5364,126 @@ def _sample_item_from_path(audio_path: Path, bucket: str) -> Dict[str, Any]:
         "transcript": meta.get("transcript") or "",
         "transcribed_at": meta.get("transcribed_at") or "",
         "auto_review_guided_transcript": meta.get("auto_review_guided_transcript") or "",
+        "auto_review_phrase_confidence": meta.get("auto_review_phrase_confidence"),
         "auto_review_stt_engine": meta.get("auto_review_stt_engine") or "",
         "auto_review_stt_model": meta.get("auto_review_stt_model") or "",
         "auto_negative": bool(meta.get("auto_negative")),
         "auto_positive": bool(meta.get("auto_positive")),
         "auto_review_reason": meta.get("auto_review_reason") or "",
-        "size_bytes": stat.st_size,
+        "size_bytes": size_bytes,
         "audio_url": f"/api/audio/{bucket}/{audio_path.name}",
     }
 
 
-def _list_sample_items(directory: Path, bucket: str) -> List[Dict[str, Any]]:
-    directory.mkdir(parents=True, exist_ok=True)
-    items: List[Dict[str, Any]] = []
-    for audio_path in sorted(directory.glob("*.wav"), key=lambda p: p.stat().st_mtime, reverse=True):
-        try:
-            items.append(_sample_item_from_path(audio_path, bucket))
-        except Exception:
-            continue
-    # Untrimmed first (stable sort preserves mtime order within each group).
-    items.sort(key=lambda x: x.get("trimmed", False))
-    return items
-
-def _samples_payload() -> Dict[str, Any]:
+def _sample_item_from_index_row(row: sqlite3.Row, directory: Path, bucket: str) -> Dict[str, Any]:
+    meta = _indexed_row_metadata(row)
+    return _sample_item(
+        directory / row["name"],
+        bucket,
+        meta,
+        size_bytes=int(row["size_bytes"]),
+        mtime=int(row["mtime_ns"]) / 1e9,
+        final_format=meta.get("final_format") or meta.get("detected_format") or _indexed_row_wav_format(row),
+    )
+
+
+def _sample_items_from_rows(rows: List[sqlite3.Row], directory: Path, bucket: str) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+    for row in rows:
+        try:
+            items.append(_sample_item_from_index_row(row, directory, bucket))
+        except Exception:
+            continue
+    return items
+
+
+def _list_sample_items(directory: Path, bucket: str, filters: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+    directory.mkdir(parents=True, exist_ok=True)
+    # Untrimmed first, newest first within each group.
+    return _sample_items_from_rows(_indexed_audio_rows(directory, order="samples", filters=filters), directory, bucket)
+
+
+def _captured_audio_payload(
+    *,
+    filters: Dict[str, Any] | None = None,
+    cursor: Any = None,
+    limit: int | None = None,
+    count_only: bool = False,
+) -> Dict[str, Any]:
+    """Return one page of the captured inbox plus inbox and sample totals."""
+    CAPTURED_DIR.mkdir(parents=True, exist_ok=True)
+    takes = _sync_personal_samples_state()
+    captured_count = _audio_bucket_count(CAPTURED_DIR)
+    payload: Dict[str, Any] = {
+        "ok": True,
+        "captured_count": captured_count,
+        "matched_count": _indexed_audio_count(CAPTURED_DIR, filters) if filters else captured_count,
+        "negative_count": _audio_bucket_count(NEGATIVE_DIR),
+        "personal_count": len(takes),
+    }
+    if count_only:
+        return payload
+    rows, next_cursor = _paged_audio_rows(CAPTURED_DIR, order="recent", filters=filters, cursor=cursor, limit=limit)
+    payload["items"] = _captured_items_from_rows(rows)
+    payload["next_cursor"] = next_cursor
+    return payload
+
+
+def _samples_payload(
+    *,
+    bucket: str | None = None,
+    filters: Dict[str, Any] | None = None,
+    cursor: Any = None,
+    limit: int | None = None,
+    count_only: bool = False,
+) -> Dict[str, Any]:
+    """Return personal and negative samples, optionally one filtered page of a single bucket."""
     takes = _sync_personal_samples_state()
-    personal_items = _list_sample_items(PERSONAL_DIR, "personal")
-    negative_items = _list_sample_items(NEGATIVE_DIR, "negative")
-    return {
+    buckets = {"personal": PERSONAL_DIR, "negative": NEGATIVE_DIR}
+    if bucket is not None and bucket not in buckets:
+        raise KeyError("Unknown sample bucket.")
+    if cursor and bucket is None:
+        raise ValueError("A pagination cursor requires a sample bucket.")
+    payload: Dict[str, Any] = {
         "ok": True,
-        "personal": personal_items,
-        "negative": negative_items,
-        "personal_count": len(personal_items),
-        "negative_count": len(negative_items),
+        "personal": [],
+        "negative": [],
+        "personal_count": len(takes),
+        "negative_count": _audio_bucket_count(NEGATIVE_DIR),
         "takes_received": len(takes),
+        "matched_counts": {},
+        "next_cursors": {},
     }
+    for name, directory in buckets.items():
+        if bucket is not None and name != bucket:
+            continue
+        total = payload[f"{name}_count"]
+        payload["matched_counts"][name] = _indexed_audio_count(directory, filters) if filters else total
+        if count_only:
+            continue
+        directory.mkdir(parents=True, exist_ok=True)
+        rows, next_cursor = _paged_audio_rows(directory, order="samples", filters=filters, cursor=cursor, limit=limit)
+        payload[name] = _sample_items_from_rows(rows, directory, name)
+        payload["next_cursors"][name] = next_cursor
+    if count_only:
+        for name in buckets:
+            payload.pop(name)
+        payload.pop("next_cursors")
+    return payload
 
 
-def _move_captured_audio(file_name: str, target_dir: Path, *, target_prefix: str, review_status: str) -> Dict[str, Any]:
+def _move_captured_audio(
+    file_name: str,
+    target_dir: Path,
+    *,
+    target_prefix: str,
+    review_status: str,
+    metadata_updates: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
     with SAMPLES_LOCK:
         src_path = _resolve_audio_path(CAPTURED_DIR, file_name)
         metadata = _load_sidecar_json(src_path)
+        metadata.update(metadata_updates or {})
         original_name = str(metadata.get("original_name") or src_path.name)
         if target_prefix == "sample":
             target_name = _next_personal_sample_name(original_name)
@@ -2770,23 +5502,92 @@ def _move_captured_audio(file_name: str, target_dir: Path, *, target_prefix: str
         stale_sidecar = _audio_sidecar_path(src_path)
         if stale_sidecar.exists():
             stale_sidecar.unlink()
+        _forget_indexed_audio(src_path)
+        _move_capture_client_ids(src_path, dst_path)
 
-    takes = _sync_personal_samples_state()
+    with STATE_LOCK:
+        if target_prefix == "sample" and target_name not in STATE["takes"]:
+            bisect.insort(STATE["takes"], target_name)
+    takes_received = _audio_bucket_count(PERSONAL_DIR)
+    with STATE_LOCK:
+        STATE["takes_received"] = takes_received
     return {
         "saved_as": target_name,
-        "captured_remaining": len(_list_captured_sample_names()),
-        "negative_count": len(_list_negative_samples()),
-        "takes_received": len(takes),
+        "captured_remaining": _audio_bucket_count(CAPTURED_DIR),
+        "negative_count": _audio_bucket_count(NEGATIVE_DIR),
+        "takes_received": takes_received,
     }
 
 
-def _append_train_log(line: str):
+def _append_train_log(line: str, *, notify: bool = True):
     line = (line or "").rstrip("\n")
-    with STATE_LOCK:
-        buf: List[str] = STATE["training"]["log_lines"]
-        buf.append(line)
-        if len(buf) > 250:
-            del buf[: (len(buf) - 250)]
+    with TRAIN_LOG_RING_LOCK:
+        TRAIN_LOG_RING.append(line)
+    if notify:
+        _notify_train_log_subscribers()
+
+
+def _train_log_snapshot() -> List[str]:
+    with TRAIN_LOG_RING_LOCK:
+        return list(TRAIN_LOG_RING)
+
+
+def _reset_train_log_ring() -> None:
+    with TRAIN_LOG_RING_LOCK:
+        TRAIN_LOG_RING.clear()
+
+
+@contextlib.contextmanager
+def _open_train_log_writer(log_path: Path):
+    """Yield a writer that appends subprocess output to the training log.
+
+    Lines reach the in-memory ring immediately, but the file is only flushed
+    every TRAIN_LOG_FLUSH_SECONDS (and on exit).  Log streams are woken after
+    each flush, once the new bytes are readable at their offsets.
+    """
+    write_lock = threading.Lock()
+    stop = threading.Event()
+    pending = False
+
+    with open(log_path, "a", encoding="utf-8", buffering=TRAIN_LOG_WRITE_BUFFER) as lf:
+
+        def flush() -> None:
+            nonlocal pending
+            with write_lock:
+                if not pending:
+                    return
+                lf.flush()
+                pending = False
+            _notify_train_log_subscribers()
+
+        def write(line: str) -> None:
+            nonlocal pending
+            with write_lock:
+                lf.write(line)
+                pending = True
+            _append_train_log(line, notify=False)
+
+        def flush_periodically() -> None:
+            while not stop.wait(TRAIN_LOG_FLUSH_SECONDS):
+                flush()
+
+        flusher = threading.Thread(target=flush_periodically, name="train-log-flush", daemon=True)
+        flusher.start()
+        try:
+            yield write
+        finally:
+            stop.set()
+            flusher.join()
+            flush()
+
+
+def _notify_train_log_subscribers() -> None:
+    """Wake every open log stream; each one reads the new bytes from its own offset."""
+    with TRAIN_LOG_SUBSCRIBERS_LOCK:
+        subscribers = list(TRAIN_LOG_SUBSCRIBERS)
+    for loop, event in subscribers:
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(event.set)
 
 
 def _clear_training_log():
@@ -2801,9 +5602,11 @@ def _clear_training_log():
 
     with STATE_LOCK:
         STATE["training"]["log_path"] = str(log_path)
-        STATE["training"]["log_lines"] = []
+        STATE["training"]["log_id"] = secrets.token_hex(6)
         STATE["training"]["last_sent_tail"] = []
         STATE["training"]["last_log_size"] = 0
+    _reset_train_log_ring()
+    _notify_train_log_subscribers()
 
 
 def _title_from_phrase(raw_phrase: str) -> str:
@@ -2830,8 +5633,8 @@ def _run_streamed(
         if header:
             lf.write(header + "\n")
         lf.write("→ " + " ".join(cmd) + "\n")
-        lf.flush()
 
+    with _open_train_log_writer(log_path) as write_log:
         proc = subprocess.Popen(
             cmd,
             cwd=str(cwd),
@@ -2849,9 +5652,7 @@ def _run_streamed(
         try:
             assert proc.stdout is not None
             for line in proc.stdout:
-                lf.write(line)
-                lf.flush()
-                _append_train_log(line)
+                write_log(line)
             return proc.wait()
         finally:
             with contextlib.suppress(Exception):
@@ -2936,6 +5737,68 @@ def _read_tail_lines(log_path: Path, max_lines: int) -> List[str]:
         return []
 
 
+def _read_train_log_since(log_path: Path, offset: int | None) -> Tuple[List[str], int, bool]:
+    """Return complete log lines after a byte offset, the offset after them, and whether the cursor was reset.
+
+    A missing offset, or one that fell more than TRAIN_LOG_MAX_BYTES behind or
+    past the end of a truncated log, restarts from the last TRAIN_LOG_TAIL_LINES.
+    """
+    try:
+        size = log_path.stat().st_size
+    except OSError:
+        return [], 0, offset not in (None, 0)
+    window_start = max(0, size - TRAIN_LOG_MAX_BYTES)
+    reset = offset is None or offset < window_start or offset > size
+    start = window_start if reset else int(offset)
+    try:
+        with open(log_path, "rb") as f:
+            f.seek(start)
+            data = f.read(size - start)
+    except OSError:
+        return [], start, reset
+    if reset and start > 0:
+        # Resume from the first full line inside the tail window.
+        newline = data.find(b"\n")
+        data = data[newline + 1:] if newline >= 0 else b""
+        start = size - len(data)
+    end = data.rfind(b"\n") + 1
+    lines = data[:end].decode("utf-8", errors="replace").splitlines()
+    if reset and len(lines) > TRAIN_LOG_TAIL_LINES:
+        lines = lines[-TRAIN_LOG_TAIL_LINES:]
+    return lines, start + end, reset
+
+
+def _train_log_cursor(offset: Any, log_id: Any) -> int | None:
+    """Parse a client's byte offset; a cursor from another log generation starts over."""
+    with STATE_LOCK:
+        current_id = STATE["training"].get("log_id")
+    parsed = _parse_int(offset)
+    if parsed is None or parsed < 0 or (log_id and str(log_id) != current_id):
+        return None
+    return parsed
+
+
+def _train_log_chunk(offset: int | None) -> Dict[str, Any]:
+    with STATE_LOCK:
+        log_path_str = STATE["training"].get("log_path")
+        log_id = STATE["training"].get("log_id")
+        running = bool(STATE["training"].get("running"))
+        exit_code = STATE["training"].get("exit_code")
+    lines: List[str] = []
+    next_offset = 0
+    reset = offset is None
+    if log_path_str:
+        lines, next_offset, reset = _read_train_log_since(Path(log_path_str), offset)
+    return {
+        "lines": lines,
+        "log_offset": next_offset,
+        "log_id": log_id,
+        "log_reset": reset,
+        "running": running,
+        "exit_code": exit_code,
+    }
+
+
 def _compute_new_lines(prev_tail: List[str], new_tail: List[str]) -> List[str]:
     if not prev_tail:
         return new_tail
@@ -3019,7 +5882,7 @@ def _normalize_output_artifacts(safe_word: str, log_path: Path) -> None:
     else:
         _append_train_log("⚠️ No .json found to patch (model renamed only)")
 
-    _sync_trained_wake_word_artifacts()
+    _trained_wake_word_index(force=True)
     _append_train_log(f"✅ Trained wake words synced to {TRAINED_WAKE_WORDS_DIR}")
 
 
@@ -3139,12 +6002,12 @@ def _run_training_background(
             # rejected there and by _start_training_thread's runtime lock.
             STATE["training"]["running"] = True
         STATE["training"]["exit_code"] = None
-        STATE["training"]["log_lines"] = []
         STATE["training"]["safe_word"] = safe_word
         STATE["training"]["last_sent_tail"] = []
         STATE["training"]["last_log_size"] = 0
         log_path = Path(str(DATA_DIR / "recorder_training.log"))
         STATE["training"]["log_path"] = str(log_path)
+    _reset_train_log_ring()
 
     _append_train_log("================================================================================")
     _append_train_log("===== Nvidia Docker Training Run =====")
@@ -3155,7 +6018,6 @@ def _run_training_background(
             lf.write("\n" + ("=" * 80) + "\n")
             lf.write("===== Nvidia Docker Training Run =====\n")
             lf.write(("=" * 80) + "\n")
-            lf.flush()
     except Exception:
         pass
 
@@ -3181,7 +6043,7 @@ def _run_training_background(
         _append_train_log("===== Training (train_wake_word) =====")
         _append_train_log(f"→ Running: {cmd_str}")
 
-        with open(log_path, "a", encoding="utf-8") as lf:
+        with _open_train_log_writer(log_path) as write_log:
             proc = subprocess.Popen(
                 ["bash", "-lc", cmd_str],
                 cwd=str(DATA_DIR),
@@ -3200,9 +6062,7 @@ def _run_training_background(
             assert proc.stdout is not None
             try:
                 for line in proc.stdout:
-                    lf.write(line)
-                    lf.flush()
-                    _append_train_log(line)
+                    write_log(line)
             finally:
                 with contextlib.suppress(Exception):
                     proc.stdout.close()
@@ -3264,9 +6124,69 @@ def _run_training_background(
     TRAINING_STOP_EVENT.clear()
 
 
+def _apply_sample_trim(
+    directory: Path,
+    bucket: str,
+    data: bytes,
+    *,
+    original_name: str,
+    source_file: str,
+    start_time: str | None,
+    end_time: str | None,
+):
+    info = _inspect_wav_bytes(data)
+    if not info:
+        try:
+            data = _normalize_audio_to_target_wav(data, original_name)
+        except Exception as e:
+            return JSONResponse({"ok": False, "error": f"Audio normalization failed: {e}"}, status_code=400)
+    elif not _is_target_wav(info):
+        try:
+            data = _normalize_audio_to_target_wav(data, original_name)
+        except Exception as e:
+            return JSONResponse({"ok": False, "error": f"Audio normalization failed: {e}"}, status_code=400)
+
+    try:
+        orig_path = _resolve_audio_path(directory, source_file)
+    except FileNotFoundError as e:
+        return JSONResponse({"ok": False, "error": str(e)}, status_code=404)
+
+    TRIM_HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    backup_name = f"{ts}_{source_file}"
+    backup_path = TRIM_HISTORY_DIR / backup_name
+    shutil.copy2(orig_path, backup_path)
+
+    orig_sidecar = _audio_sidecar_path(orig_path)
+    if orig_sidecar.exists():
+        shutil.copy2(orig_sidecar, _audio_sidecar_path(backup_path))
+
+    orig_path.write_bytes(data)
+
+    old_sidecar = _load_sidecar_json(orig_path)
+    sidecar = {
+        **old_sidecar,
+        "trimmed": True,
+        "source_file": source_file,
+        "source_bucket": bucket,
+        "trim_start_s": float(start_time) if start_time else None,
+        "trim_end_s": float(end_time) if end_time else None,
+        "undo_backup_file": backup_name,
+    }
+    _write_sidecar_json(orig_path, sidecar)
+
+    updated_item = _sample_item_from_path(orig_path, bucket)
+    updated_item["trimmed"] = True
+    updated_item["source_file"] = source_file
+    return {"ok": True, "updated_sample": updated_item, "message": f"Trimmed {source_file}"}
+
+
 # -------------------- Routes --------------------
 @app.on_event("startup")
 def start_auto_train_worker_event():
+    _reconcile_audio_indexes()
+    _start_capture_gain_migration()
+    _start_managed_usage_worker()
     _start_auto_train_worker()
 
 
@@ -3274,6 +6194,7 @@ def start_auto_train_worker_event():
 def stop_auto_train_worker_event():
     _stop_auto_train_worker()
     _stop_current_training(timeout=20.0)
+    _flush_auto_train_state()
 
 
 @app.get("/api/auto_train")
@@ -3317,6 +6238,12 @@ def update_auto_train(payload: Dict[str, Any] = None):
             _schedule_next_auto_run_locked()
     if previous.get("stt_engine") != normalized.get("stt_engine"):
         _clear_stt_model_caches(keep_engine=normalized["stt_engine"])
+    if normalized["enabled"] and (
+        not previous.get("enabled")
+        or previous.get("stt_engine") != normalized.get("stt_engine")
+        or previous.get("language") != normalized.get("language")
+    ):
+        _start_stt_model_preload()
     if normalized["enabled"]:
         queued = _queue_pending_auto_reviews()
         AUTO_TRAIN_WAKE_EVENT.set()
@@ -3469,6 +6396,7 @@ def stop_session():
         training = dict(STATE["training"])
         language = _normalize_language(STATE["language"])
         tts_mode = normalize_tts_mode(STATE.get("tts_mode"))
+    training["log_lines"] = _train_log_snapshot()
     return {
         "ok": True,
         "session_stopped": had_session,
@@ -3503,7 +6431,7 @@ def get_session():
             "takes_per_speaker": STATE["takes_per_speaker"],
             "takes_received": len(takes),
             "takes": list(takes),
-            "training": dict(STATE["training"]),
+            "training": {**STATE["training"], "log_lines": _train_log_snapshot()},
             "available_languages": available_languages,
         }
 
@@ -3532,11 +6460,11 @@ async def upload_take(
 
     data = await file.read()
     try:
-        result = _save_personal_sample(data, file.filename or out_name, out_name=out_name)
+        result = await _run_upload_work(_save_personal_sample, data, file.filename or out_name, out_name=out_name)
     except Exception as e:
         return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
 
-    takes = _sync_personal_samples_state()
+    takes = await _run_upload_work(_sync_personal_samples_state)
     return {"ok": True, **result, "takes_received": len(takes)}
 
 
@@ -3550,11 +6478,11 @@ async def upload_personal_sample(file: UploadFile = File(...)):
 
     data = await file.read()
     try:
-        result = _save_personal_sample(data, file.filename or "sample")
+        result = await _run_upload_work(_save_personal_sample, data, file.filename or "sample")
     except Exception as e:
         return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
 
-    takes = _sync_personal_samples_state()
+    takes = await _run_upload_work(_sync_personal_samples_state)
     return {"ok": True, **result, "takes_received": len(takes)}
 
 
@@ -3572,11 +6500,6 @@ async def upload_captured_audio(
     metadata_json: str | None = Form(None),
 ):
     data = await file.read()
-    try:
-        result = _save_captured_sample(data, file.filename or "captured")
-    except Exception as e:
-        return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
-
     extra_meta: Dict[str, Any] = {}
     if metadata_json:
         try:
@@ -3586,59 +6509,38 @@ async def upload_captured_audio(
         except Exception:
             return JSONResponse({"ok": False, "error": "metadata_json must be a JSON object"}, status_code=400)
 
-    with STATE_LOCK:
-        current_safe_word = STATE.get("safe_word")
+    metadata = dict(extra_meta)
+    for key, value in (
+        ("source_device", source_device),
+        ("wake_word", wake_word),
+        ("event_type", event_type),
+        ("captured_at", captured_at),
+        ("notes", notes),
+    ):
+        if value:
+            metadata[key] = value
+    for key, value in (
+        ("blocked_by_vad", blocked_by_vad),
+        ("max_probability", max_probability),
+        ("average_probability", average_probability),
+    ):
+        if value is not None:
+            metadata[key] = value
 
-    audio_path = CAPTURED_DIR / result["saved_as"]
-    sidecar = {
-        **extra_meta,
-        "saved_as": result["saved_as"],
-        "original_name": result["original_name"],
-        "source_device": source_device or extra_meta.get("source_device") or "",
-        "wake_word": wake_word or extra_meta.get("wake_word") or current_safe_word or "",
-        "event_type": (event_type or extra_meta.get("event_type") or "captured").strip() or "captured",
-        "capture_label": extra_meta.get("capture_label") or "",
-        "captured_at": captured_at or extra_meta.get("captured_at") or "",
-        "received_at": datetime.now(timezone.utc).isoformat(),
-        "blocked_by_vad": _parse_bool(extra_meta.get("blocked_by_vad") if blocked_by_vad is None else blocked_by_vad),
-        "max_probability": _parse_float(extra_meta.get("max_probability") if max_probability is None else max_probability),
-        "average_probability": _parse_float(
-            extra_meta.get("average_probability") if average_probability is None else average_probability
-        ),
-        "probability_cutoff": _parse_int(extra_meta.get("probability_cutoff")),
-        "peak_probability_cutoff": _parse_int(extra_meta.get("peak_probability_cutoff")),
-        "active_window_count": _parse_int(extra_meta.get("active_window_count")),
-        "min_active_windows": _parse_int(extra_meta.get("min_active_windows")),
-        "rise_score": _parse_int(extra_meta.get("rise_score")),
-        "vad_max_probability": _parse_int(extra_meta.get("vad_max_probability")),
-        "vad_average_probability": _parse_int(extra_meta.get("vad_average_probability")),
-        "detection_profile": str(extra_meta.get("detection_profile") or "").strip(),
-        "probability_history": _parse_probability_history(extra_meta.get("probability_history")),
-        "notes": notes or extra_meta.get("notes") or "",
-        "converted": result["converted"],
-        "detected_format": result["detected_format"],
-        "final_format": result["final_format"],
-        "postprocess": result["postprocess"],
-        "message": result["message"],
-        "review_status": "pending",
-    }
-    _write_sidecar_json(audio_path, sidecar)
-    with AUTO_TRAIN_LOCK:
-        auto_review_config = dict(AUTO_TRAIN_CONFIG)
-    if auto_review_config.get("enabled") and _captured_event_is_auto_reviewable(sidecar, auto_review_config):
-        _queue_auto_review(audio_path.name)
+    try:
+        audio_path = await _run_upload_work(_store_captured_upload, data, file.filename or "captured", metadata)
+    except Exception as e:
+        return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
 
-    return {
-        "ok": True,
-        "item": _captured_item_from_path(audio_path),
-        "captured_count": len(_list_captured_sample_names()),
-    }
+    return await _run_upload_work(_captured_upload_payload, audio_path)
 
 
 @app.post("/api/upload_captured_audio_raw")
 async def upload_captured_audio_raw(
     request: Request,
     x_audio_format: str | None = Header(default=None),
+    x_sample_rate: str | None = Header(default=None),
+    x_channels: str | None = Header(default=None),
     x_original_name: str | None = Header(default=None),
     x_source_device: str | None = Header(default=None),
     x_wake_word: str | None = Header(default=None),
@@ -3660,88 +6562,117 @@ async def upload_captured_audio_raw(
 ):
     raw_data = await request.body()
     audio_format = (x_audio_format or "wav").strip().lower()
+    metadata = {
+        "source_device": x_source_device,
+        "wake_word": x_wake_word,
+        "event_type": x_event_type,
+        "captured_at": x_captured_at,
+        "blocked_by_vad": x_blocked_by_vad,
+        "max_probability": x_max_probability,
+        "average_probability": x_average_probability,
+        "probability_cutoff": x_probability_cutoff,
+        "peak_probability_cutoff": x_peak_probability_cutoff,
+        "active_window_count": x_active_windows,
+        "min_active_windows": x_min_active_windows,
+        "rise_score": x_rise_score,
+        "vad_max_probability": x_vad_max_probability,
+        "vad_average_probability": x_vad_average_probability,
+        "detection_profile": x_detection_profile,
+        "probability_history": x_probability_history,
+        "notes": x_notes,
+    }
 
     try:
-        if audio_format == "pcm_s16le":
-            data = _pcm_s16le_to_wav_bytes(raw_data)
-            original_name = x_original_name or "captured.raw.wav"
-        elif audio_format in {"wav", "audio/wav", "audio/x-wav"}:
-            data = raw_data
-            original_name = x_original_name or "captured.wav"
-        else:
-            raise ValueError(f"Unsupported x-audio-format '{audio_format}'.")
-
-        result = _save_captured_sample(data, original_name)
+        data = _captured_upload_wav_bytes(raw_data, audio_format, sample_rate=x_sample_rate, channels=x_channels)
+        original_name = x_original_name or ("captured.raw.wav" if audio_format == "pcm_s16le" else "captured.wav")
+        audio_path = await _run_upload_work(_store_captured_upload, data, original_name, metadata)
     except Exception as e:
         return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
 
-    with STATE_LOCK:
-        current_safe_word = STATE.get("safe_word")
+    return await _run_upload_work(_captured_upload_payload, audio_path)
 
-    audio_path = CAPTURED_DIR / result["saved_as"]
-    sidecar = {
-        "saved_as": result["saved_as"],
-        "original_name": result["original_name"],
-        "source_device": x_source_device or "",
-        "wake_word": x_wake_word or current_safe_word or "",
-        "event_type": (x_event_type or "captured").strip() or "captured",
-        "capture_label": "",
-        "captured_at": x_captured_at or "",
-        "received_at": datetime.now(timezone.utc).isoformat(),
-        "blocked_by_vad": _parse_bool(x_blocked_by_vad),
-        "max_probability": _parse_float(x_max_probability),
-        "average_probability": _parse_float(x_average_probability),
-        "probability_cutoff": _parse_int(x_probability_cutoff),
-        "peak_probability_cutoff": _parse_int(x_peak_probability_cutoff),
-        "active_window_count": _parse_int(x_active_windows),
-        "min_active_windows": _parse_int(x_min_active_windows),
-        "rise_score": _parse_int(x_rise_score),
-        "vad_max_probability": _parse_int(x_vad_max_probability),
-        "vad_average_probability": _parse_int(x_vad_average_probability),
-        "detection_profile": (x_detection_profile or "").strip(),
-        "probability_history": _parse_probability_history(x_probability_history),
-        "notes": x_notes or "",
-        "converted": result["converted"],
-        "detected_format": result["detected_format"],
-        "final_format": result["final_format"],
-        "postprocess": result["postprocess"],
-        "message": result["message"],
-        "review_status": "pending",
-    }
-    _write_sidecar_json(audio_path, sidecar)
-    with AUTO_TRAIN_LOCK:
-        auto_review_config = dict(AUTO_TRAIN_CONFIG)
-    if auto_review_config.get("enabled") and _captured_event_is_auto_reviewable(sidecar, auto_review_config):
-        _queue_auto_review(audio_path.name)
 
+@app.post("/api/upload_captured_audio_batch")
+async def upload_captured_audio_batch(request: Request):
+    body = await request.body()
+    try:
+        acks = await _run_upload_work(_ingest_capture_batch, body)
+    except ValueError as e:
+        return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
     return {
-        "ok": True,
-        "item": _captured_item_from_path(audio_path),
-        "captured_count": len(_list_captured_sample_names()),
+        "ok": all(ack["ok"] for ack in acks),
+        "acks": acks,
+        "captured_count": await _run_upload_work(_audio_bucket_count, CAPTURED_DIR),
     }
 
 
 @app.get("/api/captured_audio")
-def captured_audio():
-    takes = _sync_personal_samples_state()
-    items = _list_captured_items()
-    samples = _samples_payload()
-    return {
-        "ok": True,
-        "items": items,
-        "captured_count": len(items),
-        "negative_count": samples["negative_count"],
-        "personal_count": len(takes),
-    }
+def captured_audio(
+    limit: str | None = None,
+    cursor: str | None = None,
+    event_type: str | None = None,
+    auto_review_status: str | None = None,
+    source_device: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    count_only: str | None = None,
+):
+    try:
+        filters = _audio_listing_filters(
+            event_type=event_type,
+            auto_review_status=auto_review_status,
+            source_device=source_device,
+            since=since,
+            until=until,
+        )
+        return _captured_audio_payload(
+            filters=filters,
+            cursor=cursor,
+            limit=_audio_page_limit(limit),
+            count_only=_parse_bool(count_only),
+        )
+    except ValueError as e:
+        return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
 
 
 @app.get("/api/samples")
-def samples():
-    return _samples_payload()
+def samples(
+    bucket: str | None = None,
+    limit: str | None = None,
+    cursor: str | None = None,
+    event_type: str | None = None,
+    auto_review_status: str | None = None,
+    source_device: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    count_only: str | None = None,
+):
+    try:
+        filters = _audio_listing_filters(
+            event_type=event_type,
+            auto_review_status=auto_review_status,
+            source_device=source_device,
+            since=since,
+            until=until,
+        )
+        return _samples_payload(
+            bucket=bucket or None,
+            filters=filters,
+            cursor=cursor,
+            limit=_audio_page_limit(limit),
+            count_only=_parse_bool(count_only),
+        )
+    except KeyError as e:
+        return JSONResponse({"ok": False, "error": str(e.args[0])}, status_code=404)
+    except ValueError as e:
+        return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
 
 
 @app.get("/api/data")
-def managed_data():
+def managed_data(refresh: bool = False):
+    _start_managed_usage_worker()
+    if refresh:
+        _request_managed_usage_refresh(force=True)
     return _managed_data_payload()
 
 
@@ -3758,7 +6689,7 @@ def delete_managed_data(item_id: str):
 
 
 @app.get("/api/audio/{bucket}/{file_name}")
-def audio_file(bucket: str, file_name: str):
+def audio_file(bucket: str, file_name: str, request: Request):
     bucket_map = {
         "captured": CAPTURED_DIR,
         "personal": PERSONAL_DIR,
@@ -3771,9 +6702,21 @@ def audio_file(bucket: str, file_name: str):
         path = _resolve_audio_path(directory, file_name)
     except FileNotFoundError as e:
         return JSONResponse({"ok": False, "error": str(e)}, status_code=404)
-    if bucket == "captured":
-        _ensure_captured_playback_ready(path, _load_sidecar_json(path))
-    return FileResponse(path, media_type="audio/wav", filename=path.name)
+    stat = path.stat()
+    etag = _stat_etag(stat)
+    if bucket == "captured" and not _capture_gain_is_current(_load_sidecar_json(path)):
+        # Legacy clips waiting for the background migration are boosted in memory, never rewritten here.
+        etag = etag[:-1] + '-boost"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _request_is_fresh(request, etag, stat.st_mtime):
+            return Response(status_code=304, headers=headers)
+        boosted, _ = _boost_captured_wav_bytes(path.read_bytes())
+        return Response(
+            boosted,
+            media_type="audio/wav",
+            headers={**headers, "Content-Disposition": f'attachment; filename="{path.name}"'},
+        )
+    return _validated_file_response(request, path, etag=etag, media_type="audio/wav", filename=path.name)
 
 
 @app.delete("/api/samples/{bucket}/{file_name}")
@@ -3853,51 +6796,16 @@ async def trim_sample_upload(
     if not data:
         return JSONResponse({"ok": False, "error": "Empty audio file."}, status_code=400)
 
-    info = _inspect_wav_bytes(data)
-    if not info:
-        try:
-            data = _normalize_audio_to_target_wav(data, file.filename or "trimmed.wav")
-        except Exception as e:
-            return JSONResponse({"ok": False, "error": f"Audio normalization failed: {e}"}, status_code=400)
-    elif not _is_target_wav(info):
-        try:
-            data = _normalize_audio_to_target_wav(data, file.filename or "trimmed.wav")
-        except Exception as e:
-            return JSONResponse({"ok": False, "error": f"Audio normalization failed: {e}"}, status_code=400)
-
-    try:
-        orig_path = _resolve_audio_path(directory, source_file)
-    except FileNotFoundError as e:
-        return JSONResponse({"ok": False, "error": str(e)}, status_code=404)
-
-    TRIM_HISTORY_DIR.mkdir(parents=True, exist_ok=True)
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
-    backup_name = f"{ts}_{source_file}"
-    backup_path = TRIM_HISTORY_DIR / backup_name
-    shutil.copy2(orig_path, backup_path)
-
-    orig_sidecar = _audio_sidecar_path(orig_path)
-    if orig_sidecar.exists():
-        shutil.copy2(orig_sidecar, _audio_sidecar_path(backup_path))
-
-    orig_path.write_bytes(data)
-
-    old_sidecar = _load_sidecar_json(orig_path)
-    sidecar = {
-        **old_sidecar,
-        "trimmed": True,
-        "source_file": source_file,
-        "source_bucket": bucket,
-        "trim_start_s": float(start_time) if start_time else None,
-        "trim_end_s": float(end_time) if end_time else None,
-        "undo_backup_file": backup_name,
-    }
-    _write_sidecar_json(orig_path, sidecar)
-
-    updated_item = _sample_item_from_path(orig_path, bucket)
-    updated_item["trimmed"] = True
-    updated_item["source_file"] = source_file
-    return {"ok": True, "updated_sample": updated_item, "message": f"Trimmed {source_file}"}
+    return await _run_upload_work(
+        _apply_sample_trim,
+        directory,
+        bucket,
+        data,
+        original_name=file.filename or "trimmed.wav",
+        source_file=source_file,
+        start_time=start_time,
+        end_time=end_time,
+    )
 
 
 @app.post("/api/samples/revert")
@@ -3932,6 +6840,7 @@ def revert_trim(
     backup_path.unlink()
     if backup_sidecar.exists():
         backup_sidecar.unlink()
+    _index_audio_path(file_path)
 
     updated_item = _sample_item_from_path(file_path, bucket)
     return {"ok": True, "updated_sample": updated_item, "message": f"Reverted {file_name}"}
@@ -3966,7 +6875,7 @@ def discard_captured_audio(file_name: str):
         _remove_audio_with_sidecar(path)
     except FileNotFoundError as e:
         return JSONResponse({"ok": False, "error": str(e)}, status_code=404)
-    return {"ok": True, "captured_count": len(_list_captured_sample_names())}
+    return {"ok": True, "captured_count": _audio_bucket_count(CAPTURED_DIR)}
 
 
 @app.get("/api/trained_wake_words/catalog")
@@ -3979,34 +6888,46 @@ def trained_wake_words_catalog(request: Request):
 
 
 @app.get("/api/trained_wake_words/{filename}")
-def trained_wake_word_artifact(filename: str):
+def trained_wake_word_artifact(filename: str, request: Request):
     safe_filename = Path(filename or "").name
     if not safe_filename or Path(safe_filename).suffix.lower() not in {".json", ".tflite"}:
         return JSONResponse({"ok": False, "error": "Unsupported wake word artifact."}, status_code=400)
-    _sync_trained_wake_word_artifacts()
+    index = _trained_wake_word_index()
     if safe_filename.endswith(ESPHOME_MANIFEST_SUFFIX):
         source_stem = safe_filename[: -len(ESPHOME_MANIFEST_SUFFIX)]
-        source_path = TRAINED_WAKE_WORDS_DIR / f"{source_stem}.json"
-        if not source_stem or not source_path.is_file():
+        package = index["packages"].get(f"{source_stem}.json")
+        if not source_stem or package is None:
             return JSONResponse({"ok": False, "error": "Wake word artifact not found."}, status_code=404)
-        try:
-            metadata = json.loads(source_path.read_text(encoding="utf-8"))
-        except Exception:
-            return JSONResponse({"ok": False, "error": "Wake word package is invalid."}, status_code=422)
+        metadata = package.get("metadata")
         if not isinstance(metadata, dict):
             return JSONResponse({"ok": False, "error": "Wake word package is invalid."}, status_code=422)
         model_name = Path(str(metadata.get("model") or f"{source_stem}.tflite")).name
-        if not (TRAINED_WAKE_WORDS_DIR / model_name).is_file():
+        if model_name not in index["files"]:
             return JSONResponse({"ok": False, "error": "Wake word model not found."}, status_code=404)
-        return JSONResponse(
-            _esphome_manifest(metadata),
-            headers={"Cache-Control": "no-store, max-age=0"},
-        )
-    artifact_path = TRAINED_WAKE_WORDS_DIR / safe_filename
-    if not artifact_path.exists() or not artifact_path.is_file():
+        # Satellites revalidate on every poll; the manifest body is tiny, so hash it directly.
+        response = JSONResponse(_esphome_manifest(metadata), headers={"Cache-Control": "no-cache"})
+        etag = f'"{hashlib.sha256(response.body).hexdigest()}"'
+        modified_at = (package.get("signature") or [0])[0] / 1e9
+        if _request_is_fresh(request, etag, modified_at):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        response.headers["ETag"] = etag
+        response.headers["Last-Modified"] = formatdate(modified_at, usegmt=True)
+        return response
+    artifact = index["files"].get(safe_filename)
+    if artifact is None:
         return JSONResponse({"ok": False, "error": "Wake word artifact not found."}, status_code=404)
+    artifact_path = TRAINED_WAKE_WORDS_DIR / safe_filename
     media_type = "application/json" if artifact_path.suffix.lower() == ".json" else "application/octet-stream"
-    return FileResponse(str(artifact_path), media_type=media_type, filename=artifact_path.name)
+    try:
+        return _validated_file_response(
+            request,
+            artifact_path,
+            etag=f'"{artifact["sha256"]}"',
+            media_type=media_type,
+            filename=artifact_path.name,
+        )
+    except FileNotFoundError:
+        return JSONResponse({"ok": False, "error": "Wake word artifact not found."}, status_code=404)
 
 
 @app.post("/api/train")
@@ -4067,7 +6988,20 @@ def train_now(payload: Dict[str, Any] = None):
 
 
 @app.get("/api/train_status")
-def train_status():
+def train_status(offset: str | None = None, log_id: str | None = None):
+    if offset is not None:
+        # Offset polling: each client keeps its own cursor, so tabs never steal each other's lines.
+        chunk = _train_log_chunk(_train_log_cursor(offset, log_id))
+        with STATE_LOCK:
+            tr = dict(STATE["training"])
+        for key in ("last_sent_tail", "last_log_size"):
+            tr.pop(key, None)
+        lines = chunk.pop("lines")
+        tr.update(chunk)
+        tr["log_text"] = "\n".join(lines)
+        tr["new_log_lines"] = lines
+        return {"ok": True, "training": tr}
+
     with STATE_LOCK:
         tr = dict(STATE["training"])
         log_path_str = tr.get("log_path")
@@ -4099,9 +7033,72 @@ def train_status():
     tr["log_text"] = "\n".join(new_lines)
     tr["log_tail_preview"] = "\n".join(full_tail)
     tr["log_lines"] = full_tail
+    tr["log_offset"] = size_now
     return {"ok": True, "training": tr}
 
 
+def _sse_event(event: str, payload: Dict[str, Any], event_id: str | None = None) -> str:
+    prefix = f"id: {event_id}\n" if event_id else ""
+    return f"{prefix}event: {event}\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n"
+
+
+@app.get("/api/train_log/stream")
+async def train_log_stream(
+    request: Request,
+    offset: str | None = None,
+    log_id: str | None = None,
+    last_event_id: str | None = Header(default=None),
+):
+    """Server-sent events carrying new training log lines as they are written.
+
+    Each event id is ``<log_id>:<offset>``, so a reconnecting EventSource resumes
+    from the exact byte it had reached.
+    """
+    if last_event_id and ":" in last_event_id:
+        log_id, offset = last_event_id.split(":", 1)
+    cursor = _train_log_cursor(offset, log_id)
+    loop = asyncio.get_running_loop()
+    wake = asyncio.Event()
+    subscriber = (loop, wake)
+
+    async def events():
+        nonlocal cursor
+        with TRAIN_LOG_SUBSCRIBERS_LOCK:
+            TRAIN_LOG_SUBSCRIBERS.add(subscriber)
+        try:
+            status = None
+            idle = 0.0
+            while True:
+                wake.clear()
+                chunk = await asyncio.to_thread(_train_log_chunk, cursor)
+                cursor = chunk["log_offset"]
+                current_status = (chunk["running"], chunk["exit_code"])
+                if chunk["lines"] or chunk["log_reset"]:
+                    yield _sse_event("log", chunk, f"{chunk['log_id']}:{cursor}")
+                    idle = 0.0
+                elif current_status != status:
+                    yield _sse_event("status", {"running": chunk["running"], "exit_code": chunk["exit_code"]})
+                    idle = 0.0
+                elif idle >= TRAIN_LOG_STREAM_KEEPALIVE_SECONDS:
+                    yield ": keepalive\n\n"
+                    idle = 0.0
+                status = current_status
+                if await request.is_disconnected():
+                    break
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(wake.wait(), timeout=TRAIN_LOG_STREAM_STATUS_SECONDS)
+                idle += TRAIN_LOG_STREAM_STATUS_SECONDS
+        finally:
+            with TRAIN_LOG_SUBSCRIBERS_LOCK:
+                TRAIN_LOG_SUBSCRIBERS.discard(subscriber)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.post("/api/reset_recordings")
 def reset_recordings():
     _reset_personal_samples_dir()
@@ -4115,4 +7112,4 @@ def reset_negative_samples():
     with AUTO_TRAIN_LOCK:
         AUTO_TRAIN_STATE["pending_negative_count"] = 0
         _save_auto_train_state_locked()
-    return {"ok": True, "negative_count": len(_list_negative_samples())}
+    return {"ok": True, "negative_count": _audio_bucket_count(NEGATIVE_DIR)}